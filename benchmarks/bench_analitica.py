@@ -0,0 +1,51 @@
+# bench_analitica.py
+# Agregación de ingresos: registros por segundo, lotes codificados y coste de las consultas
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_analitica.py [registros]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.analitica import NANOSEGUNDOS, AgregadoLavados
+from src.lavadero import Lavadero
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    azar = random.Random(0)
+    codigos = azar.choices([0, 1, 2, 3, 6, 7], k=n)
+    # Un día de registros repartidos uniformemente
+    paso = 86_400 * NANOSEGUNDOS // n
+    registros = [(i * paso, Lavadero._PRECIOS_CENTIMOS[c], c) for i, c in enumerate(codigos)]
+
+    inicio = time.perf_counter()
+    agregado = AgregadoLavados().consumir(registros)
+    segundos = time.perf_counter() - inicio
+    print(f"consumir          {n / segundos:>12,.0f} registros/s")
+
+    lote = bytes(codigos)
+    inicio = time.perf_counter()
+    por_lotes = AgregadoLavados()
+    for hora in range(24):
+        trozo = lote[hora * n // 24:(hora + 1) * n // 24]
+        por_lotes.registrar_lote(trozo, hora * 3600 * NANOSEGUNDOS)
+    segundos = time.perf_counter() - inicio
+    print(f"registrar_lote    {n / segundos:>12,.0f} registros/s")
+    assert por_lotes.lavados == agregado.lavados
+
+    inicio = time.perf_counter()
+    for _ in range(1000):
+        agregado.totales()
+        agregado.por_ruta()
+        agregado.tasas_adjuncion()
+        agregado.tiempo_por_fase()
+        agregado.serie_temporal()
+    print(f"consultas del día {(time.perf_counter() - inicio) / 1000 * 1e6:>12,.1f} µs (independiente de {n:,} registros)")
+
+    inicio = time.perf_counter()
+    for _ in range(1000):
+        AgregadoLavados().fusionar(agregado)
+    print(f"fusionar          {(time.perf_counter() - inicio) / 1000 * 1e6:>12,.1f} µs por agregado")
@@ -0,0 +1,45 @@
+# bench_cobro_lote.py
+# Benchmark del cobro: hacer_lavado vehículo a vehículo frente a cobrar_lote
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_cobro_lote.py [vehiculos]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.lavadero import Lavadero
+
+
+def generar_lote(n, semilla=1234):
+    """Genera n vehículos con combinaciones válidas de opciones al azar."""
+    azar = random.Random(semilla)
+    combinaciones = list(Lavadero.RUTAS)
+    filas = [azar.choice(combinaciones) for _ in range(n)]
+    prelavado = bytes(p for p, _, _ in filas)
+    secado = bytes(s for _, s, _ in filas)
+    encerado = bytes(e for _, _, e in filas)
+    return prelavado, secado, encerado
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    prelavado, secado, encerado = generar_lote(n)
+
+    lavadero = Lavadero()
+    inicio = time.perf_counter()
+    for i in range(n):
+        lavadero.hacer_lavado(prelavado[i], secado[i], encerado[i])
+        lavadero.terminar()
+    t_bucle = time.perf_counter() - inicio
+
+    lote = Lavadero()
+    inicio = time.perf_counter()
+    lote.cobrar_lote(prelavado, secado, encerado)
+    t_lote = time.perf_counter() - inicio
+
+    print(f"Vehículos: {n}")
+    print(f"hacer_lavado en bucle: {t_bucle:8.3f} s  ({n / t_bucle:>12,.0f} vehículos/s)")
+    print(f"cobrar_lote:           {t_lote:8.3f} s  ({n / t_lote:>12,.0f} vehículos/s)")
+    print(f"Ingresos: {lavadero.ingresos:.2f} € (bucle) / {lote.ingresos:.2f} € (lote)")
@@ -0,0 +1,43 @@
+# bench_compacto.py
+# Memoria por instancia y tiempo de construcción: Lavadero frente a LavaderoCompacto
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_compacto.py [instancias]
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.lavadero import Lavadero
+from src.lavadero_compacto import LavaderoCompacto
+
+
+def medir(clase, n):
+    """
+    Construye n instancias con tracemalloc activo.
+    Devuelve (bytes por instancia, segundos de construcción sin tracemalloc).
+    """
+    tracemalloc.start()
+    antes, _ = tracemalloc.get_traced_memory()
+    instancias = [clase() for _ in range(n)]
+    despues, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instancias
+
+    inicio = time.perf_counter()
+    instancias = [clase() for _ in range(n)]
+    segundos = time.perf_counter() - inicio
+    del instancias
+
+    # Se descuenta la lista que guarda las referencias (8 bytes por puntero)
+    return (despues - antes) / n - 8, segundos
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Instancias: {n}")
+    for clase in (Lavadero, LavaderoCompacto):
+        bytes_instancia, segundos = medir(clase, n)
+        print(f"{clase.__name__:<18} {bytes_instancia:8.1f} B/instancia   "
+              f"construcción {segundos:6.3f} s ({n / segundos:>12,.0f} instancias/s)")
@@ -0,0 +1,58 @@
+# bench_concurrente.py
+# Coste de la seguridad entre hilos: Lavadero frente a LavaderoConcurrente
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_concurrente.py [lavados]
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.lavadero import Lavadero
+from src.lavadero_concurrente import LavaderoConcurrente
+
+HILOS = 32
+
+
+def un_hilo(clase, lavados):
+    """Lavados por segundo con un único hilo (coste del cerrojo sin contención)."""
+    lavadero = clase()
+    inicio = time.perf_counter()
+    for _ in range(lavados):
+        lavadero.hacer_lavado(True, False, False)
+        lavadero.terminar()
+    return lavados / (time.perf_counter() - inicio)
+
+
+def varios_hilos(clase, lavados):
+    """
+    Un túnel por hilo (sin competir por el mismo túnel) y 32 hilos a la vez.
+    Devuelve (lavados por segundo, céntimos esperados - céntimos contados).
+    """
+    lavaderos = [clase() for _ in range(HILOS)]
+    por_hilo = lavados // HILOS
+
+    def trabajador(lavadero):
+        for _ in range(por_hilo):
+            lavadero.hacer_lavado(True, False, False)
+            lavadero.terminar()
+
+    hilos = [threading.Thread(target=trabajador, args=(l,)) for l in lavaderos]
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    segundos = time.perf_counter() - inicio
+    perdidos = por_hilo * HILOS * 650 - sum(l.ingresos_centimos for l in lavaderos)
+    return por_hilo * HILOS / segundos, perdidos
+
+
+if __name__ == "__main__":
+    lavados = int(sys.argv[1]) if len(sys.argv) > 1 else 320_000
+    for clase in (Lavadero, LavaderoConcurrente):
+        solo = un_hilo(clase, lavados)
+        multi, perdidos = varios_hilos(clase, lavados)
+        print(f"{clase.__name__:<20} 1 hilo: {solo:>11,.0f} lavados/s   "
+              f"{HILOS} hilos: {multi:>11,.0f} lavados/s   céntimos perdidos: {perdidos}")
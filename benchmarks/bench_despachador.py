@@ -0,0 +1,99 @@
+# bench_despachador.py
+# Reparto de llegadas entre 1.000 túneles: despachador frente a probar hacer_lavado túnel a túnel
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_despachador.py [llegadas] [tuneles]
+
+import heapq
+import os
+import random
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.despachador import Despachador, PoliticaAfinidad, PoliticaMenorRestante, PoliticaMenosCargado
+from src.lavadero import Lavadero
+
+OPCIONES = [(bool(c & 1), bool(c & 2), bool(c & 4)) for c in range(8)]
+CODIGOS = [0, 1, 2, 3, 6, 7]
+
+
+def llegadas(n, tuneles, semilla=0):
+    """(instante, código) de n llegadas con una carga del 95 % de la capacidad de los túneles."""
+    azar = random.Random(semilla)
+    duracion_media = sum(len(Lavadero._RUTAS[c]) - 2 for c in CODIGOS) / len(CODIGOS)
+    intervalo = duracion_media / (0.95 * tuneles)
+    ahora = 0.0
+    for inicio in range(0, n, 100_000):
+        for codigo in azar.choices(CODIGOS, k=min(100_000, n - inicio)):
+            ahora += azar.expovariate(1.0) * intervalo
+            yield ahora, codigo
+
+
+def con_despachador(n, tuneles, politica):
+    """Devuelve (segundos, espera media en fases de los coches que llegaron sin túnel libre)."""
+    despachador = Despachador([Lavadero() for _ in range(tuneles)], politica=politica)
+    # Todos los túneles son estándar: un avance por fase, sin contar INACTIVO
+    duracion = [None if codigo in (4, 5) else len(Lavadero.ruta_para(OPCIONES[codigo])) - 2 for codigo in range(8)]
+    en_curso = []
+    llegadas_en_cola = [deque() for _ in range(tuneles)]
+    espera = 0.0
+    empujar, sacar = heapq.heappush, heapq.heappop
+    inicio = time.perf_counter()
+    for ahora, codigo in llegadas(n, tuneles):
+        while en_curso and en_curso[0][0] <= ahora:
+            fin, idx = sacar(en_curso)
+            siguiente = despachador.liberar(idx, fin)
+            if siguiente is not None:
+                espera += fin - llegadas_en_cola[idx].popleft()
+                empujar(en_curso, (fin + duracion[siguiente], idx))
+        idx = despachador.asignar(*OPCIONES[codigo], ahora=ahora)
+        if despachador.cargas[idx] == 1:
+            empujar(en_curso, (ahora + duracion[codigo], idx))
+        else:
+            llegadas_en_cola[idx].append(ahora)
+    segundos = time.perf_counter() - inicio
+    return segundos, despachador.encolados, espera / despachador.encolados if despachador.encolados else 0.0
+
+
+def probando_tuneles(n, tuneles):
+    """Lo de antes: probar hacer_lavado en cada túnel hasta que uno no lance ValueError."""
+    lavaderos = [Lavadero() for _ in range(tuneles)]
+    duracion = [len(ruta) - 2 if ruta else None for ruta in Lavadero._RUTAS]
+    en_curso, cola = [], []
+    inicio = time.perf_counter()
+    for ahora, codigo in llegadas(n, tuneles):
+        while en_curso and en_curso[0][0] <= ahora:
+            fin, idx = heapq.heappop(en_curso)
+            lavaderos[idx].terminar()
+            if cola:
+                siguiente = cola.pop(0)
+                lavaderos[idx].hacer_lavado(*OPCIONES[siguiente])
+                heapq.heappush(en_curso, (fin + duracion[siguiente], idx))
+        for idx, lavadero in enumerate(lavaderos):
+            try:
+                lavadero.hacer_lavado(*OPCIONES[codigo])
+            except ValueError:
+                continue
+            heapq.heappush(en_curso, (ahora + duracion[codigo], idx))
+            break
+        else:
+            cola.append(codigo)
+    return time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    tuneles = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    print(f"{n:,} llegadas, {tuneles:,} túneles")
+
+    muestra = min(n, 20_000)
+    segundos = probando_tuneles(muestra, tuneles)
+    print(f"{'probando túnel a túnel':<24} {muestra / segundos:>12,.0f} llegadas/s  (muestra de {muestra:,})")
+
+    for nombre, politica in (("menos cargado", PoliticaMenosCargado()),
+                             ("menor restante", PoliticaMenorRestante()),
+                             ("afinidad (25 % a mano)", PoliticaAfinidad(range(0, tuneles, 4)))):
+        segundos, encolados, espera = con_despachador(n, tuneles, politica)
+        print(f"{nombre:<24} {n / segundos:>12,.0f} llegadas/s  ({segundos:.1f} s; {encolados:,} esperaron,"
+              f" {espera:.2f} fases de media)")
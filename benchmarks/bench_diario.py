@@ -0,0 +1,52 @@
+# bench_diario.py
+# Benchmark del diario binario: escrituras por segundo y reproducción con mmap
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_diario.py [registros] [fichero]
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.diario import DiarioEscritor, reproducir_diario
+from src.lavadero import Lavadero
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    ruta = sys.argv[2] if len(sys.argv) > 2 else os.path.join(tempfile.gettempdir(), "bench.diario")
+    if os.path.exists(ruta):
+        os.remove(ruta)
+
+    # Escritura directa en el diario (sin Lavadero)
+    precios = Lavadero._PRECIOS_CENTIMOS
+    inicio = time.perf_counter()
+    with DiarioEscritor(ruta) as diario:
+        registrar = diario.registrar
+        for i in range(n):
+            codigo = i & 3
+            registrar(codigo, precios[codigo])
+    t_escritura = time.perf_counter() - inicio
+
+    # Lavados completos con el diario conectado
+    lavados = n // 10
+    ruta_lavadero = ruta + ".lavadero"
+    inicio = time.perf_counter()
+    with DiarioEscritor(ruta_lavadero) as diario:
+        lavadero = Lavadero(diario=diario)
+        for _ in range(lavados):
+            lavadero.hacer_lavado(True, True, False)
+            lavadero.terminar()
+    t_lavadero = time.perf_counter() - inicio
+    os.remove(ruta_lavadero)
+
+    inicio = time.perf_counter()
+    resumen = reproducir_diario(ruta)
+    t_lectura = time.perf_counter() - inicio
+
+    print(f"Registros: {n:,} ({os.path.getsize(ruta) / 1e6:,.0f} MB)")
+    print(f"Escritura directa:      {n / t_escritura:>14,.0f} registros/s")
+    print(f"hacer_lavado + diario:  {lavados / t_lavadero:>14,.0f} lavados/s")
+    print(f"Reproducción (mmap):    {t_lectura:8.3f} s ({n / t_lectura:>14,.0f} registros/s)")
+    print(f"Ingresos reconstruidos: {resumen['ingresos_centimos'] / 100:,.2f} €")
+    os.remove(ruta)
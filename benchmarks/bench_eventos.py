@@ -0,0 +1,47 @@
+# bench_eventos.py
+# Coste del flujo de eventos: sin oyentes, con búfer circular, con callback por lotes y con NDJSON
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_eventos.py [ciclos]
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.eventos import BufferCircular, SumideroCallback, SumideroNDJSON
+from src.lavadero import Lavadero
+
+COMBINACIONES = list(Lavadero.RUTAS)
+
+
+def medir(oyente, ciclos):
+    """Ciclos completos paso a paso; devuelve (transiciones por segundo, segundos)."""
+    lavadero = Lavadero()
+    if oyente is not None:
+        lavadero.suscribir(oyente)
+    pasos = 0
+    inicio = time.perf_counter()
+    for i in range(ciclos):
+        lavadero.hacer_lavado(*COMBINACIONES[i % len(COMBINACIONES)])
+        while lavadero.ocupado:
+            lavadero.avanzarFase()
+            pasos += 1
+    segundos = time.perf_counter() - inicio
+    return pasos / segundos, segundos
+
+
+if __name__ == "__main__":
+    ciclos = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    ruta = os.path.join(tempfile.gettempdir(), "bench_eventos.ndjson")
+
+    base, _ = medir(None, ciclos)
+    print(f"{'Sin oyentes':<22} {base:>12,.0f} transiciones/s")
+    sumidero_ndjson = SumideroNDJSON(ruta)
+    for nombre, oyente in (("Búfer circular", BufferCircular()),
+                           ("Callback por lotes", SumideroCallback(lambda lote: None)),
+                           ("NDJSON por lotes", sumidero_ndjson)):
+        velocidad, _ = medir(oyente, ciclos)
+        print(f"{nombre:<22} {velocidad:>12,.0f} transiciones/s ({velocidad / base:5.0%} de la base)")
+    sumidero_ndjson.cerrar()
+    os.remove(ruta)
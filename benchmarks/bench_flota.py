@@ -0,0 +1,76 @@
+# bench_flota.py
+# Comparación de memoria y rendimiento: lista de N objetos Lavadero frente a FlotaLavaderos
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_flota.py [tuneles]
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.flota import FlotaLavaderos
+from src.lavadero import Lavadero
+
+COMBINACIONES = list(Lavadero.RUTAS)
+
+
+def medir_memoria(constructor):
+    """Devuelve (objeto, bytes reservados) al construir con tracemalloc activo."""
+    tracemalloc.start()
+    objeto = constructor()
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objeto, memoria
+
+
+def ciclo_lista(lavaderos):
+    """Un ciclo completo para todos los túneles de la lista. Devuelve los pasos dados."""
+    for i, lavadero in enumerate(lavaderos):
+        lavadero.hacer_lavado(*COMBINACIONES[i % len(COMBINACIONES)])
+    pasos = 0
+    ocupados = True
+    while ocupados:
+        ocupados = False
+        for lavadero in lavaderos:
+            if lavadero.ocupado:
+                lavadero.avanzarFase()
+                pasos += 1
+                ocupados = True
+    return pasos
+
+
+def ciclo_flota(flota):
+    """Un ciclo completo para todos los túneles de la flota. Devuelve los pasos dados."""
+    for i in range(len(flota)):
+        flota.hacer_lavado(i, *COMBINACIONES[i % len(COMBINACIONES)])
+    pasos = 0
+    ocupados = len(flota)
+    while ocupados:
+        pasos += ocupados
+        ocupados = flota.avanzar_todas()
+    return pasos
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+
+    lavaderos, mem_lista = medir_memoria(lambda: [Lavadero() for _ in range(n)])
+    flota, mem_flota = medir_memoria(lambda: FlotaLavaderos(n))
+
+    inicio = time.perf_counter()
+    pasos_lista = ciclo_lista(lavaderos)
+    t_lista = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    pasos_flota = ciclo_flota(flota)
+    t_flota = time.perf_counter() - inicio
+
+    assert pasos_lista == pasos_flota
+    assert sum(l.ingresos_centimos for l in lavaderos) == flota.ingresos_centimos
+
+    print(f"Túneles: {n}")
+    print(f"Memoria lista de Lavadero: {mem_lista:>12,} bytes ({mem_lista / n:7.1f} B/túnel)")
+    print(f"Memoria FlotaLavaderos:    {mem_flota:>12,} bytes ({mem_flota / n:7.1f} B/túnel)")
+    print(f"Ciclo completo lista:  {t_lista:8.4f} s ({pasos_lista / t_lista:>14,.0f} pasos/s)")
+    print(f"Ciclo completo flota:  {t_flota:8.4f} s ({pasos_flota / t_flota:>14,.0f} pasos/s)")
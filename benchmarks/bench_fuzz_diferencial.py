@@ -0,0 +1,25 @@
+# bench_fuzz_diferencial.py
+# Secuencias y pasos comparados por segundo en la comparación diferencial con la referencia
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_fuzz_diferencial.py [secuencias] [procesos]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.fuzz_diferencial import CANDIDATAS, buscar_divergencias
+
+
+if __name__ == "__main__":
+    secuencias = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    procesos = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    longitud = 40
+    for nombre in ("compacto", "concurrente", "flota"):
+        inicio = time.perf_counter()
+        resultado = buscar_divergencias(CANDIDATAS[nombre], secuencias=secuencias, longitud=longitud,
+                                        procesos=procesos)
+        segundos = time.perf_counter() - inicio
+        estado = "sin divergencias" if resultado["reproductor"] is None else "DIVERGE"
+        print(f"{nombre:<12} {secuencias / segundos:>10,.0f} secuencias/s  "
+              f"{secuencias * longitud / segundos:>12,.0f} pasos/s  ({estado})")
@@ -0,0 +1,68 @@
+# bench_ingesta.py
+# Rendimiento de la ingesta por bloques sobre un volcado sintético (por defecto 5 GB)
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_ingesta.py [gigabytes] [csv|ndjson] [directorio]
+
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from itertools import product
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.ingesta import ingerir
+
+
+def generar(ruta, formato, tamano_bytes, semilla=0):
+    """
+    Escribe un volcado sintético de al menos `tamano_bytes` bytes.
+    Se genera un bloque de ~1 MB de pedidos aleatorios y se repite.
+    """
+    azar = random.Random(semilla)
+    combinaciones = list(product((0, 1), repeat=3))
+    if formato == "csv":
+        filas = [f"{i},{p},{s},{e}\n" for i, (p, s, e) in
+                 enumerate(azar.choice(combinaciones) for _ in range(50_000))]
+        cabecera = "id,prelavado,secado,encerado\n"
+    else:
+        filas = [json.dumps({"id": i, "prelavado": bool(p), "secado": bool(s), "encerado": bool(e)}) + "\n"
+                 for i, (p, s, e) in enumerate(azar.choice(combinaciones) for _ in range(20_000))]
+        cabecera = ""
+    bloque = "".join(filas).encode()
+    with open(ruta, "wb") as fichero:
+        fichero.write(cabecera.encode())
+        escritos = 0
+        while escritos < tamano_bytes:
+            fichero.write(bloque)
+            escritos += len(bloque)
+
+
+if __name__ == "__main__":
+    gigabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    formato = sys.argv[2] if len(sys.argv) > 2 else "csv"
+    directorio = sys.argv[3] if len(sys.argv) > 3 else tempfile.gettempdir()
+    entrada = os.path.join(directorio, f"bench_ingesta.{formato}")
+    aceptados = os.path.join(directorio, f"bench_ingesta_ok.{formato}")
+    rechazados = os.path.join(directorio, f"bench_ingesta_ko.{formato}")
+
+    try:
+        generar(entrada, formato, int(gigabytes * 1024 ** 3))
+        megas = os.path.getsize(entrada) / 1024 ** 2
+        memoria_antes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        inicio = time.perf_counter()
+        resumen = ingerir(entrada, aceptados, rechazados, formato=formato)
+        segundos = time.perf_counter() - inicio
+        memoria_pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        print(f"Fichero:    {megas:,.0f} MB ({formato}), {resumen['filas']:,} pedidos")
+        print(f"Tiempo:     {segundos:.1f} s  →  {megas / segundos:,.1f} MB/s, {resumen['filas'] / segundos:,.0f} pedidos/s")
+        print(f"Aceptados:  {resumen['aceptadas']:,}   Rechazados: {sum(resumen['rechazadas'].values()):,}")
+        print(f"Ingresos:   {resumen['ingresos_centimos'] / 100:,.2f} €")
+        print(f"Memoria:    pico {memoria_pico / 1024:.0f} MB (antes de la ingesta {memoria_antes / 1024:.0f} MB)")
+    finally:
+        for ruta in (entrada, aceptados, rechazados):
+            if os.path.exists(ruta):
+                os.remove(ruta)
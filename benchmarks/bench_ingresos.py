@@ -0,0 +1,62 @@
+# bench_ingresos.py
+# Benchmark de la contabilidad de ingresos: acumulador float frente a céntimos enteros
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_ingresos.py [lavados]
+
+import os
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.lavadero import Lavadero
+
+
+class LavaderoFloat(Lavadero):
+    """
+    Contabilidad anterior: suma floats en euros con += en cada cobro.
+    Se mantiene solo para medir la deriva y comparar el rendimiento.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.ingresos_float = 0.0
+
+    def _cobrar(self):
+        coste_lavado = 5.00
+        if self.prelavado_a_mano:
+            coste_lavado += 1.50
+        if self.secado_a_mano:
+            coste_lavado += 1.00
+        if self.encerado:
+            coste_lavado += 1.20
+        self.ingresos_float += coste_lavado
+        return coste_lavado
+
+
+def medir(clase, lavados):
+    """Cobra `lavados` ciclos rotando opciones y devuelve (lavadero, segundos)."""
+    combinaciones = list(Lavadero.RUTAS)
+    lavadero = clase()
+    inicio = time.perf_counter()
+    for i in range(lavados):
+        lavadero.hacer_lavado(*combinaciones[i % len(combinaciones)])
+        lavadero.terminar()
+    return lavadero, time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    lavados = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    lav_float, t_float = medir(LavaderoFloat, lavados)
+    lav_cent, t_cent = medir(Lavadero, lavados)
+
+    exacto = lav_cent.ingresos_decimal
+    deriva = Decimal(repr(lav_float.ingresos_float)) - exacto
+
+    print(f"Lavados: {lavados}")
+    print(f"Ingresos exactos (céntimos): {exacto} €")
+    print(f"Ingresos float (+=):        {lav_float.ingresos_float!r} €  (deriva {deriva} €)")
+    print(f"Acumulador float:  {lavados / t_float:>12,.0f} lavados/s")
+    print(f"Acumulador entero: {lavados / t_cent:>12,.0f} lavados/s")
+    print(f"Coste relativo de los céntimos: {(t_cent / t_float - 1) * 100:+.1f}%")
@@ -0,0 +1,47 @@
+# bench_instantaneas.py
+# Benchmark de instantáneas: guardar y restaurar 100.000 túneles
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_instantaneas.py [tuneles]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.flota import FlotaLavaderos
+from src.lavadero import Lavadero
+
+COMBINACIONES = list(Lavadero.RUTAS)
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    # Túneles a mitad de ciclo con rutas distintas
+    lavaderos = [Lavadero() for _ in range(n)]
+    flota = FlotaLavaderos(n)
+    for i, lavadero in enumerate(lavaderos):
+        lavadero.hacer_lavado(*COMBINACIONES[i % len(COMBINACIONES)])
+        lavadero.avanzarFase()
+        flota.hacer_lavado(i, *COMBINACIONES[i % len(COMBINACIONES)])
+    flota.avanzar_todas()
+
+    datos, t_guardar = cronometrar(lambda: [l.instantanea() for l in lavaderos])
+    restaurados, t_restaurar = cronometrar(lambda: [Lavadero.restaurar(d) for d in datos])
+    assert all(a.instantanea() == b.instantanea() for a, b in zip(lavaderos, restaurados))
+
+    datos_flota, t_guardar_flota = cronometrar(flota.instantanea)
+    restaurada, t_restaurar_flota = cronometrar(lambda: FlotaLavaderos.restaurar(datos_flota))
+    assert restaurada.instantanea() == datos_flota
+
+    print(f"Túneles: {n}")
+    print(f"{n} x Lavadero:   guardar {t_guardar:7.3f} s   restaurar {t_restaurar:7.3f} s   "
+          f"({sum(map(len, datos)):,} bytes)")
+    print(f"FlotaLavaderos:  guardar {t_guardar_flota:7.3f} s   restaurar {t_restaurar_flota:7.3f} s   "
+          f"({len(datos_flota):,} bytes)")
@@ -0,0 +1,47 @@
+# bench_instrumentacion.py
+# Coste de la instrumentación: lavadero con la instrumentación desactivada y activada
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_instrumentacion.py [ciclos] [repeticiones]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.instrumentacion import Instrumentacion
+from src.lavadero import Lavadero
+
+COMBINACIONES = list(Lavadero.RUTAS)
+
+
+def medir(lavadero, ciclos):
+    """Ciclos completos paso a paso; devuelve los segundos empleados."""
+    inicio = time.perf_counter()
+    for i in range(ciclos):
+        lavadero.hacer_lavado(*COMBINACIONES[i % len(COMBINACIONES)])
+        while lavadero.ocupado:
+            lavadero.avanzarFase()
+    return time.perf_counter() - inicio
+
+
+def mejor(lavadero, ciclos, repeticiones):
+    return min(medir(lavadero, ciclos) for _ in range(repeticiones))
+
+
+if __name__ == "__main__":
+    ciclos = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+
+    metricas = Instrumentacion()
+    desactivado = Lavadero()
+    activado = metricas.instrumentar(Lavadero())
+
+    base = mejor(desactivado, ciclos, repeticiones)
+    con_medir = mejor(activado, ciclos, repeticiones)
+
+    print(f"{'Instrumentación desactivada':<28} {ciclos / base:>10,.0f} ciclos/s")
+    print(f"{'Instrumentación activada':<28} {ciclos / con_medir:>10,.0f} ciclos/s "
+          f"(sobrecoste {con_medir / base - 1:+.1%})")
+    latencias = metricas.como_dict()["latencias_ns"]
+    for operacion, datos in latencias.items():
+        print(f"  {operacion:<14} p50 {datos['p50']:>6} ns  p99 {datos['p99']:>6} ns")
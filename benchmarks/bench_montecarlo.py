@@ -0,0 +1,26 @@
+# bench_montecarlo.py
+# Escalado del ejecutor Monte Carlo con el número de procesos
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_montecarlo.py [escenarios]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.montecarlo import ejecutar_escenarios, generar_escenarios
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    escenarios = generar_escenarios(n, semilla=1, tuneles=(5, 10), horas=24 * 7)
+
+    procesos = 1
+    base = None
+    while procesos <= (os.cpu_count() or 1):
+        inicio = time.perf_counter()
+        ejecutar_escenarios(escenarios, procesos=procesos, semilla=1)
+        segundos = time.perf_counter() - inicio
+        base = base or segundos
+        print(f"{procesos:>3} procesos: {segundos:7.2f} s  aceleración {base / segundos:5.2f}x "
+              f"(eficiencia {base / segundos / procesos:5.0%})")
+        procesos *= 2
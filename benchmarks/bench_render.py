@@ -0,0 +1,104 @@
+# bench_render.py
+# Refresco de un panel de estado: siete print por túnel frente a render_estado y RenderFlota
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_render.py [tuneles]
+
+import io
+import os
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.flota import FlotaLavaderos
+from src.lavadero import Lavadero
+from src.render import RenderFlota, render_estado
+
+COMBINACIONES = list(Lavadero.RUTAS)
+
+
+def imprimir_estado_con_prints(lavadero):
+    """imprimir_estado tal como era antes: un dict de etiquetas nuevo y siete print por llamada."""
+    fases_map = {
+        0: "0 - Inactivo", 1: "1 - Cobrando", 2: "2 - Haciendo prelavado a mano",
+        3: "3 - Echándole agua", 4: "4 - Enjabonando", 5: "5 - Pasando rodillos",
+        6: "6 - Haciendo secado automático", 7: "7 - Haciendo secado a mano", 8: "8 - Encerando a mano",
+    }
+    print("----------------------------------------")
+    print(f"Ingresos Acumulados: {lavadero.ingresos:.2f} €")
+    print(f"Ocupado: {lavadero.ocupado}")
+    print(f"Prelavado a mano: {lavadero.prelavado_a_mano}")
+    print(f"Secado a mano: {lavadero.secado_a_mano}")
+    print(f"Encerado: {lavadero.encerado}")
+    print("Fase: ", end="")
+    print(fases_map.get(lavadero.fase, f"{lavadero.fase} - En estado no válido"), end="")
+    print("\n----------------------------------------")
+
+
+def preparar(n, semilla=0):
+    """Una flota con cada túnel en una fase al azar."""
+    azar = random.Random(semilla)
+    flota = FlotaLavaderos(n)
+    for idx in range(n):
+        if azar.random() < 0.9:
+            opciones = azar.choice(COMBINACIONES)
+            flota.hacer_lavado(idx, *opciones)
+            for _ in range(azar.randrange(len(Lavadero.RUTAS[opciones]) - 1)):
+                flota.avanzar_fase(idx)
+    return flota
+
+
+def medir(funcion, repeticiones=3):
+    """Mejor tiempo de varias repeticiones y el resultado de la última."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def con_prints(tuneles):
+    salida = io.StringIO()
+    with redirect_stdout(salida):
+        for tunel in tuneles:
+            imprimir_estado_con_prints(tunel)
+    return salida.getvalue()
+
+
+def con_render_estado(tuneles):
+    salida = io.StringIO()
+    salida.write("".join([render_estado(tunel) for tunel in tuneles]))
+    return salida.getvalue()
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    flota = preparar(n)
+    tuneles = list(flota)
+
+    t_prints, texto_prints = medir(lambda: con_prints(tuneles))
+    t_render, texto_render = medir(lambda: con_render_estado(tuneles))
+    assert texto_prints == texto_render
+
+    render = RenderFlota(flota)
+    t_primera, _ = medir(lambda: RenderFlota(flota).render(), 1)
+    render.render()
+    t_completa, _ = medir(render.render)
+
+    # Un refresco típico: avanza el 1 % de los túneles
+    azar = random.Random(1)
+    def refresco():
+        for idx in azar.sample(range(n), max(n // 100, 1)):
+            if flota._ocupados[idx]:
+                flota.avanzar_fase(idx)
+        return render.render(solo_cambios=True)
+    t_cambios, _ = medir(refresco)
+
+    print(f"Túneles: {n}")
+    print(f"imprimir_estado con siete print:  {t_prints * 1e3:10.2f} ms")
+    print(f"render_estado por túnel:          {t_render * 1e3:10.2f} ms  (x{t_prints / t_render:.1f})")
+    print(f"RenderFlota, primera tabla:       {t_primera * 1e3:10.2f} ms  (x{t_prints / t_primera:.1f})")
+    print(f"RenderFlota, tabla completa:      {t_completa * 1e3:10.2f} ms  (x{t_prints / t_completa:.1f})")
+    print(f"RenderFlota, solo cambios (1 %):  {t_cambios * 1e3:10.2f} ms  (x{t_prints / t_cambios:.1f})")
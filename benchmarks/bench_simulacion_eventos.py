@@ -0,0 +1,28 @@
+# bench_simulacion_eventos.py
+# Benchmark del simulador de eventos discretos: un año de tráfico en un centro de 50 túneles
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_simulacion_eventos.py [horas] [tuneles]
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.simulacion_eventos import SimuladorEventos
+
+if __name__ == "__main__":
+    horas = float(sys.argv[1]) if len(sys.argv) > 1 else 24 * 365
+    tuneles = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    # Unos 5,6 coches/hora por túnel: alrededor del 75% de ocupación con la mezcla uniforme
+    llegadas_por_hora = 5.6 * tuneles
+
+    inicio = time.perf_counter()
+    informe = SimuladorEventos(tuneles, semilla=2024).simular(horas, llegadas_por_hora)
+    segundos = time.perf_counter() - inicio
+
+    print(f"Simuladas {horas:.0f} h con {tuneles} túneles en {segundos:.2f} s "
+          f"({informe['atendidos'] / segundos:,.0f} coches/s)")
+    for clave in ("llegadas", "atendidos", "completados", "rendimiento_por_hora", "cola_maxima", "cola_media",
+                  "espera_p50", "espera_p90", "espera_p99", "ocupacion_media"):
+        print(f"  {clave:<22} {informe[clave]:,.2f}")
+    print(f"  {'ingresos':<22} {informe['ingresos_centimos'] / 100:,.2f} €")
@@ -0,0 +1,79 @@
+# bench_simulacion_lote.py
+# Previsión de fases e ingresos: ejecutar_y_obtener_fases coche a coche frente a simular_lote
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_simulacion_lote.py [vehiculos]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.lavadero import Lavadero
+from src.simulacion_lote import simular_lote
+
+# bytes.translate: byte aleatorio → 1 con la probabilidad indicada (en 256avos)
+def _umbral(probabilidad):
+    return bytes(int(b < probabilidad * 256) for b in range(256))
+
+
+def generar(n, semilla=0):
+    """Opciones de n vehículos como bytes 0/1; ~1 % piden encerado sin secado."""
+    azar = random.Random(semilla)
+    prelavado = azar.randbytes(n).translate(_umbral(0.3))
+    secado = azar.randbytes(n).translate(_umbral(0.5))
+    # Encerado casi siempre con secado a mano, y algún error de entrada sin él
+    con_secado = azar.randbytes(n).translate(_umbral(0.6))
+    error = azar.randbytes(n).translate(_umbral(0.02))
+    encerado = ((int.from_bytes(secado, "little") & int.from_bytes(con_secado, "little"))
+                | int.from_bytes(error, "little")).to_bytes(n, "little")
+    return prelavado, secado, encerado
+
+
+def coche_a_coche(prelavado, secado, encerado):
+    """Un Lavadero, ejecutar_y_obtener_fases por vehículo y los totales a mano."""
+    lavadero = Lavadero()
+    ejecutar = lavadero.ejecutar_y_obtener_fases
+    visitas = [0] * (Lavadero.FASE_ENCERADO + 1)
+    longitudes, rechazadas = bytearray(), []
+    for fila, opciones in enumerate(zip(prelavado, secado, encerado)):
+        try:
+            fases = ejecutar(*opciones)
+        except ValueError:
+            rechazadas.append(fila)
+            longitudes.append(0)
+            continue
+        longitudes.append(len(fases))
+        for fase in fases[:-1]:
+            visitas[fase] += 1
+    return visitas, lavadero.ingresos_centimos, len(rechazadas)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    prelavado, secado, encerado = generar(n)
+
+    # El bucle coche a coche se mide sobre una muestra y se extrapola
+    muestra = min(n, 200_000)
+    inicio = time.perf_counter()
+    visitas, ingresos, rechazados = coche_a_coche(prelavado[:muestra], secado[:muestra], encerado[:muestra])
+    t_bucle = (time.perf_counter() - inicio) * n / muestra
+
+    parcial = simular_lote(prelavado[:muestra], secado[:muestra], encerado[:muestra])
+    assert (parcial["visitas_por_fase"], parcial["ingresos_centimos"], parcial["rechazados"]) == \
+        (visitas, ingresos, rechazados)
+
+    mejor_total = mejor_vehiculo = float("inf")
+    for _ in range(3):
+        inicio = time.perf_counter()
+        totales = simular_lote(prelavado, secado, encerado, por_vehiculo=False)
+        mejor_total = min(mejor_total, time.perf_counter() - inicio)
+        inicio = time.perf_counter()
+        resultado = simular_lote(prelavado, secado, encerado)
+        mejor_vehiculo = min(mejor_vehiculo, time.perf_counter() - inicio)
+
+    print(f"Vehículos: {n:,} ({resultado['rechazados']:,} rechazados)")
+    print(f"Ingresos: {resultado['ingresos_centimos'] / 100:,.2f} €")
+    print(f"Coche a coche (estimado):         {t_bucle:8.3f} s")
+    print(f"simular_lote, por vehículo:       {mejor_vehiculo:8.3f} s  (x{t_bucle / mejor_vehiculo:,.0f})")
+    print(f"simular_lote, solo totales:       {mejor_total:8.3f} s  (x{t_bucle / mejor_total:,.0f})")
@@ -0,0 +1,76 @@
+# bench_tiempo_restante.py
+# Refresco del tiempo restante de todos los túneles: clonar y avanzar frente a la tabla precalculada
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_tiempo_restante.py [tuneles]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.flota import FlotaLavaderos
+from src.lavadero import Lavadero
+from src.simulacion_eventos import DURACIONES_POR_DEFECTO
+
+COMBINACIONES = list(Lavadero.RUTAS)
+
+
+def preparar(n, semilla=0):
+    """Una lista de Lavadero y una flota con los mismos túneles, cada uno en una fase al azar."""
+    azar = random.Random(semilla)
+    lavaderos, flota = [], FlotaLavaderos(n)
+    for idx in range(n):
+        lavadero = Lavadero()
+        if azar.random() < 0.9:
+            opciones = azar.choice(COMBINACIONES)
+            lavadero.hacer_lavado(*opciones)
+            flota.hacer_lavado(idx, *opciones)
+            for _ in range(azar.randrange(len(Lavadero.RUTAS[opciones]) - 1)):
+                lavadero.avanzarFase()
+                flota.avanzar_fase(idx)
+        lavaderos.append(lavadero)
+    return lavaderos, flota
+
+
+def eta_simulando(lavadero, duraciones):
+    """Lo de antes: clonar el lavadero y avanzar hasta que termine."""
+    clon = Lavadero.restaurar(lavadero.instantanea())
+    tiempo = 0
+    while clon.ocupado:
+        tiempo += duraciones[clon.fase]
+        clon.avanzarFase()
+    return tiempo
+
+
+def medir(funcion, repeticiones=5):
+    """Mejor tiempo de varias repeticiones y el resultado de la última."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    duraciones = DURACIONES_POR_DEFECTO
+    lavaderos, flota = preparar(n)
+
+    muestra = lavaderos[:max(n // 20, 1)]
+    t_simular, esperados = medir(lambda: [eta_simulando(l, duraciones) for l in muestra], 1)
+    t_simular *= n / len(muestra)
+    t_lista, etas_lista = medir(lambda: [l.tiempo_restante(duraciones) for l in lavaderos])
+    t_pasos, pasos = medir(flota.pasos_restantes)
+    t_flota, etas_flota = medir(lambda: flota.tiempo_restante(duraciones))
+
+    assert etas_lista[:len(muestra)] == esperados
+    assert etas_flota == etas_lista
+    assert list(pasos) == [l.pasos_restantes() for l in lavaderos]
+
+    print(f"Túneles: {n}")
+    print(f"Clonar y avanzar (estimado):     {t_simular * 1e3:10.2f} ms")
+    print(f"Lavadero.tiempo_restante:        {t_lista * 1e3:10.2f} ms  (x{t_simular / t_lista:,.0f})")
+    print(f"FlotaLavaderos.tiempo_restante:  {t_flota * 1e3:10.2f} ms  (x{t_simular / t_flota:,.0f})")
+    print(f"FlotaLavaderos.pasos_restantes:  {t_pasos * 1e3:10.2f} ms  (x{t_simular / t_pasos:,.0f})")
@@ -0,0 +1,97 @@
+# bench_transiciones.py
+# Benchmark de avanzarFase: cadena if/elif original frente a la tabla de transiciones
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_transiciones.py
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.lavadero import Lavadero
+
+
+class LavaderoIfElif(Lavadero):
+    """
+    Copia del avanzarFase original (cadena if/elif) para medir el "antes".
+    Accede a los atributos privados de Lavadero por su nombre transformado.
+    """
+
+    def avanzarFase(self):
+        if not self._Lavadero__ocupado:
+            return
+
+        fase = self._Lavadero__fase
+        if fase == self.FASE_INACTIVO:
+            self._Lavadero__fase = self.FASE_COBRANDO
+        elif fase == self.FASE_COBRANDO:
+            if self._Lavadero__prelavado_a_mano:
+                self._Lavadero__fase = self.FASE_PRELAVADO_MANO
+            else:
+                self._Lavadero__fase = self.FASE_ECHANDO_AGUA
+        elif fase == self.FASE_PRELAVADO_MANO:
+            self._Lavadero__fase = self.FASE_ECHANDO_AGUA
+        elif fase == self.FASE_ECHANDO_AGUA:
+            self._Lavadero__fase = self.FASE_ENJABONANDO
+        elif fase == self.FASE_ENJABONANDO:
+            self._Lavadero__fase = self.FASE_RODILLOS
+        elif fase == self.FASE_RODILLOS:
+            if self._Lavadero__secado_a_mano:
+                self._Lavadero__fase = self.FASE_SECADO_MANO
+            else:
+                self._Lavadero__fase = self.FASE_SECADO_AUTOMATICO
+        elif fase == self.FASE_SECADO_AUTOMATICO:
+            self.terminar()
+        elif fase == self.FASE_SECADO_MANO:
+            if self._Lavadero__encerado:
+                self._Lavadero__fase = self.FASE_ENCERADO
+            else:
+                self.terminar()
+        elif fase == self.FASE_ENCERADO:
+            self.terminar()
+        else:
+            raise RuntimeError(f"Estado no válido: Fase {fase}. El lavadero va a estallar...")
+
+
+# Las combinaciones válidas de opciones (encerado exige secado a mano)
+COMBINACIONES = [(p, s, e) for p in (False, True) for s in (False, True)
+                 for e in (False, True) if s or not e]
+
+
+def medir_pasos_por_segundo(clase, ciclos):
+    """Ejecuta `ciclos` lavados completos y devuelve los avanzarFase por segundo."""
+    lavadero = clase()
+    pasos = 0
+    inicio = time.perf_counter()
+    for i in range(ciclos):
+        lavadero.hacer_lavado(*COMBINACIONES[i % len(COMBINACIONES)])
+        while lavadero.ocupado:
+            lavadero.avanzarFase()
+            pasos += 1
+    return pasos / (time.perf_counter() - inicio)
+
+
+def comprobar_equivalencia():
+    """Verifica que ambas implementaciones recorren exactamente las mismas fases."""
+    for opciones in COMBINACIONES:
+        rutas = []
+        for clase in (LavaderoIfElif, Lavadero):
+            lavadero = clase()
+            lavadero.hacer_lavado(*opciones)
+            ruta = [lavadero.fase]
+            while lavadero.ocupado:
+                lavadero.avanzarFase()
+                ruta.append(lavadero.fase)
+            rutas.append(ruta)
+        assert rutas[0] == rutas[1], f"Rutas distintas para {opciones}: {rutas}"
+
+
+if __name__ == "__main__":
+    ciclos = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    comprobar_equivalencia()
+    antes = medir_pasos_por_segundo(LavaderoIfElif, ciclos)
+    despues = medir_pasos_por_segundo(Lavadero, ciclos)
+    print(f"Ciclos simulados: {ciclos}")
+    print(f"if/elif (antes):  {antes:>12,.0f} pasos/s")
+    print(f"tabla (después):  {despues:>12,.0f} pasos/s")
+    print(f"Mejora:           {despues / antes:>12.2f}x")
@@ -0,0 +1,38 @@
+# bench_tunel_segmentado.py
+# Rendimiento del túnel segmentado frente al de un coche cada vez, y coste de tick()
+# Ejecutar desde la raíz del repositorio con: python benchmarks/bench_tunel_segmentado.py [coches]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.lavadero import Lavadero
+from src.simulacion_eventos import DURACIONES_POR_DEFECTO
+from src.tunel_segmentado import comparar_con_ocupacion_unica
+
+# Ticks de 30 segundos con las duraciones por defecto del simulador de eventos
+DURACIONES = {fase: max(1, segundos // 30) for fase, segundos in DURACIONES_POR_DEFECTO.items()
+              if fase != Lavadero.FASE_INACTIVO}
+
+ESCENARIOS = {
+    "una estación por fase": None,
+    "secado a mano x2": {Lavadero.FASE_SECADO_MANO: 2},
+    "manuales x2": {Lavadero.FASE_SECADO_MANO: 2, Lavadero.FASE_ENCERADO: 2, Lavadero.FASE_PRELAVADO_MANO: 2},
+    "manuales x3, rodillos x2": {Lavadero.FASE_SECADO_MANO: 3, Lavadero.FASE_ENCERADO: 3,
+                                 Lavadero.FASE_PRELAVADO_MANO: 3, Lavadero.FASE_RODILLOS: 2},
+}
+
+
+if __name__ == "__main__":
+    coches = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    codigos = random.Random(0).choices([0, 1, 2, 3, 6, 7], k=coches)
+    for nombre, capacidades in ESCENARIOS.items():
+        inicio = time.perf_counter()
+        resultado = comparar_con_ocupacion_unica(codigos, capacidades, DURACIONES)
+        segundos = time.perf_counter() - inicio
+        print(f"{nombre:<26} x{resultado['aceleracion']:.2f} frente a ocupación única  "
+              f"{resultado['coches_por_tick'] * 120:5.2f} coches/hora  "
+              f"({resultado['ticks_segmentado'] / segundos:,.0f} ticks/s)")
@@ -0,0 +1,271 @@
+# suite.py
+# Suite de benchmarks del núcleo de Lavadero con resultados en JSON y comparación contra una línea base
+# Ejecutar desde la raíz del repositorio con:
+#   python benchmarks/suite.py ejecutar --salida base.json
+#   python benchmarks/suite.py comparar base.json actual.json [--umbral 0.10]
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from itertools import product
+
+RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, RAIZ)
+
+from src.lavadero import Lavadero
+from src.main_app import ejecutarSimulacion
+
+VERSION_RESULTADOS = 1
+
+
+# ================== BENCHMARKS ==================
+# Cada benchmark recibe la escala y devuelve (operaciones, función sin argumentos).
+# Se mide el tiempo de la función; el resultado es el tiempo por operación.
+
+def _ciclo(opciones, escala):
+    prelavado, secado, encerado = opciones
+    n = 20_000 * escala
+    lavadero = Lavadero()
+
+    if encerado and not secado:
+        # Combinación no permitida: se mide el rechazo
+        def ejecutar():
+            for _ in range(n):
+                try:
+                    lavadero.hacer_lavado(prelavado, secado, encerado)
+                except ValueError:
+                    pass
+        return n, ejecutar
+
+    def ejecutar():
+        for _ in range(n):
+            lavadero.hacer_lavado(prelavado, secado, encerado)
+            while lavadero.ocupado:
+                lavadero.avanzarFase()
+    return n, ejecutar
+
+
+def _avanzar_fase(escala):
+    ciclos = 20_000 * escala
+    lavadero = Lavadero()
+    hacer_lavado, avanzar = lavadero.hacer_lavado, lavadero.avanzarFase
+    pasos = len(Lavadero.ruta_para((True, True, True))) - 1
+
+    def ejecutar():
+        # Ruta más larga (8 pasos); el hacer_lavado de cada ciclo queda amortizado
+        for _ in range(ciclos):
+            hacer_lavado(True, True, True)
+            avanzar(); avanzar(); avanzar(); avanzar()
+            avanzar(); avanzar(); avanzar(); avanzar()
+    return ciclos * pasos, ejecutar
+
+
+def _ejecutar_y_obtener_fases(escala):
+    n = 30_000 * escala
+    lavadero = Lavadero()
+    combinaciones = list(Lavadero.RUTAS) * (n // len(Lavadero.RUTAS) + 1)
+    combinaciones = combinaciones[:n]
+
+    def ejecutar():
+        for opciones in combinaciones:
+            lavadero.ejecutar_y_obtener_fases(*opciones)
+    return n, ejecutar
+
+
+def _cobrar(escala):
+    n = 100_000 * escala
+    lavadero = Lavadero()
+    lavadero.hacer_lavado(True, True, True)
+    cobrar = lavadero._cobrar
+
+    def ejecutar():
+        for _ in range(n):
+            cobrar()
+    return n, ejecutar
+
+
+def _main_app(escala):
+    n = 2_000 * escala
+    lavadero = Lavadero()
+    combinaciones = list(product((False, True), repeat=3))
+
+    def ejecutar():
+        with open(os.devnull, "w", encoding="utf-8") as nulo, redirect_stdout(nulo):
+            for i in range(n):
+                ejecutarSimulacion(lavadero, *combinaciones[i % 8])
+    return n, ejecutar
+
+
+def _nombre_combinacion(opciones):
+    return "ciclo_p{:d}_s{:d}_e{:d}".format(*opciones)
+
+
+BENCHMARKS = {
+    **{_nombre_combinacion(opciones): (lambda escala, o=opciones: _ciclo(o, escala))
+       for opciones in product((False, True), repeat=3)},
+    "avanzarFase": _avanzar_fase,
+    "ejecutar_y_obtener_fases": _ejecutar_y_obtener_fases,
+    "_cobrar": _cobrar,
+    "main_app.ejecutarSimulacion": _main_app,
+}
+
+
+def memoria_por_instancia(n: int = 20_000):
+    """Bytes por instancia de Lavadero (medido con tracemalloc, sin contar la lista)."""
+    gc.collect()
+    tracemalloc.start()
+    antes, _ = tracemalloc.get_traced_memory()
+    instancias = [Lavadero() for _ in range(n)]
+    despues, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instancias
+    return (despues - antes) / n - 8
+
+
+# ================== EJECUCIÓN ==================
+
+def medir(benchmark, escala: int = 1, repeticiones: int = 5):
+    """
+    Ejecuta un benchmark varias veces.
+
+    Returns:
+        dict: ns por operación (mejor y mediana) y operaciones por segundo
+    """
+    operaciones, ejecutar = benchmark(escala)
+    ejecutar()                           # Calentamiento
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        ejecutar()
+        tiempos.append((time.perf_counter() - inicio) / operaciones)
+    mejor = min(tiempos)
+    return {
+        "unidad": "ns/op",
+        "valor": mejor * 1e9,
+        "mediana": statistics.median(tiempos) * 1e9,
+        "ops_por_segundo": 1 / mejor,
+        "repeticiones": repeticiones,
+    }
+
+
+def _commit_actual():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def ejecutar_suite(escala: int = 1, repeticiones: int = 5, filtro=None):
+    """Ejecuta todos los benchmarks (o los que contienen `filtro`) y devuelve el documento de resultados."""
+    resultados = {}
+    for nombre, benchmark in BENCHMARKS.items():
+        if filtro and filtro not in nombre:
+            continue
+        resultados[nombre] = medir(benchmark, escala, repeticiones)
+        print(f"{nombre:<30} {resultados[nombre]['valor']:>12,.1f} ns/op "
+              f"({resultados[nombre]['ops_por_segundo']:>12,.0f} op/s)", file=sys.stderr)
+    if not filtro or filtro in "memoria_por_instancia":
+        resultados["memoria_por_instancia"] = {"unidad": "bytes", "valor": memoria_por_instancia()}
+        print(f"{'memoria_por_instancia':<30} {resultados['memoria_por_instancia']['valor']:>12,.1f} bytes",
+              file=sys.stderr)
+
+    return {
+        "version": VERSION_RESULTADOS,
+        "entorno": {
+            "python": platform.python_version(),
+            "implementacion": platform.python_implementation(),
+            "plataforma": platform.platform(),
+            "commit": _commit_actual(),
+            "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "resultados": resultados,
+    }
+
+
+# ================== COMPARACIÓN ==================
+
+def comparar(base, actual, umbral: float = 0.10):
+    """
+    Compara dos documentos de resultados. En todas las métricas menos es mejor.
+
+    Returns:
+        list: (nombre, valor base, valor actual, cambio relativo, es_regresion)
+              para las métricas presentes en ambos
+    """
+    filas = []
+    for nombre, medida in actual["resultados"].items():
+        anterior = base["resultados"].get(nombre)
+        if anterior is None or anterior["unidad"] != medida["unidad"]:
+            continue
+        cambio = medida["valor"] / anterior["valor"] - 1 if anterior["valor"] else 0.0
+        filas.append((nombre, anterior["valor"], medida["valor"], cambio, cambio > umbral))
+    return filas
+
+
+def _cargar(ruta):
+    with open(ruta, encoding="utf-8") as fichero:
+        documento = json.load(fichero)
+    if documento.get("version") != VERSION_RESULTADOS:
+        raise SystemExit(f"{ruta}: versión de resultados no soportada ({documento.get('version')})")
+    return documento
+
+
+def crear_parser():
+    """Define los argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Benchmarks del núcleo de Lavadero.")
+    subparsers = parser.add_subparsers(dest="orden", required=True)
+
+    ejecutar = subparsers.add_parser("ejecutar", help="Ejecuta la suite y guarda los resultados en JSON")
+    ejecutar.add_argument("--salida", default=None, help="Fichero JSON de resultados (por defecto, stdout)")
+    ejecutar.add_argument("--escala", type=int, default=1, help="Multiplica las operaciones de cada medida")
+    ejecutar.add_argument("--repeticiones", type=int, default=5, help="Mediciones por benchmark (se toma la mejor)")
+    ejecutar.add_argument("--filtro", default=None, help="Ejecuta solo los benchmarks cuyo nombre lo contiene")
+
+    comparar_parser = subparsers.add_parser("comparar", help="Compara unos resultados con una línea base")
+    comparar_parser.add_argument("base", help="Resultados de referencia (JSON)")
+    comparar_parser.add_argument("actual", help="Resultados nuevos (JSON)")
+    comparar_parser.add_argument("--umbral", type=float, default=0.10,
+                                 help="Empeoramiento relativo a partir del cual hay regresión (por defecto 0.10)")
+    return parser
+
+
+def main(argv=None):
+    args = crear_parser().parse_args(argv)
+
+    if args.orden == "ejecutar":
+        documento = ejecutar_suite(args.escala, args.repeticiones, args.filtro)
+        texto = json.dumps(documento, indent=2, ensure_ascii=False)
+        if args.salida:
+            with open(args.salida, "w", encoding="utf-8") as fichero:
+                fichero.write(texto + "\n")
+        else:
+            print(texto)
+        return 0
+
+    base, actual = _cargar(args.base), _cargar(args.actual)
+    filas = comparar(base, actual, args.umbral)
+    regresiones = 0
+    for nombre, anterior, nuevo, cambio, es_regresion in filas:
+        marca = "REGRESIÓN" if es_regresion else ("mejora" if cambio < -args.umbral else "")
+        print(f"{nombre:<30} {anterior:>12,.1f} → {nuevo:>12,.1f} {cambio:+8.1%}  {marca}")
+        regresiones += es_regresion
+    ausentes = sorted(set(base["resultados"]) - set(actual["resultados"]))
+    if ausentes:
+        print(f"Sin medir en los resultados nuevos: {', '.join(ausentes)}")
+    print(f"{regresiones} regresión(es) por encima del {args.umbral:.0%}")
+    return 1 if regresiones else 0
+
+
+# ===================== PUNTO DE ENTRADA (MAIN) =====================
+if __name__ == "__main__":
+    sys.exit(main())
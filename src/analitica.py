@@ -0,0 +1,185 @@
+# analitica.py
+# Agregados de ingresos por combinación de opciones, por ruta y por franja horaria
+# Incrementales y fusionables: cada trabajador agrega su parte y luego se suman los resultados
+
+from array import array
+
+try:
+    from .lavadero import Lavadero
+    from .simulacion_eventos import DURACIONES_POR_DEFECTO, NUM_FASES
+except ImportError:
+    from lavadero import Lavadero
+    from simulacion_eventos import DURACIONES_POR_DEFECTO, NUM_FASES
+
+
+NANOSEGUNDOS = 1_000_000_000
+OPCIONES = (("prelavado_a_mano", 1), ("secado_a_mano", 2), ("encerado", 4))
+_OPCIONES_POR_CODIGO = [(bool(codigo & 1), bool(codigo & 2), bool(codigo & 4)) for codigo in range(8)]
+
+
+def _ceros(n):
+    return array("q", bytes(8 * n))
+
+
+class AgregadoLavados:
+    """
+    Agregado incremental de lavados cobrados.
+
+    Todo se guarda en arrays de tamaño fijo indexados por el código de
+    opciones de 3 bits (ver Lavadero.codigo_opciones): lavados y céntimos
+    por código, en total y por cubeta de tiempo. Las consultas trabajan
+    solo con esos arrays, nunca vuelven a recorrer los registros; el
+    tiempo por fase se obtiene de los lavados por código y de la ruta de
+    cada código.
+
+    Cada registro es (marca_tiempo_ns, precio_centimos, codigo), el mismo
+    formato que devuelve diario.iterar_diario.
+    """
+
+    def __init__(self, segundos_por_cubeta: int = 3600, duraciones=None, lavadero=None):
+        """
+        Args:
+            segundos_por_cubeta (int): Anchura de cada cubeta de tiempo
+            duraciones (dict): Segundos por fase para el tiempo por fase
+                               (por defecto DURACIONES_POR_DEFECTO)
+            lavadero: Túnel del que salen los registros; las rutas de por_ruta y
+                      tiempo_por_fase son las de su configuración (ver
+                      Lavadero.ruta_configurada). Por defecto, las rutas estándar
+        """
+        if segundos_por_cubeta <= 0:
+            raise ValueError("La cubeta debe durar al menos un segundo")
+        self.segundos_por_cubeta = segundos_por_cubeta
+        self.duraciones = dict(DURACIONES_POR_DEFECTO)
+        if duraciones:
+            self.duraciones.update(duraciones)
+        self.lavados = _ceros(8)
+        self.centimos = _ceros(8)
+        self.cubetas = {}                    # índice de cubeta → array de 16: lavados[0:8], céntimos[8:16]
+        self._ns_por_cubeta = segundos_por_cubeta * NANOSEGUNDOS
+
+        # Ruta de cada código (None para encerado sin secado a mano, que no es válido)
+        ruta_para = lavadero.ruta_configurada if lavadero is not None else Lavadero.ruta_para
+        self.rutas = tuple(None if encerado and not secado else ruta_para((prelavado, secado, encerado))
+                           for prelavado, secado, encerado in _OPCIONES_POR_CODIGO)
+
+        # Segundos que pasa un lavado de cada código en cada fase (fila = código)
+        self._tiempo_por_codigo = []
+        for ruta in self.rutas:
+            fila = [0] * NUM_FASES
+            for fase in ruta[:-1] if ruta else ():
+                fila[fase] += self.duraciones[fase]
+            self._tiempo_por_codigo.append(fila)
+
+    # ================== REGISTRO ==================
+
+    def _cubeta(self, indice):
+        cubeta = self.cubetas.get(indice)
+        if cubeta is None:
+            cubeta = self.cubetas[indice] = _ceros(16)
+        return cubeta
+
+    def registrar(self, marca_tiempo: int, precio_centimos: int, codigo: int):
+        """Añade un lavado cobrado."""
+        self.lavados[codigo] += 1
+        self.centimos[codigo] += precio_centimos
+        cubeta = self._cubeta(marca_tiempo // self._ns_por_cubeta)
+        cubeta[codigo] += 1
+        cubeta[8 + codigo] += precio_centimos
+
+    def consumir(self, registros):
+        """Añade una secuencia de registros (marca_tiempo_ns, precio_centimos, codigo)."""
+        lavados, centimos, cubetas = self.lavados, self.centimos, self.cubetas
+        ancho = self._ns_por_cubeta
+        indice_actual, cubeta = None, None
+        for marca_tiempo, precio, codigo in registros:
+            lavados[codigo] += 1
+            centimos[codigo] += precio
+            indice = marca_tiempo // ancho
+            if indice != indice_actual:
+                # Los registros suelen venir en orden: la cubeta cambia pocas veces
+                indice_actual, cubeta = indice, cubetas.get(indice)
+                if cubeta is None:
+                    cubeta = cubetas[indice] = _ceros(16)
+            cubeta[codigo] += 1
+            cubeta[8 + codigo] += precio
+        return self
+
+    def registrar_lote(self, codigos, marca_tiempo: int, precios_centimos=Lavadero._PRECIOS_CENTIMOS):
+        """
+        Añade un lote de lavados de la misma cubeta (un código por byte, ver
+        codificar_opciones_lote), cobrados con la tabla de precios dada.
+        """
+        cubeta = self._cubeta(marca_tiempo // self._ns_por_cubeta)
+        for codigo in range(8):
+            cuenta = codigos.count(codigo)
+            if cuenta:
+                importe = cuenta * precios_centimos[codigo]
+                self.lavados[codigo] += cuenta
+                self.centimos[codigo] += importe
+                cubeta[codigo] += cuenta
+                cubeta[8 + codigo] += importe
+        return self
+
+    def fusionar(self, otro):
+        """
+        Suma a este agregado otro calculado por separado (p. ej. en otro proceso).
+
+        Raises:
+            ValueError: Si las cubetas, las duraciones o las rutas no coinciden
+        """
+        if (otro.segundos_por_cubeta != self.segundos_por_cubeta or otro.duraciones != self.duraciones
+                or otro.rutas != self.rutas):
+            raise ValueError("Solo se pueden fusionar agregados con las mismas cubetas, duraciones y rutas")
+        for codigo in range(8):
+            self.lavados[codigo] += otro.lavados[codigo]
+            self.centimos[codigo] += otro.centimos[codigo]
+        for indice, suya in otro.cubetas.items():
+            cubeta = self._cubeta(indice)
+            for i in range(16):
+                cubeta[i] += suya[i]
+        return self
+
+    # ================== CONSULTAS ==================
+
+    def totales(self):
+        """Lavados, céntimos y ticket medio en céntimos de todo lo agregado."""
+        lavados, centimos = sum(self.lavados), sum(self.centimos)
+        return {"lavados": lavados, "centimos": centimos,
+                "ticket_medio_centimos": centimos / lavados if lavados else 0.0}
+
+    def por_combinacion(self):
+        """{código: {"lavados", "centimos"}} para cada código con algún lavado."""
+        return {codigo: {"lavados": self.lavados[codigo], "centimos": self.centimos[codigo]}
+                for codigo in range(8) if self.lavados[codigo]}
+
+    def por_ruta(self):
+        """{ruta: {"lavados", "centimos"}}: cada ruta (tupla de fases) corresponde a un código."""
+        return {self.rutas[codigo]: datos for codigo, datos in self.por_combinacion().items()
+                if self.rutas[codigo] is not None}
+
+    def tasas_adjuncion(self):
+        """Fracción de lavados que incluyen cada opción."""
+        total = sum(self.lavados)
+        return {nombre: (sum(n for codigo, n in enumerate(self.lavados) if codigo & bit) / total if total else 0.0)
+                for nombre, bit in OPCIONES}
+
+    def tiempo_por_fase(self):
+        """Segundos totales pasados en cada fase (lista indexada por FASE_*)."""
+        tiempos = [0] * NUM_FASES
+        for codigo, cuenta in enumerate(self.lavados):
+            if cuenta:
+                for fase, segundos in enumerate(self._tiempo_por_codigo[codigo]):
+                    tiempos[fase] += cuenta * segundos
+        return tiempos
+
+    def cubeta(self, marca_tiempo: int):
+        """Lavados y céntimos por código de la cubeta que contiene `marca_tiempo` (ns)."""
+        cubeta = self.cubetas.get(marca_tiempo // self._ns_por_cubeta)
+        if cubeta is None:
+            return {"lavados": [0] * 8, "centimos": [0] * 8}
+        return {"lavados": list(cubeta[:8]), "centimos": list(cubeta[8:])}
+
+    def serie_temporal(self):
+        """[(inicio de la cubeta en ns, lavados, céntimos)] ordenado por tiempo."""
+        return [(indice * self._ns_por_cubeta, sum(cubeta[:8]), sum(cubeta[8:]))
+                for indice, cubeta in sorted(self.cubetas.items())]
@@ -0,0 +1,204 @@
+# configuracion.py
+# Configuración de precios y fases por sede, compilada en tablas de consulta directa
+# Cada sede carga su fichero en lugar de modificar el código; se puede recargar en caliente entre ciclos
+
+import json
+import os
+
+try:
+    from .lavadero import Lavadero, tabla_pasos_restantes
+except ImportError:
+    from lavadero import Lavadero, tabla_pasos_restantes
+
+
+# Fases automáticas que una sede puede quitar o reordenar (entre el cobro/prelavado y el secado)
+FASES_AUTOMATICAS = {
+    "echando_agua": Lavadero.FASE_ECHANDO_AGUA,
+    "enjabonando": Lavadero.FASE_ENJABONANDO,
+    "rodillos": Lavadero.FASE_RODILLOS,
+}
+
+# Valores de la configuración estándar (los de Lavadero): precios en céntimos
+CONFIGURACION_POR_DEFECTO = {
+    "nombre": "estándar",
+    "precios_centimos": {"base": 500, "prelavado_a_mano": 150, "secado_a_mano": 100, "encerado": 120},
+    "orden_lavado": ["echando_agua", "enjabonando", "rodillos"],
+    "secado_automatico": True,
+}
+
+
+class Configuracion:
+    """
+    Configuración compilada: lo que consultan Lavadero y FlotaLavaderos en cada paso.
+
+    Atributos (mismo formato que las tablas de clase de Lavadero):
+    - precios_centimos / precios: precio de cada código de opciones (8 entradas)
+    - tabla_transiciones: {(fase << 3) | código: fase siguiente}
+    - rutas: ruta de cada código (None para los códigos no permitidos)
+    - pasos_restantes: avances que faltan por byte-clave (ver lavadero.tabla_pasos_restantes)
+    """
+
+    def __init__(self, nombre, precios_centimos, tabla_transiciones, rutas, origen=None):
+        self.nombre = nombre
+        self.precios_centimos = precios_centimos
+        self.precios = tuple(centimos / 100 for centimos in precios_centimos)
+        self.tabla_transiciones = tabla_transiciones
+        self.rutas = rutas
+        self.pasos_restantes = tabla_pasos_restantes(rutas)
+        self.origen = origen                 # Datos de los que se compiló (para volver a guardarla)
+
+    def __repr__(self):
+        return f"Configuracion({self.nombre!r})"
+
+
+# ================== COMPILACIÓN ==================
+
+def _ruta(codigo, orden, secado_automatico):
+    """Fases de un ciclo con las opciones del código y las fases de la sede."""
+    ruta = [Lavadero.FASE_INACTIVO, Lavadero.FASE_COBRANDO]
+    if codigo & 1:
+        ruta.append(Lavadero.FASE_PRELAVADO_MANO)
+    ruta.extend(orden)
+    if codigo & 2:
+        ruta.append(Lavadero.FASE_SECADO_MANO)
+        if codigo & 4:
+            ruta.append(Lavadero.FASE_ENCERADO)
+    elif secado_automatico:
+        ruta.append(Lavadero.FASE_SECADO_AUTOMATICO)
+    ruta.append(Lavadero.FASE_INACTIVO)
+    return tuple(ruta)
+
+
+def compilar_configuracion(datos=None):
+    """
+    Valida una configuración y la compila en tablas.
+
+    Claves admitidas (todas opcionales; las que falten toman el valor de
+    CONFIGURACION_POR_DEFECTO):
+    - nombre (str)
+    - precios_centimos: {"base", "prelavado_a_mano", "secado_a_mano", "encerado"}
+    - orden_lavado: lista con las fases automáticas de FASES_AUTOMATICAS que
+      hace la sede, en su orden (las que no aparecen no se hacen)
+    - secado_automatico (bool): si False, el ciclo sin secado a mano termina
+      tras la última fase automática
+
+    La regla de negocio de encerado sin secado a mano no es configurable.
+
+    Returns:
+        Configuracion
+
+    Raises:
+        ValueError: Si hay claves desconocidas o valores no válidos
+    """
+    if datos is None:
+        datos = {}
+    if not isinstance(datos, dict):
+        raise ValueError("La configuración debe ser un objeto JSON (dict)")
+    datos = dict(datos)
+    desconocidas = set(datos) - set(CONFIGURACION_POR_DEFECTO)
+    if desconocidas:
+        raise ValueError(f"Claves de configuración desconocidas: {', '.join(sorted(desconocidas))}")
+
+    precios = dict(CONFIGURACION_POR_DEFECTO["precios_centimos"])
+    precios_sede = datos.get("precios_centimos", {})
+    if not isinstance(precios_sede, dict):
+        raise ValueError("precios_centimos debe ser un objeto JSON con un precio por clave")
+    for clave, valor in precios_sede.items():
+        if clave not in precios:
+            raise ValueError(f"Precio desconocido: {clave}")
+        if type(valor) is not int or valor < 0:
+            raise ValueError(f"El precio '{clave}' debe ser un número entero de céntimos no negativo")
+        precios[clave] = valor
+
+    nombres_orden = datos.get("orden_lavado", CONFIGURACION_POR_DEFECTO["orden_lavado"])
+    if not isinstance(nombres_orden, (list, tuple)) or not all(isinstance(nombre, str) for nombre in nombres_orden):
+        raise ValueError("orden_lavado debe ser una lista de nombres de fase")
+    if len(set(nombres_orden)) != len(nombres_orden):
+        raise ValueError("orden_lavado no puede repetir fases")
+    try:
+        orden = [FASES_AUTOMATICAS[nombre] for nombre in nombres_orden]
+    except KeyError as error:
+        raise ValueError(f"Fase desconocida en orden_lavado: {error.args[0]}") from None
+
+    secado_automatico = datos.get("secado_automatico", CONFIGURACION_POR_DEFECTO["secado_automatico"])
+    if not isinstance(secado_automatico, bool):
+        raise ValueError("secado_automatico debe ser true o false")
+
+    precios_centimos = tuple(
+        precios["base"]
+        + (precios["prelavado_a_mano"] if codigo & 1 else 0)
+        + (precios["secado_a_mano"] if codigo & 2 else 0)
+        + (precios["encerado"] if codigo & 4 else 0)
+        for codigo in range(8))
+
+    # Tabla de transiciones a partir de la ruta de cada código. Los códigos no
+    # permitidos (encerado sin secado) también tienen entradas, como en Lavadero:
+    # el encerado solo se alcanza desde el secado a mano.
+    tabla = {}
+    rutas = []
+    for codigo in range(8):
+        ruta = _ruta(codigo, orden, secado_automatico)
+        for fase, siguiente in zip(ruta, ruta[1:]):
+            tabla[(fase << 3) | codigo] = siguiente
+        rutas.append(None if codigo & 4 and not codigo & 2 else ruta)
+
+    nombre = datos.get("nombre", CONFIGURACION_POR_DEFECTO["nombre"])
+    if not isinstance(nombre, str):
+        raise ValueError("nombre debe ser un texto")
+    return Configuracion(nombre, precios_centimos, tabla, tuple(rutas), origen=datos)
+
+
+def cargar_configuracion(ruta):
+    """Lee una configuración JSON de un fichero y la compila (ver compilar_configuracion)."""
+    with open(ruta, encoding="utf-8") as fichero:
+        try:
+            datos = json.load(fichero)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"{ruta}: JSON no válido ({error})") from None
+    return compilar_configuracion(datos)
+
+
+# ================== RECARGA EN CALIENTE ==================
+
+class RecargadorConfiguracion:
+    """
+    Vigila un fichero de configuración y la aplica a lavaderos o flotas cuando cambia.
+
+    comprobar() se llama cuando convenga (p. ej. entre ciclos del bucle
+    principal): solo relee el fichero si su fecha de modificación ha cambiado.
+    La configuración nueva se compila entera antes de aplicarla, así que un
+    fichero con errores no deja a nadie a medias. Cada destino la aplica a
+    los túneles libres al momento y a los ocupados al terminar su ciclo.
+    """
+
+    def __init__(self, ruta, destinos=()):
+        """
+        Args:
+            ruta (str): Fichero JSON de configuración
+            destinos: Objetos con aplicar_configuracion (Lavadero, FlotaLavaderos...)
+        """
+        self.ruta = ruta
+        self.destinos = list(destinos)
+        self.configuracion = None
+        self._marca = None
+
+    def comprobar(self):
+        """
+        Recarga y aplica la configuración si el fichero ha cambiado.
+
+        Returns:
+            bool: True si se ha aplicado una configuración nueva
+
+        Raises:
+            ValueError: Si el fichero nuevo no es válido (se sigue usando la anterior)
+        """
+        estado = os.stat(self.ruta)
+        marca = (estado.st_mtime_ns, estado.st_size)
+        if marca == self._marca:
+            return False
+        self._marca = marca
+        configuracion = cargar_configuracion(self.ruta)
+        for destino in self.destinos:
+            destino.aplicar_configuracion(configuracion)
+        self.configuracion = configuracion
+        return True
@@ -0,0 +1,287 @@
+# despachador.py
+# Reparto de los coches que llegan entre un conjunto de túneles Lavadero
+# Los túneles libres se guardan en una lista y los ocupados en un montículo: no hay que probarlos uno a uno
+
+import heapq
+from collections import deque
+
+try:
+    from .lavadero import Lavadero
+except ImportError:
+    from lavadero import Lavadero
+
+
+# Opciones (prelavado, secado, encerado) de cada código
+_OPCIONES = [(bool(codigo & 1), bool(codigo & 2), bool(codigo & 4)) for codigo in range(8)]
+
+# Bits del código de opciones que necesitan personal: prelavado y secado a mano
+# (el encerado solo es posible con secado a mano)
+_SERVICIOS_A_MANO = 0b011
+
+
+# ================== POLÍTICAS ==================
+# Una política decide qué túnel recibe cada coche. Interfaz:
+#   preparar(despachador, indices): túneles que gestiona
+#   hay_libre(): si alguno de sus túneles está libre
+#   elegir(codigo): índice del túnel para un coche (libre si lo hay)
+#   actualizar(idx): el despachador ha cambiado la carga del túnel idx
+
+class PoliticaMenosCargado:
+    """
+    Elige un túnel libre si lo hay (O(1), lista de libres) y, si no, el que
+    tenga menos coches asignados (en curso + en su cola), con un montículo.
+
+    Las entradas del montículo no se borran al cambiar la carga de un túnel:
+    se añade una nueva y las antiguas se descartan al llegar a la cima.
+    """
+
+    nombre = "menos_cargado"
+
+    def __init__(self):
+        self._despachador = None
+        self._libres = []
+        self._monticulo = []
+        self._num_tuneles = 0
+
+    def preparar(self, despachador, indices):
+        self._despachador = despachador
+        indices = list(indices)
+        self._num_tuneles = len(indices)
+        # Al revés para que pop() entregue primero los de índice más bajo
+        self._libres = [idx for idx in reversed(indices) if despachador.cargas[idx] == 0]
+        self._monticulo = [(self.clave(idx), idx) for idx in indices if despachador.cargas[idx]]
+        heapq.heapify(self._monticulo)
+
+    def clave(self, idx):
+        """Prioridad de un túnel ocupado: menor es mejor."""
+        return self._despachador.cargas[idx]
+
+    @property
+    def vacia(self):
+        return self._num_tuneles == 0
+
+    def hay_libre(self):
+        return bool(self._libres)
+
+    def elegir(self, codigo):
+        if self._libres:
+            return self._libres.pop()
+        monticulo, cargas = self._monticulo, self._despachador.cargas
+        while True:
+            clave, idx = monticulo[0]
+            if cargas[idx] and clave == self.clave(idx):
+                return idx
+            heapq.heappop(monticulo)          # Entrada antigua
+
+    def actualizar(self, idx):
+        if self._despachador.cargas[idx] == 0:
+            self._libres.append(idx)
+            return
+        monticulo = self._monticulo
+        heapq.heappush(monticulo, (self.clave(idx), idx))
+        if len(monticulo) > 4 * self._num_tuneles + 16:
+            # Demasiadas entradas antiguas: reconstruir con una por túnel ocupado
+            cargas = self._despachador.cargas
+            ocupados = {idx for _, idx in monticulo if cargas[idx]}
+            self._monticulo = [(self.clave(idx), idx) for idx in ocupados]
+            heapq.heapify(self._monticulo)
+
+
+class PoliticaMenorRestante(PoliticaMenosCargado):
+    """
+    Como PoliticaMenosCargado, pero sin túneles libres elige el que se espera
+    que termine antes todo lo que tiene asignado. La estimación parte de la
+    fase y las opciones del coche en curso y suma la duración de las rutas
+    de los coches en cola (ver Despachador.fin_estimado).
+    """
+
+    nombre = "menor_restante"
+
+    def clave(self, idx):
+        return self._despachador.fin_estimado[idx]
+
+
+class PoliticaAfinidad:
+    """
+    Reserva los túneles con personal (bahías de servicio a mano) para los
+    coches que piden prelavado o secado a mano.
+
+    Cada grupo de túneles (a mano / automáticos) se gestiona con su propia
+    política base. Un coche va, por este orden, a un túnel libre de su grupo
+    preferido, a un túnel libre del otro grupo o a la cola del mejor túnel
+    de su grupo preferido.
+    """
+
+    nombre = "afinidad"
+
+    def __init__(self, manuales, base=PoliticaMenosCargado):
+        """
+        Args:
+            manuales: Índices de los túneles con bahía de servicio a mano
+            base: Clase de la política usada dentro de cada grupo
+        """
+        self.manuales = frozenset(manuales)
+        self._a_mano = base()
+        self._automaticos = base()
+
+    def preparar(self, despachador, indices):
+        indices = list(indices)
+        self._a_mano.preparar(despachador, [idx for idx in indices if idx in self.manuales])
+        self._automaticos.preparar(despachador, [idx for idx in indices if idx not in self.manuales])
+
+    @property
+    def vacia(self):
+        return self._a_mano.vacia and self._automaticos.vacia
+
+    def hay_libre(self):
+        return self._a_mano.hay_libre() or self._automaticos.hay_libre()
+
+    def elegir(self, codigo):
+        if codigo & _SERVICIOS_A_MANO:
+            preferido, otro = self._a_mano, self._automaticos
+        else:
+            preferido, otro = self._automaticos, self._a_mano
+        if preferido.hay_libre() or not otro.hay_libre() and not preferido.vacia:
+            return preferido.elegir(codigo)
+        return otro.elegir(codigo)
+
+    def actualizar(self, idx):
+        (self._a_mano if idx in self.manuales else self._automaticos).actualizar(idx)
+
+
+# Políticas por nombre (la de afinidad necesita la lista de túneles a mano)
+POLITICAS = {
+    PoliticaMenosCargado.nombre: PoliticaMenosCargado,
+    PoliticaMenorRestante.nombre: PoliticaMenorRestante,
+}
+
+
+# ================== DESPACHADOR ==================
+
+class Despachador:
+    """
+    Asigna los coches que llegan a un conjunto de túneles y les da paso
+    cuando el túnel queda libre.
+
+    Cada túnel tiene una cola propia con los coches que se le han asignado
+    mientras estaba ocupado. asignar() cuesta O(1) si hay un túnel libre y
+    O(log túneles) si no; nunca se prueba hacer_lavado túnel a túnel.
+    """
+
+    def __init__(self, lavaderos, politica=None, duraciones=None):
+        """
+        Args:
+            lavaderos (list): Túneles (Lavadero o cualquier objeto con su interfaz)
+            politica: Política de reparto (por defecto PoliticaMenosCargado())
+            duraciones (dict): Duración de cada fase {FASE_*: tiempo} para estimar
+                               cuándo termina cada túnel; por defecto 1 por fase
+                               (el tiempo se cuenta en avances de fase)
+
+        Raises:
+            ValueError: Si no hay ningún túnel
+        """
+        self.lavaderos = list(lavaderos)
+        if not self.lavaderos:
+            raise ValueError("Hace falta al menos un túnel")
+        n = len(self.lavaderos)
+        self.politica = politica if politica is not None else PoliticaMenosCargado()
+
+        self._duraciones = {fase: 1 for fase in range(Lavadero.FASE_COBRANDO, Lavadero.FASE_ENCERADO + 1)}
+        self._duraciones.update(duraciones or {})
+        self._duraciones[Lavadero.FASE_INACTIVO] = 0
+        # Duración de un ciclo completo por ruta; cada túnel da la suya (ver _duracion)
+        self._duracion_ruta = {}
+
+        self.cargas = [0] * n                # Coches asignados a cada túnel (en curso + en cola)
+        self.fin_estimado = [0.0] * n        # Cuándo se espera que cada túnel termine lo asignado
+        self._colas = [deque() for _ in range(n)]      # (código, duración estimada) de cada coche en cola
+        self._trabajo_en_cola = [0] * n
+        self.asignados = 0
+        self.encolados = 0
+
+        # Túneles que ya tienen un lavado en curso: el tiempo restante sale de su fase y opciones
+        for idx, lavadero in enumerate(self.lavaderos):
+            if lavadero.ocupado:
+                self.cargas[idx] = 1
+                self.fin_estimado[idx] = lavadero.tiempo_restante(self._duraciones)
+        self.politica.preparar(self, range(n))
+
+    def __len__(self):
+        return len(self.lavaderos)
+
+    def _duracion(self, lavadero, codigo):
+        """Duración de un ciclo completo de `codigo` con la ruta de ese túnel (ver Lavadero.ruta_configurada)."""
+        ruta = lavadero.ruta_configurada(_OPCIONES[codigo])
+        duracion = self._duracion_ruta.get(ruta)
+        if duracion is None:
+            duracion = self._duracion_ruta[ruta] = sum(self._duraciones[fase] for fase in ruta[:-1])
+        return duracion
+
+    @property
+    def en_cola(self):
+        """Coches asignados que esperan a que su túnel quede libre."""
+        return sum(map(len, self._colas))
+
+    def asignar(self, prelavado_a_mano: bool, secado_a_mano: bool, encerado: bool, ahora=0.0):
+        """
+        Asigna un coche a un túnel según la política. Si el túnel está libre,
+        el lavado empieza (y se cobra) ya; si no, el coche espera en su cola.
+
+        Args:
+            ahora: Instante actual, en las unidades de `duraciones` (solo lo
+                   usan las políticas que estiman cuándo termina cada túnel)
+
+        Returns:
+            int: Índice del túnel asignado
+
+        Raises:
+            ValueError: Si intenta encerar sin secado a mano
+        """
+        Lavadero.validar_lavado(False, secado_a_mano, encerado)
+        codigo = Lavadero.codigo_opciones(prelavado_a_mano, secado_a_mano, encerado)
+        idx = self.politica.elegir(codigo)
+        lavadero = self.lavaderos[idx]
+        if self.cargas[idx] == 0:
+            lavadero.hacer_lavado(prelavado_a_mano, secado_a_mano, encerado)
+            self.fin_estimado[idx] = ahora + self._duracion(lavadero, codigo)
+        else:
+            duracion = self._duracion(lavadero, codigo)
+            self._colas[idx].append((codigo, duracion))
+            self._trabajo_en_cola[idx] += duracion
+            self.fin_estimado[idx] += duracion
+            self.encolados += 1
+        self.cargas[idx] += 1
+        self.asignados += 1
+        self.politica.actualizar(idx)
+        return idx
+
+    def liberar(self, idx, ahora=0.0):
+        """
+        Avisa de que el túnel idx ha terminado su ciclo: si tiene coches en
+        cola, empieza el siguiente; si no, queda libre para la política.
+
+        Returns:
+            int: Código de opciones del coche que ha empezado, o None si el túnel queda libre
+
+        Raises:
+            ValueError: Si el túnel no tenía ningún coche asignado
+        """
+        if self.cargas[idx] == 0:
+            raise ValueError("El túnel no tiene ningún coche asignado")
+        lavadero = self.lavaderos[idx]
+        if lavadero.ocupado:
+            lavadero.terminar()
+        self.cargas[idx] -= 1
+
+        codigo = None
+        cola = self._colas[idx]
+        if cola:
+            codigo, duracion = cola.popleft()
+            self._trabajo_en_cola[idx] -= duracion
+            lavadero.hacer_lavado(*_OPCIONES[codigo])
+            # El ciclo que empieza usa la configuración actual del túnel, no la de cuando se encoló
+            self.fin_estimado[idx] = ahora + self._duracion(lavadero, codigo) + self._trabajo_en_cola[idx]
+        else:
+            self.fin_estimado[idx] = ahora
+        self.politica.actualizar(idx)
+        return codigo
@@ -0,0 +1,186 @@
+# diario.py
+# Diario binario de solo escritura al final con un registro por cada lavado cobrado
+# Permite auditar cada cobro y reconstruir los ingresos tras una caída sin parsear texto
+
+import mmap
+import os
+import struct
+import sys
+import time
+
+# ================== FORMATO DEL FICHERO ==================
+# Cabecera de 16 bytes: firma, versión y tamaño de registro.
+# Después, registros de tamaño fijo (16 bytes, little-endian):
+#   - marca de tiempo en nanosegundos (int64)
+#   - precio cobrado en céntimos (int32)
+#   - máscara de opciones (uint8, ver Lavadero.codigo_opciones)
+#   - 3 bytes de relleno para alinear a 16
+
+FIRMA = b"LAVDIAR\x00"
+VERSION = 1
+CABECERA = struct.Struct("<8sHH4x")
+REGISTRO = struct.Struct("<qiB3x")
+
+# Posición de cada campo dentro del registro
+_DESPL_PRECIO = 8
+_DESPL_MASCARA = 12
+
+
+class DiarioEscritor:
+    """
+    Escritor del diario de lavados.
+
+    Los registros se empaquetan en un búfer en memoria y se escriben al
+    fichero por lotes; el fsync se hace cada `lotes_por_fsync` lotes (y
+    siempre al cerrar o al llamar a sincronizar()). Un Lavadero creado con
+    Lavadero(diario=escritor) llama a registrar() en cada lavado aceptado.
+    """
+
+    def __init__(self, ruta, registros_por_lote: int = 65536, lotes_por_fsync: int = 16, reloj=time.time_ns):
+        """
+        Args:
+            ruta (str): Fichero del diario; si existe, se añade al final
+                        (tras descartar un registro final incompleto)
+            registros_por_lote (int): Registros que se acumulan antes de escribir
+            lotes_por_fsync (int): Lotes escritos entre dos fsync (0 = solo al cerrar)
+            reloj: Función que devuelve la marca de tiempo en nanosegundos
+        """
+        self.ruta = ruta
+        self.lotes_por_fsync = lotes_por_fsync
+        self.reloj = reloj
+        self._fichero = open(ruta, "ab")
+        try:
+            tamano = self._fichero.tell()
+            if tamano == 0:
+                self._fichero.write(CABECERA.pack(FIRMA, VERSION, REGISTRO.size))
+            else:
+                _comprobar_cabecera(ruta)
+                # Un registro final incompleto (caída a mitad de escritura) se descarta:
+                # si no, todo lo que se añadiese quedaría desalineado
+                completo = CABECERA.size + (tamano - CABECERA.size) // REGISTRO.size * REGISTRO.size
+                if completo != tamano:
+                    self._fichero.truncate(completo)
+        except BaseException:
+            # Cabecera ajena o de otra versión: el llamante no recibe nada que cerrar
+            self._fichero.close()
+            raise
+        self._bufer = bytearray(REGISTRO.size * registros_por_lote)
+        self._pos = 0
+        self._lotes_sin_fsync = 0
+        self.registros = 0
+
+    def registrar(self, mascara: int, precio_centimos: int, marca_tiempo=None):
+        """Añade un registro al diario (se escribe al fichero al completar el lote)."""
+        REGISTRO.pack_into(self._bufer, self._pos,
+                           self.reloj() if marca_tiempo is None else marca_tiempo,
+                           precio_centimos, mascara)
+        self._pos += REGISTRO.size
+        self.registros += 1
+        if self._pos == len(self._bufer):
+            self._volcar()
+
+    def _volcar(self):
+        """Escribe el lote pendiente y hace fsync si toca según la política."""
+        if self._pos:
+            self._fichero.write(memoryview(self._bufer)[:self._pos])
+            self._pos = 0
+            self._lotes_sin_fsync += 1
+            if self.lotes_por_fsync and self._lotes_sin_fsync >= self.lotes_por_fsync:
+                self.sincronizar()
+
+    def sincronizar(self):
+        """Escribe lo pendiente y fuerza a disco (flush + fsync)."""
+        if self._pos:
+            self._fichero.write(memoryview(self._bufer)[:self._pos])
+            self._pos = 0
+        self._fichero.flush()
+        os.fsync(self._fichero.fileno())
+        self._lotes_sin_fsync = 0
+
+    def cerrar(self):
+        """Sincroniza y cierra el fichero."""
+        if not self._fichero.closed:
+            self.sincronizar()
+            self._fichero.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def _comprobar_cabecera(ruta):
+    with open(ruta, "rb") as fichero:
+        datos = fichero.read(CABECERA.size)
+    if len(datos) < CABECERA.size:
+        raise ValueError(f"{ruta}: cabecera de diario incompleta")
+    firma, version, tamano = CABECERA.unpack(datos)
+    if firma != FIRMA:
+        raise ValueError(f"{ruta}: no es un diario de lavados")
+    if version != VERSION or tamano != REGISTRO.size:
+        raise ValueError(f"{ruta}: versión de diario no soportada ({version})")
+
+
+def iterar_diario(ruta):
+    """Recorre el diario registro a registro: (marca_tiempo, precio_centimos, mascara)."""
+    _comprobar_cabecera(ruta)
+    with open(ruta, "rb") as fichero:
+        fichero.seek(CABECERA.size)
+        while True:
+            bloque = fichero.read(REGISTRO.size * 65536)
+            completo = len(bloque) - len(bloque) % REGISTRO.size
+            if not completo:
+                return
+            yield from REGISTRO.iter_unpack(bloque[:completo])
+
+
+def reproducir_diario(ruta):
+    """
+    Reconstruye los ingresos y los contadores por opción a partir del diario.
+
+    El fichero se proyecta en memoria (mmap) y las columnas se leen como
+    vistas con salto de 16 bytes, sin desempaquetar registro a registro.
+    Un registro final incompleto (p. ej. por una caída a mitad de escritura)
+    se ignora.
+
+    Returns:
+        dict: registros, ingresos_centimos, lavados por código de opciones
+              (lista de 8) y por opción (prelavado, secado, encerado)
+    """
+    _comprobar_cabecera(ruta)
+    tamano = os.path.getsize(ruta)
+    registros = (tamano - CABECERA.size) // REGISTRO.size
+    por_codigo = [0] * 8
+    ingresos = 0
+
+    if registros:
+        with open(ruta, "rb") as fichero, \
+                mmap.mmap(fichero.fileno(), 0, access=mmap.ACCESS_READ) as proyeccion:
+            vista = memoryview(proyeccion)[CABECERA.size:CABECERA.size + registros * REGISTRO.size]
+            try:
+                mascaras = vista[_DESPL_MASCARA::REGISTRO.size].tobytes()
+                for codigo in range(8):
+                    por_codigo[codigo] = mascaras.count(codigo)
+
+                if sys.byteorder == "little":
+                    enteros = vista.cast("i")
+                    try:
+                        ingresos = sum(enteros[_DESPL_PRECIO // 4::REGISTRO.size // 4])
+                    finally:
+                        enteros.release()
+                else:
+                    ingresos = sum(precio for _, precio, _ in REGISTRO.iter_unpack(vista))
+            finally:
+                vista.release()
+
+    return {
+        "registros": registros,
+        "ingresos_centimos": ingresos,
+        "por_codigo": por_codigo,
+        "por_opcion": {
+            "prelavado_a_mano": sum(n for c, n in enumerate(por_codigo) if c & 1),
+            "secado_a_mano": sum(n for c, n in enumerate(por_codigo) if c & 2),
+            "encerado": sum(n for c, n in enumerate(por_codigo) if c & 4),
+        },
+    }
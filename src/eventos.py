@@ -0,0 +1,155 @@
+# eventos.py
+# Sumideros para el flujo de eventos de los lavaderos (ver Lavadero.suscribir)
+# Sustituyen a los print: guardan, escriben o reenvían los eventos por lotes
+
+import json
+import weakref
+from collections import deque
+
+try:
+    from .lavadero import EVENTO_COBRO, EVENTO_FASE, EVENTO_RECHAZO
+except ImportError:
+    from lavadero import EVENTO_COBRO, EVENTO_FASE, EVENTO_RECHAZO
+
+
+class BufferCircular:
+    """
+    Guarda en memoria los últimos `capacidad` eventos; los más antiguos se descartan.
+    Útil para depurar: siempre se tiene el historial reciente sin crecer sin límite.
+    """
+
+    def __init__(self, capacidad: int = 100_000):
+        self._eventos = deque(maxlen=capacidad)
+        self.recibidos = 0
+
+    def __call__(self, evento):
+        self._eventos.append(evento)
+        self.recibidos += 1
+
+    def __len__(self):
+        return len(self._eventos)
+
+    def eventos(self):
+        """Devuelve los eventos guardados, del más antiguo al más reciente."""
+        return list(self._eventos)
+
+    def vaciar(self):
+        """Devuelve los eventos guardados y deja el búfer vacío."""
+        eventos = list(self._eventos)
+        self._eventos.clear()
+        return eventos
+
+
+class SumideroCallback:
+    """
+    Agrupa los eventos en lotes y llama a `callback(lote)` con cada lote completo.
+
+    Recibir un evento es solo un append a una lista; el coste de la
+    función de destino se paga una vez por lote, no por evento.
+    """
+
+    def __init__(self, callback, tamano_lote: int = 4096):
+        self.callback = callback
+        self.tamano_lote = tamano_lote
+        self._lote = []
+
+    def __call__(self, evento):
+        lote = self._lote
+        lote.append(evento)
+        if len(lote) >= self.tamano_lote:
+            self.vaciar()
+
+    def vaciar(self):
+        """Envía el lote pendiente aunque no esté completo."""
+        if self._lote:
+            lote, self._lote = self._lote, []
+            self.callback(lote)
+
+
+def evento_a_dict(evento, nombrar=id):
+    """
+    Convierte un evento en un dict serializable a JSON.
+
+    Args:
+        evento (tuple): Evento emitido por un lavadero
+        nombrar: Función que da un identificador JSON al lavadero de origen
+    """
+    tipo, origen, dato1, dato2 = evento
+    if tipo == EVENTO_FASE:
+        return {"tipo": tipo, "lavadero": nombrar(origen), "anterior": dato1, "nueva": dato2}
+    if tipo == EVENTO_COBRO:
+        return {"tipo": tipo, "lavadero": nombrar(origen), "opciones": dato1, "centimos": dato2}
+    if tipo == EVENTO_RECHAZO:
+        return {"tipo": tipo, "lavadero": nombrar(origen), "motivo": dato1}
+    raise ValueError(f"Tipo de evento desconocido: {tipo}")
+
+
+class SumideroNDJSON(SumideroCallback):
+    """
+    Escribe los eventos en un fichero NDJSON (un objeto JSON por línea).
+
+    Los eventos se formatean directamente como texto (mismo resultado que
+    json.dumps(evento_a_dict(evento, nombrar))) y se escriben con una sola llamada a
+    write por lote. El identificador JSON de cada lavadero se calcula una vez
+    y se guarda con una referencia débil: el sumidero no mantiene vivos los
+    lavaderos que ya nadie usa. Hay que llamar a cerrar() (o usarlo con
+    `with`) para escribir el último lote.
+    """
+
+    def __init__(self, ruta, tamano_lote: int = 4096, nombrar=None):
+        """
+        Args:
+            ruta (str): Fichero NDJSON; si existe, se añade al final
+            tamano_lote (int): Eventos que se acumulan antes de escribir
+            nombrar: Función que da un identificador JSON a cada lavadero. Por
+                     defecto se numeran 1, 2, 3... en el orden en que aparecen y
+                     un número no se reutiliza aunque su lavadero desaparezca
+                     (id() sí podría repetirse en un registro que dura).
+        """
+        super().__init__(self._escribir, tamano_lote)
+        self.nombrar = nombrar
+        self._nombres = weakref.WeakKeyDictionary()   # lavadero → identificador ya codificado en JSON
+        self._numerados = 0
+        self._fichero = open(ruta, "a", encoding="utf-8")
+
+    def _nombre(self, origen):
+        nombre = self._nombres.get(origen)
+        if nombre is None:
+            if self.nombrar is None:
+                self._numerados += 1
+                valor = self._numerados
+            else:
+                valor = self.nombrar(origen)
+            nombre = self._nombres[origen] = json.dumps(valor, ensure_ascii=False)
+        return nombre
+
+    def _escribir(self, lote):
+        lineas = []
+        # Los eventos seguidos suelen ser del mismo lavadero: se busca su nombre una vez
+        anterior, nombre = None, None
+        for tipo, origen, dato1, dato2 in lote:
+            if origen is not anterior:
+                anterior, nombre = origen, self._nombre(origen)
+            if tipo == EVENTO_FASE:
+                lineas.append(f'{{"tipo":"fase","lavadero":{nombre},"anterior":{dato1},"nueva":{dato2}}}\n')
+            elif tipo == EVENTO_COBRO:
+                lineas.append(f'{{"tipo":"cobro","lavadero":{nombre},"opciones":{dato1},"centimos":{dato2}}}\n')
+            elif tipo == EVENTO_RECHAZO:
+                motivo = json.dumps(dato1, ensure_ascii=False)
+                lineas.append(f'{{"tipo":"rechazo","lavadero":{nombre},"motivo":{motivo}}}\n')
+            else:
+                raise ValueError(f"Tipo de evento desconocido: {tipo}")
+        self._fichero.write("".join(lineas))
+
+    def cerrar(self):
+        """Escribe el lote pendiente y cierra el fichero."""
+        if not self._fichero.closed:
+            self.vaciar()
+            self._fichero.close()
+            self._nombres.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
@@ -0,0 +1,491 @@
+# flota.py
+# Simulación de una red completa de túneles de lavado en un único objeto
+# El estado de los N túneles se guarda en arrays compactos en lugar de N objetos Lavadero
+
+import struct
+import sys
+from array import array
+from decimal import Decimal
+
+try:
+    from .lavadero import Lavadero, tabla_tiempo_restante, tiempo_restante_en_ruta
+except ImportError:
+    from lavadero import Lavadero, tabla_tiempo_restante, tiempo_restante_en_ruta
+
+
+# ================== TABLA DE AVANCE VECTORIZADO ==================
+# Cada túnel se resume en un byte-clave: ocupado (bit 7) | fase (bits 3-6) | opciones (bits 0-2).
+# La tabla traduce cada clave posible a la fase siguiente, de modo que avanzar
+# todos los túneles es un único bytes.translate sobre el array de claves.
+
+_FASE_NO_VALIDA = 0xFF
+
+
+def _construir_tabla_flota(transiciones=Lavadero._TABLA_TRANSICIONES):
+    tabla = bytearray(256)
+    for clave in range(256):
+        ocupado, fase, codigo = clave >> 7, (clave >> 3) & 0x0F, clave & 0x07
+        if not ocupado:
+            tabla[clave] = fase                   # Túnel libre: no avanza
+        else:
+            tabla[clave] = transiciones.get((fase << 3) | codigo, _FASE_NO_VALIDA)
+    return bytes(tabla)
+
+
+_TABLA_FLOTA = _construir_tabla_flota()
+
+# Formato binario de las instantáneas de flota (ver FlotaLavaderos.instantanea):
+# cabecera (firma, versión, número de túneles) seguida de los cuatro arrays tal cual
+_CABECERA_INSTANTANEA = struct.Struct("<4sB3xQ")
+_FIRMA_INSTANTANEA = b"FLTS"
+VERSION_INSTANTANEA = 1
+
+# Tablas auxiliares para bytes.translate
+_A_BINARIO = bytes([0] + [1] * 255)               # fase distinta de 0 → ocupado
+_A_MASCARA = bytes([0x00] + [0xFF] * 255)         # ocupado → conservar opciones
+
+
+def _estados_alcanzables(pasos_restantes):
+    """
+    Tabla de 256 bytes: byte-clave → 1 si el ciclo puede llegar a ese estado.
+    Libre solo con clave 0; ocupado, donde la tabla de pasos restantes no vale 0.
+    """
+    return bytes([1]) + bytes(1 if pasos else 0 for pasos in pasos_restantes[1:])
+
+
+# Posición de cada tabla en la tupla de una generación de configuración
+_TABLA_FLOTA_GEN, _TRANSICIONES_GEN, _RUTAS_GEN, _PRECIOS_GEN, _PASOS_GEN, _SELECCION_GEN = range(6)
+
+
+def _tablas_configuracion(tabla_flota, transiciones, rutas, precios_centimos, pasos_restantes, generacion):
+    """Tablas de una generación de configuración; la última selecciona sus túneles con translate."""
+    seleccion = bytes(0xFF if valor == generacion else 0x00 for valor in range(256))
+    return (tabla_flota, transiciones, rutas, precios_centimos, pasos_restantes, seleccion)
+
+
+class FlotaLavaderos:
+    """
+    Conjunto de N túneles de lavado con el estado guardado en arrays compactos.
+
+    Por túnel se guarda un byte de fase, un byte de ocupado, un byte con el
+    código de opciones (ver Lavadero.codigo_opciones) y un entero de 64 bits
+    con los ingresos en céntimos. Las reglas de negocio, las fases y los
+    precios son los mismos que los de Lavadero, salvo que se aplique una
+    configuración (ver aplicar_configuracion).
+
+    Cada túnel guarda también en un byte la generación de la configuración
+    con la que empezó su ciclo: tras recargar la configuración, los túneles
+    ocupados terminan con las tablas anteriores y los libres usan ya las
+    nuevas, sin parar la flota.
+    """
+
+    def __init__(self, n: int):
+        """
+        Crea una flota de n túneles, todos en estado inicial (como Lavadero()).
+
+        Args:
+            n (int): Número de túneles
+        """
+        if n < 0:
+            raise ValueError("El número de túneles no puede ser negativo")
+        self._fases = bytearray(n)                       # Fase actual de cada túnel
+        self._ocupados = bytearray(n)                    # 1 si hay vehículo en el túnel
+        self._opciones = bytearray(n)                    # Código de opciones (3 bits)
+        self._ingresos = array("q", bytes(8 * n))        # Céntimos acumulados por túnel
+        self._generaciones = bytearray(n)                # Generación de configuración del ciclo en curso
+        self._generacion = 0                             # Generación con la que empiezan los ciclos nuevos
+        self._configuracion = None                       # None = configuración estándar de Lavadero
+        self._tabla_flota = _TABLA_FLOTA
+        self._precios_centimos = Lavadero._PRECIOS_CENTIMOS
+        self._rutas = Lavadero._RUTAS
+        self._pasos_restantes = Lavadero._PASOS_RESTANTES
+        # Generaciones en uso → tablas (solo hay más de una mientras se cambia de configuración)
+        self._configuraciones = {0: _tablas_configuracion(
+            _TABLA_FLOTA, Lavadero._TABLA_TRANSICIONES, Lavadero._RUTAS, Lavadero._PRECIOS_CENTIMOS,
+            Lavadero._PASOS_RESTANTES, 0)}
+
+    def __len__(self):
+        return len(self._fases)
+
+    def __getitem__(self, idx):
+        """Devuelve una vista del túnel idx que se comporta como un Lavadero."""
+        if not -len(self) <= idx < len(self):
+            raise IndexError("Índice de túnel fuera de rango")
+        return LavaderoFlota(self, idx % len(self))
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield LavaderoFlota(self, idx)
+
+    # ================== CONSULTAS GLOBALES ==================
+
+    @property
+    def ingresos_centimos(self):
+        """Ingresos totales de la flota en céntimos."""
+        return sum(self._ingresos)
+
+    @property
+    def ingresos_centimos_por_tunel(self):
+        """Céntimos acumulados por cada túnel (el array de la flota: no modificarlo)."""
+        return self._ingresos
+
+    @property
+    def ingresos(self):
+        """Ingresos totales de la flota en euros."""
+        return self.ingresos_centimos / 100
+
+    @property
+    def ocupados(self):
+        """Número de túneles con un lavado en curso."""
+        return self._ocupados.count(1)
+
+    # ================== CONFIGURACIÓN (RECARGA EN CALIENTE) ==================
+
+    @property
+    def configuracion(self):
+        """Configuración de los ciclos nuevos (None = precios y fases estándar)."""
+        return self._configuracion
+
+    def aplicar_configuracion(self, configuracion):
+        """
+        Cambia los precios y las fases por los de una configuración compilada
+        (ver configuracion.compilar_configuracion) sin parar la flota.
+
+        Los túneles libres pasan a la configuración nueva al momento; los
+        ocupados terminan su ciclo con la tabla con la que empezaron.
+
+        Raises:
+            RuntimeError: Si quedan túneles con 255 configuraciones anteriores pendientes
+        """
+        self._descartar_generaciones()
+        generacion = (self._generacion + 1) & 0xFF
+        if generacion in self._configuraciones:
+            raise RuntimeError("Demasiadas configuraciones pendientes de terminar su ciclo")
+
+        self._tabla_flota = _construir_tabla_flota(configuracion.tabla_transiciones)
+        self._precios_centimos = configuracion.precios_centimos
+        self._rutas = configuracion.rutas
+        self._pasos_restantes = configuracion.pasos_restantes
+        self._configuracion = configuracion
+        self._generacion = generacion
+        self._configuraciones[generacion] = _tablas_configuracion(
+            self._tabla_flota, configuracion.tabla_transiciones, configuracion.rutas,
+            configuracion.precios_centimos, configuracion.pasos_restantes, generacion)
+        self._libres_a_generacion_actual(self._ocupados)
+        self._descartar_generaciones()
+
+    def _libres_a_generacion_actual(self, ocupados):
+        """Pone la generación actual en los túneles libres (ocupados: un byte 0/1 por túnel)."""
+        n = len(self._generaciones)
+        mascara = int.from_bytes(ocupados.translate(_A_MASCARA), "little")
+        actual = int.from_bytes(bytes([self._generacion]) * n, "little")
+        generaciones = (int.from_bytes(self._generaciones, "little") & mascara) | (actual & ~mascara)
+        self._generaciones[:] = generaciones.to_bytes(n, "little")
+
+    def _descartar_generaciones(self):
+        """Olvida las tablas de configuraciones que ya no usa ningún túnel."""
+        if len(self._configuraciones) > 1:
+            en_uso = set(self._generaciones)
+            en_uso.add(self._generacion)
+            for generacion in list(self._configuraciones):
+                if generacion not in en_uso:
+                    del self._configuraciones[generacion]
+
+    # ================== INSTANTÁNEAS (REINICIO EN CALIENTE) ==================
+
+    def instantanea(self):
+        """
+        Devuelve el estado completo de la flota como bytes.
+
+        Son los arrays de la flota copiados en bloque (ingresos en
+        little-endian), así que guardar y restaurar cuesta lo mismo que copiar
+        memoria y los túneles a mitad de ciclo continúan su ruta.
+        No incluye la configuración aplicada (ver restaurar).
+        """
+        ingresos = self._ingresos
+        if sys.byteorder != "little":
+            ingresos = array("q", ingresos)
+            ingresos.byteswap()
+        return b"".join((
+            _CABECERA_INSTANTANEA.pack(_FIRMA_INSTANTANEA, VERSION_INSTANTANEA, len(self)),
+            self._fases, self._ocupados, self._opciones, ingresos.tobytes(),
+        ))
+
+    @classmethod
+    def restaurar(cls, datos, configuracion=None):
+        """
+        Crea una flota a partir de una instantánea (ver instantanea()).
+
+        La instantánea no guarda la configuración: todos los túneles siguen
+        con las tablas estándar, o con configuracion si se pasa.
+
+        Raises:
+            ValueError: Si los datos no son una instantánea válida, su versión no está
+                        soportada o algún túnel está en un estado que el ciclo no puede alcanzar
+        """
+        cabecera = _CABECERA_INSTANTANEA.size
+        if len(datos) < cabecera:
+            raise ValueError("Instantánea de flota incompleta")
+        firma, version, n = _CABECERA_INSTANTANEA.unpack_from(datos)
+        if firma != _FIRMA_INSTANTANEA:
+            raise ValueError("Los datos no son una instantánea de flota")
+        if version != VERSION_INSTANTANEA:
+            raise ValueError(f"Versión de instantánea no soportada: {version}")
+        if len(datos) != cabecera + 11 * n:
+            raise ValueError("Instantánea de flota con tamaño incorrecto")
+
+        vista = memoryview(datos)
+        flota = cls(0)
+        if configuracion is not None:
+            flota.aplicar_configuracion(configuracion)
+        flota._fases = bytearray(vista[cabecera:cabecera + n])
+        flota._ocupados = bytearray(vista[cabecera + n:cabecera + 2 * n])
+        flota._opciones = bytearray(vista[cabecera + 2 * n:cabecera + 3 * n])
+        flota._generaciones = bytearray([flota._generacion]) * n
+        flota._ingresos = array("q")
+        flota._ingresos.frombytes(vista[cabecera + 3 * n:])
+        if sys.byteorder != "little":
+            flota._ingresos.byteswap()
+
+        if (max(flota._fases, default=0) > Lavadero.FASE_ENCERADO
+                or max(flota._ocupados, default=0) > 1 or max(flota._opciones, default=0) > 7):
+            raise ValueError("Instantánea de flota con estado no válido")
+        if 0 in flota.claves_estado().translate(_estados_alcanzables(flota._pasos_restantes)):
+            raise ValueError("Instantánea de flota con túneles en un estado que el ciclo no puede alcanzar")
+        return flota
+
+    # ================== OPERACIONES POR TÚNEL ==================
+
+    def hacer_lavado(self, idx, prelavado_a_mano: bool, secado_a_mano: bool, encerado: bool):
+        """
+        Inicia un lavado en el túnel idx (mismas reglas que Lavadero.hacer_lavado).
+
+        Raises:
+            ValueError: Si el túnel está ocupado o si intenta encerar sin secado
+        """
+        Lavadero.validar_lavado(self._ocupados[idx], secado_a_mano, encerado)
+
+        codigo = Lavadero.codigo_opciones(prelavado_a_mano, secado_a_mano, encerado)
+        self._fases[idx] = Lavadero.FASE_INACTIVO
+        self._ocupados[idx] = 1
+        self._opciones[idx] = codigo
+        self._generaciones[idx] = self._generacion
+        self._ingresos[idx] += self._precios_centimos[codigo]
+
+    def terminar(self, idx):
+        """Resetea el túnel idx al modo inactivo (conserva sus ingresos)."""
+        self._fases[idx] = Lavadero.FASE_INACTIVO
+        self._ocupados[idx] = 0
+        self._opciones[idx] = 0
+        self._generaciones[idx] = self._generacion
+
+    def avanzar_fase(self, idx):
+        """Avanza una fase el túnel idx (mismas transiciones que Lavadero.avanzarFase)."""
+        if not self._ocupados[idx]:
+            return
+
+        fase = self._fases[idx]
+        transiciones = self._configuraciones[self._generaciones[idx]][_TRANSICIONES_GEN]
+        siguiente = transiciones.get((fase << 3) | self._opciones[idx])
+        if siguiente is None:
+            raise RuntimeError(f"Estado no válido: Fase {fase}. El lavadero va a estallar...")
+
+        if siguiente == Lavadero.FASE_INACTIVO:
+            self.terminar(idx)
+        else:
+            self._fases[idx] = siguiente
+
+    # ================== OPERACIONES VECTORIZADAS ==================
+
+    def claves_estado(self):
+        """Byte-clave (ocupado | fase | opciones) de cada túnel, calculado sin bucle Python."""
+        n = len(self._fases)
+        clave = (int.from_bytes(self._ocupados, "little") << 7
+                 | int.from_bytes(self._fases, "little") << 3
+                 | int.from_bytes(self._opciones, "little"))
+        return clave.to_bytes(n, "little")
+
+    def avanzar_todas(self):
+        """
+        Avanza una fase todos los túneles ocupados a la vez.
+
+        Equivale a llamar a avanzarFase en cada túnel, pero se resuelve con
+        operaciones sobre bytes completos: una traducción por tabla para las
+        fases y una máscara para resetear las opciones de los que terminan.
+
+        Returns:
+            int: Número de túneles que siguen ocupados tras el avance
+
+        Raises:
+            RuntimeError: Si algún túnel está en una fase no válida
+        """
+        n = len(self._fases)
+        if len(self._configuraciones) == 1:
+            fases = self.claves_estado().translate(self._tabla_flota)
+        else:
+            fases = self._traducir_por_generacion(self.claves_estado(), _TABLA_FLOTA_GEN)
+        if _FASE_NO_VALIDA in fases:
+            idx = fases.index(_FASE_NO_VALIDA)
+            raise RuntimeError(f"Estado no válido: Fase {self._fases[idx]}. El lavadero va a estallar...")
+
+        # Un túnel sigue ocupado si no ha vuelto a INACTIVO; si terminó, pierde sus opciones
+        ocupados = fases.translate(_A_BINARIO)
+        opciones = (int.from_bytes(self._opciones, "little")
+                    & int.from_bytes(ocupados.translate(_A_MASCARA), "little"))
+
+        self._fases[:] = fases
+        self._ocupados[:] = ocupados
+        self._opciones[:] = opciones.to_bytes(n, "little")
+        if len(self._configuraciones) > 1:
+            # Los que han terminado empiezan el siguiente ciclo con la configuración actual
+            self._libres_a_generacion_actual(ocupados)
+            self._descartar_generaciones()
+        return ocupados.count(1)
+
+    def _traducir_por_generacion(self, claves, posicion):
+        """Traduce la clave de cada túnel con la tabla (posición `posicion`) de la generación de su ciclo."""
+        n = len(claves)
+        resultado = 0
+        for tablas in self._configuraciones.values():
+            resultado |= (int.from_bytes(claves.translate(tablas[posicion]), "little")
+                          & int.from_bytes(self._generaciones.translate(tablas[_SELECCION_GEN]), "little"))
+        return resultado.to_bytes(n, "little")
+
+    # ================== TIEMPO RESTANTE ==================
+
+    def pasos_restantes(self):
+        """
+        Avances de fase que le faltan a cada túnel para terminar su ciclo (0 si está libre).
+
+        Es una única traducción por tabla sobre las claves de los túneles
+        (ver Lavadero.pasos_restantes): para 100.000 túneles, microsegundos.
+
+        Returns:
+            bytes: Un valor por túnel
+        """
+        if len(self._configuraciones) == 1:
+            return self.claves_estado().translate(self._pasos_restantes)
+        return self._traducir_por_generacion(self.claves_estado(), _PASOS_GEN)
+
+    def tiempo_restante(self, duraciones):
+        """
+        Tiempo que le falta a cada túnel para terminar su ciclo, suponiendo que
+        su fase actual acaba de empezar (ver Lavadero.tiempo_restante).
+
+        Returns:
+            list: Un tiempo por túnel, en las unidades de `duraciones`
+        """
+        claves = self.claves_estado()
+        if len(self._configuraciones) == 1:
+            return list(map(tabla_tiempo_restante(self._rutas, duraciones).__getitem__, claves))
+        tablas = {generacion: tabla_tiempo_restante(tablas[_RUTAS_GEN], duraciones)
+                  for generacion, tablas in self._configuraciones.items()}
+        return [tablas[generacion][clave] for generacion, clave in zip(self._generaciones, claves)]
+
+
+class LavaderoFlota:
+    """
+    Vista de un túnel de una FlotaLavaderos con la misma interfaz que Lavadero.
+    No guarda estado propio: lee y escribe en los arrays de la flota.
+    """
+
+    __slots__ = ("_flota", "_idx")
+
+    # Mismas constantes de fase que Lavadero
+    FASE_INACTIVO = Lavadero.FASE_INACTIVO
+    FASE_COBRANDO = Lavadero.FASE_COBRANDO
+    FASE_PRELAVADO_MANO = Lavadero.FASE_PRELAVADO_MANO
+    FASE_ECHANDO_AGUA = Lavadero.FASE_ECHANDO_AGUA
+    FASE_ENJABONANDO = Lavadero.FASE_ENJABONANDO
+    FASE_RODILLOS = Lavadero.FASE_RODILLOS
+    FASE_SECADO_AUTOMATICO = Lavadero.FASE_SECADO_AUTOMATICO
+    FASE_SECADO_MANO = Lavadero.FASE_SECADO_MANO
+    FASE_ENCERADO = Lavadero.FASE_ENCERADO
+
+    def __init__(self, flota: FlotaLavaderos, idx: int):
+        self._flota = flota
+        self._idx = idx
+
+    # ================== PROPERTIES (SOLO LECTURA) ==================
+
+    @property
+    def fase(self):
+        """Devuelve la fase actual del túnel."""
+        return self._flota._fases[self._idx]
+
+    @property
+    def ingresos(self):
+        """Devuelve los ingresos acumulados del túnel en euros."""
+        return self._flota._ingresos[self._idx] / 100
+
+    @property
+    def ingresos_centimos(self):
+        """Devuelve los ingresos acumulados del túnel en céntimos."""
+        return self._flota._ingresos[self._idx]
+
+    @property
+    def ingresos_decimal(self):
+        """Devuelve los ingresos acumulados del túnel como Decimal exacto."""
+        return Decimal(self._flota._ingresos[self._idx]).scaleb(-2)
+
+    @property
+    def ocupado(self):
+        """Devuelve True si el túnel está procesando un vehículo."""
+        return bool(self._flota._ocupados[self._idx])
+
+    @property
+    def prelavado_a_mano(self):
+        """Devuelve True si se ha seleccionado prelavado manual."""
+        return bool(self._flota._opciones[self._idx] & 1)
+
+    @property
+    def secado_a_mano(self):
+        """Devuelve True si se ha seleccionado secado manual."""
+        return bool(self._flota._opciones[self._idx] & 2)
+
+    @property
+    def encerado(self):
+        """Devuelve True si se ha seleccionado encerado."""
+        return bool(self._flota._opciones[self._idx] & 4)
+
+    # ================== OPERACIONES ==================
+
+    def terminar(self):
+        """Resetea el túnel al modo inactivo (conserva los ingresos)."""
+        self._flota.terminar(self._idx)
+
+    def hacer_lavado(self, prelavado_a_mano: bool, secado_a_mano: bool, encerado: bool):
+        """Inicia un nuevo ciclo de lavado (ver Lavadero.hacer_lavado)."""
+        self._flota.hacer_lavado(self._idx, prelavado_a_mano, secado_a_mano, encerado)
+
+    def avanzarFase(self):
+        """Avanza una fase en el ciclo de lavado (ver Lavadero.avanzarFase)."""
+        self._flota.avanzar_fase(self._idx)
+
+    def pasos_restantes(self):
+        """Avances de fase que faltan para terminar el ciclo (ver Lavadero.pasos_restantes)."""
+        flota, idx = self._flota, self._idx
+        tablas = flota._configuraciones[flota._generaciones[idx]]
+        return tablas[_PASOS_GEN][(flota._ocupados[idx] << 7) | (flota._fases[idx] << 3) | flota._opciones[idx]]
+
+    def tiempo_restante(self, duraciones):
+        """Tiempo que falta para terminar el ciclo (ver Lavadero.tiempo_restante)."""
+        flota, idx = self._flota, self._idx
+        rutas = flota._configuraciones[flota._generaciones[idx]][_RUTAS_GEN]
+        return tiempo_restante_en_ruta(rutas[flota._opciones[idx]], self.pasos_restantes(), duraciones)
+
+    def ruta_configurada(self, opciones):
+        """
+        Ruta de fases del próximo ciclo de este túnel (ver Lavadero.ruta_configurada):
+        la de la configuración actual de la flota, con la que empiezan los ciclos nuevos.
+        """
+        prelavado, secado, encerado = opciones
+        Lavadero.validar_lavado(False, secado, encerado)
+        return self._flota._rutas[Lavadero.codigo_opciones(prelavado, secado, encerado)]
+
+    def ejecutar_y_obtener_fases(self, prelavado, secado, encerado):
+        """Ejecuta un ciclo completo y devuelve la lista de fases visitadas."""
+        self.hacer_lavado(prelavado, secado, encerado)
+        ruta = self._flota._rutas[self._flota._opciones[self._idx]]
+        self.terminar()
+        return list(ruta)
@@ -0,0 +1,301 @@
+# fuzz_diferencial.py
+# Comparación diferencial de implementaciones de lavadero con secuencias de operaciones aleatorias
+# Cualquier motor nuevo debe comportarse igual que el Lavadero de referencia paso a paso
+
+import argparse
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import partial
+
+try:
+    from .flota import FlotaLavaderos
+    from .lavadero import Lavadero
+    from .lavadero_compacto import LavaderoCompacto
+    from .lavadero_concurrente import LavaderoConcurrente
+    from . import lavadero_mal
+except ImportError:
+    from flota import FlotaLavaderos
+    from lavadero import Lavadero
+    from lavadero_compacto import LavaderoCompacto
+    from lavadero_concurrente import LavaderoConcurrente
+    import lavadero_mal
+
+
+# ================== OPERACIONES ==================
+# Cada operación es un byte: 0-7 es hacer_lavado con ese código de opciones
+# (ver Lavadero.codigo_opciones), y los dos siguientes avanzarFase y terminar.
+# Una secuencia de operaciones es un objeto bytes.
+
+OP_AVANZAR = 8
+OP_TERMINAR = 9
+NUM_OPERACIONES = 10
+
+# Pesos por defecto: sobre todo avances, para que los ciclos lleguen a terminar
+PESOS_POR_DEFECTO = (3,) * 8 + (60, 16)
+
+# Opciones (prelavado, secado, encerado) de cada código
+_OPCIONES = [(bool(op & 1), bool(op & 2), bool(op & 4)) for op in range(8)]
+
+
+def describir_operacion(op):
+    """Texto legible de una operación, como se escribiría en Python."""
+    if op == OP_AVANZAR:
+        return "avanzarFase()"
+    if op == OP_TERMINAR:
+        return "terminar()"
+    return "hacer_lavado({}, {}, {})".format(*_OPCIONES[op])
+
+
+# ================== ADAPTADORES ==================
+# Dan a cada implementación la misma interfaz: aplicar(op) devuelve None o el
+# nombre del tipo de excepción, y estado() una tupla comparable.
+
+class AdaptadorLavadero:
+    """Adaptador para cualquier implementación con la interfaz de Lavadero."""
+
+    def __init__(self, fabrica=Lavadero):
+        """
+        Args:
+            fabrica: Invocable sin argumentos que crea el lavadero a probar
+        """
+        self.lavadero = fabrica()
+        # Métodos ya enlazados: se llaman millones de veces
+        self._avanzar = self.lavadero.avanzarFase
+        self._terminar = self.lavadero.terminar
+        self._hacer_lavado = self._metodo_lavado()
+
+    def _metodo_lavado(self):
+        return self.lavadero.hacer_lavado
+
+    def aplicar(self, op):
+        try:
+            if op == OP_AVANZAR:
+                self._avanzar()
+            elif op == OP_TERMINAR:
+                self._terminar()
+            else:
+                self._hacer_lavado(*_OPCIONES[op])
+        except Exception as error:
+            return type(error).__name__
+        return None
+
+    def estado(self):
+        """(fase, ocupado, prelavado, secado, encerado, ingresos en céntimos)."""
+        lavadero = self.lavadero
+        return (lavadero.fase, lavadero.ocupado, lavadero.prelavado_a_mano,
+                lavadero.secado_a_mano, lavadero.encerado, lavadero.ingresos_centimos)
+
+
+class AdaptadorLavaderoMal(AdaptadorLavadero):
+    """
+    Adaptador para lavadero_mal.Lavadero: el lavado se inicia con hacerLavado
+    y los ingresos son euros en float. Sus print se descartan si se ejecuta
+    con buscar_divergencias (la salida estándar va a os.devnull).
+    """
+
+    def __init__(self, fabrica=lavadero_mal.Lavadero):
+        super().__init__(fabrica)
+
+    def _metodo_lavado(self):
+        return self.lavadero.hacerLavado
+
+    def estado(self):
+        lavadero = self.lavadero
+        return (lavadero.fase, lavadero.ocupado, lavadero.prelavado_a_mano,
+                lavadero.secado_a_mano, lavadero.encerado, round(lavadero.ingresos * 100))
+
+
+def _tunel_de_flota():
+    """Un túnel de una flota de uno (función de módulo para poder enviarla a otros procesos)."""
+    return FlotaLavaderos(1)[0]
+
+
+# Implementaciones conocidas, por nombre (para la línea de comandos)
+CANDIDATAS = {
+    "lavadero": partial(AdaptadorLavadero, Lavadero),
+    "compacto": partial(AdaptadorLavadero, LavaderoCompacto),
+    "concurrente": partial(AdaptadorLavadero, LavaderoConcurrente),
+    "flota": partial(AdaptadorLavadero, _tunel_de_flota),
+    "mal": AdaptadorLavaderoMal,
+}
+
+
+# ================== COMPARACIÓN ==================
+
+def primera_divergencia(referencia, candidata, secuencia):
+    """
+    Ejecuta una secuencia en las dos implementaciones comparando tras cada paso.
+
+    Args:
+        referencia: Fábrica de adaptadores de la implementación de referencia
+        candidata: Fábrica de adaptadores de la implementación a comprobar
+        secuencia (bytes): Operaciones a ejecutar
+
+    Returns:
+        dict: paso, operación, resultado y estado de cada una en el primer paso
+              en que difieren, o None si se comportan igual en toda la secuencia
+    """
+    a, b = referencia(), candidata()
+    if a.estado() != b.estado():
+        return {"paso": -1, "operacion": None, "referencia": (None, a.estado()),
+                "candidata": (None, b.estado())}
+    for paso, op in enumerate(secuencia):
+        resultado_a = a.aplicar(op)
+        resultado_b = b.aplicar(op)
+        estado_a, estado_b = a.estado(), b.estado()
+        if resultado_a != resultado_b or estado_a != estado_b:
+            return {"paso": paso, "operacion": op, "referencia": (resultado_a, estado_a),
+                    "candidata": (resultado_b, estado_b)}
+    return None
+
+
+def reducir(referencia, candidata, secuencia):
+    """
+    Reduce una secuencia que diverge a un reproductor mínimo.
+
+    Primero corta la secuencia en el paso que diverge; después quita trozos
+    cada vez más pequeños (como delta debugging) mientras siga divergiendo
+    y, por último, simplifica cada hacer_lavado al código de opciones más
+    bajo que mantenga la divergencia.
+
+    Returns:
+        bytes: Secuencia mínima que sigue divergiendo
+    """
+    def diverge(candidata_secuencia):
+        return primera_divergencia(referencia, candidata, candidata_secuencia) is not None
+
+    divergencia = primera_divergencia(referencia, candidata, secuencia)
+    if divergencia is None:
+        raise ValueError("La secuencia no diverge")
+    secuencia = bytes(secuencia[:divergencia["paso"] + 1])
+
+    trozo = max(len(secuencia) // 2, 1)
+    while trozo >= 1:
+        inicio, reducida = 0, False
+        while inicio < len(secuencia):
+            prueba = secuencia[:inicio] + secuencia[inicio + trozo:]
+            if prueba and diverge(prueba):
+                secuencia, reducida = prueba, True
+            else:
+                inicio += trozo
+        if not reducida:
+            trozo //= 2
+
+    for paso, op in enumerate(secuencia):
+        for sustituta in range(op if op < OP_AVANZAR else 0):
+            prueba = secuencia[:paso] + bytes([sustituta]) + secuencia[paso + 1:]
+            if diverge(prueba):
+                secuencia = prueba
+                break
+    return secuencia
+
+
+def _buscar_en_bloque(tarea):
+    """
+    Genera y compara un bloque de secuencias; devuelve (comprobadas, primera que diverge o None).
+    Función de módulo para que ProcessPoolExecutor pueda enviarla a los procesos.
+    """
+    referencia, candidata, semilla, cantidad, longitud, pesos = tarea
+    azar = random.Random(semilla)
+    operaciones = range(NUM_OPERACIONES)
+    with open(os.devnull, "w") as nulo, redirect_stdout(nulo):
+        for i in range(cantidad):
+            secuencia = bytes(azar.choices(operaciones, pesos, k=longitud))
+            if primera_divergencia(referencia, candidata, secuencia) is not None:
+                return i + 1, secuencia
+    return cantidad, None
+
+
+def buscar_divergencias(candidata, referencia=AdaptadorLavadero, secuencias: int = 10_000,
+                        longitud: int = 40, semilla: int = 0, procesos=1, bloque: int = 2_000,
+                        pesos=PESOS_POR_DEFECTO):
+    """
+    Compara una implementación con la de referencia en muchas secuencias aleatorias.
+
+    Las secuencias se generan por bloques con semillas derivadas de `semilla`
+    y la búsqueda se detiene en el primer bloque, en orden, que diverge: el
+    resultado (también "comprobadas") es el mismo con cualquier número de
+    procesos. La salida estándar de las implementaciones se descarta.
+
+    Args:
+        candidata: Fábrica de adaptadores a comprobar (p. ej. CANDIDATAS["compacto"])
+        referencia: Fábrica de adaptadores de referencia (por defecto Lavadero)
+        secuencias (int): Número de secuencias a probar
+        longitud (int): Operaciones por secuencia
+        semilla (int): Semilla base
+        procesos (int): 1 ejecuta en el proceso actual; None usa todos los núcleos
+        bloque (int): Secuencias por tarea enviada a cada proceso
+        pesos: Peso relativo de cada operación (NUM_OPERACIONES valores)
+
+    Returns:
+        dict: secuencias comprobadas y, si alguna diverge, el reproductor
+              mínimo ("reproductor", bytes) y su divergencia; si no, None en ambos
+    """
+    tareas = []
+    for indice, inicio in enumerate(range(0, secuencias, bloque)):
+        semilla_bloque = random.Random(semilla * 1_000_003 + indice).getrandbits(64)
+        tareas.append((referencia, candidata, semilla_bloque, min(bloque, secuencias - inicio), longitud, pesos))
+
+    comprobadas, secuencia = 0, None
+    if procesos == 1:
+        for tarea in tareas:
+            cuenta, secuencia = _buscar_en_bloque(tarea)
+            comprobadas += cuenta
+            if secuencia is not None:
+                break
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            futuros = [pool.submit(_buscar_en_bloque, tarea) for tarea in tareas]
+            # Los resultados se recogen en el orden de los bloques, como en un solo proceso
+            for futuro in futuros:
+                cuenta, secuencia = futuro.result()
+                comprobadas += cuenta
+                if secuencia is not None:
+                    # Los bloques siguientes no cuentan: se cancelan los que no han empezado
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    break
+
+    if secuencia is None:
+        return {"comprobadas": comprobadas, "reproductor": None, "divergencia": None}
+    with open(os.devnull, "w") as nulo, redirect_stdout(nulo):
+        reproductor = reducir(referencia, candidata, secuencia)
+        divergencia = primera_divergencia(referencia, candidata, reproductor)
+    return {"comprobadas": comprobadas, "reproductor": reproductor, "divergencia": divergencia}
+
+
+def formatear_reproductor(reproductor, divergencia):
+    """Texto del reproductor mínimo: las operaciones y lo que devuelve cada implementación."""
+    lineas = [f"lavadero.{describir_operacion(op)}" for op in reproductor]
+    campos = "(fase, ocupado, prelavado, secado, encerado, céntimos)"
+    for nombre in ("referencia", "candidata"):
+        excepcion, estado = divergencia[nombre]
+        lineas.append(f"# {nombre}: {excepcion or 'sin excepción'}, {campos} = {estado}")
+    return "\n".join(lineas)
+
+
+# ===================== LÍNEA DE COMANDOS =====================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara una implementación de lavadero con la de referencia.")
+    parser.add_argument("candidata", choices=sorted(CANDIDATAS), help="Implementación a comprobar")
+    parser.add_argument("--secuencias", type=int, default=100_000, help="Secuencias aleatorias a probar")
+    parser.add_argument("--longitud", type=int, default=40, help="Operaciones por secuencia")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla base")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos (por defecto, todos los núcleos)")
+    args = parser.parse_args(argv)
+
+    resultado = buscar_divergencias(CANDIDATAS[args.candidata], secuencias=args.secuencias,
+                                    longitud=args.longitud, semilla=args.semilla, procesos=args.procesos)
+    if resultado["reproductor"] is None:
+        print(f"✅ {resultado['comprobadas']:,} secuencias sin divergencias")
+        return 0
+    print(f"❌ Divergencia tras {resultado['comprobadas']:,} secuencias. Reproductor mínimo:")
+    print(formatear_reproductor(resultado["reproductor"], resultado["divergencia"]))
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+# ingesta.py
+# Ingesta por flujo de volcados diarios de pedidos de lavado (CSV o NDJSON, un coche por línea)
+# Lee el fichero por bloques, valida, cobra por lotes y escribe aceptados y rechazados con memoria acotada
+
+import csv
+import json
+import os
+import time
+from operator import itemgetter
+
+try:
+    from .lavadero import Lavadero, codificar_opciones_lote
+except ImportError:
+    from lavadero import Lavadero, codificar_opciones_lote
+
+
+FORMATO_CSV = "csv"
+FORMATO_NDJSON = "ndjson"
+TAMANO_BLOQUE = 256 * 1024               # Caracteres leídos de una vez (bloques pequeños: caben en caché)
+
+# Nombres de columna / clave aceptados para cada opción
+CAMPOS = {
+    "prelavado": ("prelavado", "prelavado_a_mano"),
+    "secado": ("secado", "secado_a_mano"),
+    "encerado": ("encerado",),
+}
+
+# Código reservado para filas que no se pueden interpretar (los válidos son 0-7)
+CODIGO_FILA_NO_VALIDA = 0xFF
+MOTIVO_FILA_NO_VALIDA = "Fila no válida"
+MOTIVO_ENCERADO = "Encerado sin secado a mano no permitido"
+
+_VALORES_CSV = {"1": 1, "0": 0, "true": 1, "false": 0, "True": 1, "False": 0, "TRUE": 1, "FALSE": 0}
+_VALORES_JSON = {True: 1, False: 0}      # 1 y 0 también valen (mismo hash que True y False)
+
+# Lo que se añade a cada línea en la salida de rechazados, por código
+# (el de aceptados es el precio, que depende de la configuración del lavadero)
+_SUFIJO_RECHAZADO = [None] * 256
+_SUFIJO_RECHAZADO[4] = _SUFIJO_RECHAZADO[5] = MOTIVO_ENCERADO
+_SUFIJO_RECHAZADO[CODIGO_FILA_NO_VALIDA] = MOTIVO_FILA_NO_VALIDA
+_NO_COBRABLES = bytes([4, 5, CODIGO_FILA_NO_VALIDA])
+
+
+def detectar_formato(ruta):
+    """Deduce el formato por la extensión del fichero (.csv, .ndjson o .jsonl)."""
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".csv":
+        return FORMATO_CSV
+    if extension in (".ndjson", ".jsonl"):
+        return FORMATO_NDJSON
+    raise ValueError(f"No se reconoce el formato de {ruta}: indica formato='csv' o 'ndjson'")
+
+
+# ================== LECTURA POR BLOQUES ==================
+
+def bloques_de_lineas(fichero, tamano_bloque: int = TAMANO_BLOQUE):
+    """
+    Generador: lee el fichero de `tamano_bloque` en `tamano_bloque` caracteres
+    y entrega listas de líneas completas (sin salto de línea). La línea que
+    queda partida al final de un bloque se completa con el siguiente.
+    """
+    resto = ""
+    while True:
+        trozo = fichero.read(tamano_bloque)
+        if not trozo:
+            if resto:
+                yield resto.splitlines()
+            return
+        trozo = resto + trozo
+        corte = trozo.rfind("\n")
+        if corte == -1:
+            resto = trozo
+            continue
+        resto = trozo[corte + 1:]
+        yield trozo[:corte].splitlines()
+
+
+def _indices_csv(cabecera):
+    """Posición de cada opción en la cabecera CSV."""
+    columnas = [columna.strip().lower() for columna in next(csv.reader([cabecera]))]
+    indices = []
+    for opcion, nombres in CAMPOS.items():
+        encontrados = [columnas.index(nombre) for nombre in nombres if nombre in columnas]
+        if not encontrados:
+            raise ValueError(f"Falta la columna '{opcion}' en la cabecera CSV")
+        indices.append(encontrados[0])
+    return indices
+
+
+def _codigos_por_filas(registros, extraer):
+    """Camino lento: interpreta fila a fila y marca las que no son válidas."""
+    codigos = bytearray(len(registros))
+    for i, registro in enumerate(registros):
+        try:
+            prelavado, secado, encerado = extraer(registro)
+            codigos[i] = prelavado | secado << 1 | encerado << 2
+        except (KeyError, IndexError, TypeError, ValueError):
+            codigos[i] = CODIGO_FILA_NO_VALIDA
+    return bytes(codigos)
+
+
+def lotes_csv(bloques, indices):
+    """
+    Generador: convierte bloques de líneas CSV en (lineas, codigos).
+
+    Cada bloque se interpreta por columnas con csv y map (en C); solo si el
+    bloque tiene alguna fila no válida se repasa fila a fila.
+    """
+    extractores = [itemgetter(indice) for indice in indices]
+
+    def extraer(fila):
+        return [_VALORES_CSV[extractor(fila).strip()] for extractor in extractores]
+
+    for lineas in bloques:
+        filas = list(csv.reader(lineas))
+        try:
+            columnas = [bytes(map(_VALORES_CSV.__getitem__, map(extractor, filas))) for extractor in extractores]
+            codigos = codificar_opciones_lote(*columnas)
+        except (KeyError, IndexError):
+            codigos = _codigos_por_filas(filas, extraer)
+        yield lineas, codigos
+
+
+def lotes_ndjson(bloques):
+    """Generador: convierte bloques de líneas NDJSON en (lineas, codigos)."""
+    extractores = [itemgetter(nombres[0]) for nombres in CAMPOS.values()]
+
+    def extraer(linea):
+        objeto = json.loads(linea)
+        return [_VALORES_JSON[_campo_json(objeto, nombres)] for nombres in CAMPOS.values()]
+
+    for lineas in bloques:
+        try:
+            objetos = list(map(json.loads, lineas))
+            columnas = [bytes(map(_VALORES_JSON.__getitem__, map(extractor, objetos))) for extractor in extractores]
+            codigos = codificar_opciones_lote(*columnas)
+        except (KeyError, TypeError, ValueError):
+            codigos = _codigos_por_filas(lineas, extraer)
+        yield lineas, codigos
+
+
+def _lineas_salida(lineas, codigos, sufijos, formato):
+    """Líneas de salida (con su sufijo) de las filas cuyo código tiene sufijo."""
+    if formato == FORMATO_CSV:
+        return [linea + sufijo for linea, sufijo in zip(lineas, map(sufijos.__getitem__, codigos)) if sufijo]
+    # NDJSON: la clave se añade antes de la llave de cierre del objeto original;
+    # una línea que no es un objeto JSON se guarda entera como texto
+    return [linea.rstrip()[:-1] + sufijos[codigo] if codigo != CODIGO_FILA_NO_VALIDA else
+            json.dumps({"linea": linea, "motivo": MOTIVO_FILA_NO_VALIDA}, ensure_ascii=False) + "\n"
+            for linea, codigo in zip(lineas, codigos) if sufijos[codigo]]
+
+
+def _campo_json(objeto, nombres):
+    for nombre in nombres:
+        if nombre in objeto:
+            return objeto[nombre]
+    raise KeyError(nombres[0])
+
+
+# ================== INGESTA ==================
+
+def ingerir(ruta_entrada, ruta_aceptados, ruta_rechazados, lavadero=None, formato=None,
+            tamano_bloque: int = TAMANO_BLOQUE):
+    """
+    Procesa un volcado de pedidos completo con memoria acotada.
+
+    Cada pedido se valida con las reglas de hacer_lavado (encerado sin secado
+    a mano se rechaza; "Lavado en curso" no aplica porque los coches pasan
+    uno detrás de otro) y los aceptados se cobran por lotes con
+    Lavadero.cobrar_codigos, que da los mismos céntimos que _cobrar fila a fila.
+
+    - Aceptados: cada línea original más el precio cobrado (columna "precio"
+      en CSV, clave "precio" en NDJSON).
+    - Rechazados: cada línea original más el motivo.
+    Las líneas que no se pueden interpretar se rechazan con "Fila no válida";
+    las líneas vacías se ignoran.
+
+    Args:
+        ruta_entrada (str): Fichero de pedidos
+        ruta_aceptados (str): Fichero de salida con los pedidos cobrados
+        ruta_rechazados (str): Fichero de salida con los pedidos rechazados
+        lavadero (Lavadero): Donde se acumulan los ingresos (por defecto, uno nuevo)
+        formato (str): FORMATO_CSV o FORMATO_NDJSON (por defecto, según la extensión)
+        tamano_bloque (int): Caracteres leídos por bloque; fija la memoria usada
+
+    Returns:
+        dict: filas, aceptadas, rechazadas por motivo, ingresos_centimos,
+              aceptadas por código de opciones y segundos
+    """
+    formato = formato or detectar_formato(ruta_entrada)
+    if formato not in (FORMATO_CSV, FORMATO_NDJSON):
+        raise ValueError(f"Formato desconocido: {formato}")
+    lavadero = lavadero if lavadero is not None else Lavadero()
+
+    por_codigo = [0] * 8
+    rechazadas = {MOTIVO_ENCERADO: 0, MOTIVO_FILA_NO_VALIDA: 0}
+    ingresos = 0
+    filas = 0
+    inicio = time.perf_counter()
+
+    with open(ruta_entrada, encoding="utf-8", newline="") as entrada, \
+            open(ruta_aceptados, "w", encoding="utf-8", newline="") as aceptados, \
+            open(ruta_rechazados, "w", encoding="utf-8", newline="") as rechazados:
+        if formato == FORMATO_CSV:
+            cabecera = entrada.readline().rstrip("\r\n")
+            indices = _indices_csv(cabecera)
+            aceptados.write(f"{cabecera},precio\n")
+            rechazados.write(f"{cabecera},motivo\n")
+            lotes = lotes_csv(bloques_de_lineas(entrada, tamano_bloque), indices)
+            formato_aceptado, formato_rechazado = ",{}\n", ",{}\n"
+        else:
+            lotes = lotes_ndjson(bloques_de_lineas(entrada, tamano_bloque))
+            formato_aceptado, formato_rechazado = ',"precio":{}}}\n', ',"motivo":"{}"}}\n'
+
+        sufijos_aceptado = [None] * 256
+        for codigo, centimos in enumerate(lavadero.precios_centimos):
+            if codigo not in (4, 5):
+                sufijos_aceptado[codigo] = formato_aceptado.format(f"{centimos // 100}.{centimos % 100:02d}")
+        sufijos_rechazado = [None if s is None else formato_rechazado.format(s) for s in _SUFIJO_RECHAZADO]
+
+        for lineas, codigos in lotes:
+            if "" in lineas:
+                codigos = bytes(c for linea, c in zip(lineas, codigos) if linea)
+                lineas = [linea for linea in lineas if linea]
+            cobrables = codigos.translate(None, _NO_COBRABLES)
+            ingresos += lavadero.cobrar_codigos(cobrables)
+            for codigo in range(8):
+                por_codigo[codigo] += cobrables.count(codigo)
+            rechazadas[MOTIVO_ENCERADO] += codigos.count(4) + codigos.count(5)
+            rechazadas[MOTIVO_FILA_NO_VALIDA] += codigos.count(CODIGO_FILA_NO_VALIDA)
+            filas += len(codigos)
+
+            aceptados.write("".join(_lineas_salida(lineas, codigos, sufijos_aceptado, formato)))
+            if len(cobrables) != len(codigos):
+                rechazados.write("".join(_lineas_salida(lineas, codigos, sufijos_rechazado, formato)))
+
+    return {
+        "filas": filas,
+        "aceptadas": sum(por_codigo),
+        "rechazadas": rechazadas,
+        "ingresos_centimos": ingresos,
+        "por_codigo": por_codigo,
+        "segundos": time.perf_counter() - inicio,
+    }
@@ -0,0 +1,254 @@
+# instrumentacion.py
+# Contadores y histogramas de latencia opcionales para avanzarFase, hacer_lavado y _cobrar
+# Se activa por lavadero (Lavadero.instrumentar); desactivada solo cuesta comprobar un None
+
+import os
+import time
+from array import array
+
+try:
+    from .lavadero import Lavadero
+except ImportError:
+    from lavadero import Lavadero
+
+
+NUM_FASES = Lavadero.FASE_ENCERADO + 1
+OPERACIONES = ("avanzarFase", "hacer_lavado", "_cobrar")
+
+# Límites (en segundos) de los buckets del histograma exportado a Prometheus
+LIMITES_PROMETHEUS = (2.5e-7, 5e-7, 1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5,
+                      1e-4, 2.5e-4, 1e-3, 1e-2, 1e-1)
+
+
+# ================== HISTOGRAMA DE LATENCIAS ==================
+
+class HistogramaLatencias:
+    """
+    Histograma de latencias en nanosegundos al estilo HDR.
+
+    Los valores se agrupan por potencias de dos y cada potencia se divide en
+    2**bits_subbucket tramos iguales, así que el error relativo de cualquier
+    percentil es como mucho 1 / 2**bits_subbucket (≈3% con 5 bits) con una
+    tabla fija de contadores, sin guardar las muestras.
+    """
+
+    def __init__(self, bits_subbucket: int = 5):
+        self.bits = bits_subbucket
+        self._sub = 1 << bits_subbucket
+        self._contadores = array("q", bytes(8 * (64 - bits_subbucket) * self._sub))
+        self.total = 0
+        self.suma = 0
+        self.maximo = 0
+
+    def _indice(self, valor):
+        """Tramo en el que cae un valor (exacto por debajo de 2 * 2**bits)."""
+        desplazamiento = valor.bit_length() - self.bits - 1
+        if desplazamiento <= 0:
+            return valor
+        return desplazamiento * self._sub + (valor >> desplazamiento)
+
+    def _limite_inferior(self, indice):
+        """Menor valor que cae en el tramo `indice`."""
+        if indice < 2 * self._sub:
+            return indice
+        desplazamiento = indice // self._sub - 1
+        return (indice - desplazamiento * self._sub) << desplazamiento
+
+    def registrar(self, nanosegundos: int):
+        """Añade una muestra."""
+        if nanosegundos < 0:
+            nanosegundos = 0
+        self._contadores[self._indice(nanosegundos)] += 1
+        self.total += 1
+        self.suma += nanosegundos
+        if nanosegundos > self.maximo:
+            self.maximo = nanosegundos
+
+    def percentil(self, p: float) -> int:
+        """
+        Devuelve el valor (ns) por debajo del cual está el p por ciento de las muestras.
+
+        Se devuelve el límite inferior del tramo, nunca más que el máximo
+        observado; el percentil 100 es el máximo exacto.
+        """
+        if not self.total:
+            return 0
+        if p >= 100:
+            return self.maximo
+        objetivo = max(1, -(-self.total * p // 100))
+        acumulado = 0
+        for indice, cuenta in enumerate(self._contadores):
+            acumulado += cuenta
+            if acumulado >= objetivo:
+                return min(self._limite_inferior(indice), self.maximo)
+        return self.maximo
+
+    def media(self) -> float:
+        """Latencia media en nanosegundos."""
+        return self.suma / self.total if self.total else 0.0
+
+    def tramos(self):
+        """Recorre los tramos no vacíos como (límite inferior en ns, cuenta)."""
+        for indice, cuenta in enumerate(self._contadores):
+            if cuenta:
+                yield self._limite_inferior(indice), cuenta
+
+    def fusionar(self, otro):
+        """Suma a este histograma las muestras de otro con la misma resolución."""
+        if otro.bits != self.bits:
+            raise ValueError("Los histogramas tienen distinta resolución")
+        for indice, cuenta in enumerate(otro._contadores):
+            if cuenta:
+                self._contadores[indice] += cuenta
+        self.total += otro.total
+        self.suma += otro.suma
+        self.maximo = max(self.maximo, otro.maximo)
+
+
+# ================== INSTRUMENTACIÓN ==================
+
+class Instrumentacion:
+    """
+    Métricas de uno o varios lavaderos.
+
+    instrumentar(lavadero) hace que ese lavadero avise de cada avance de
+    fase, lavado, cobro y rechazo; desinstrumentar() lo desactiva. Sin
+    instrumentación el lavadero solo comprueba un atributo a None (ver
+    benchmarks/bench_instrumentacion.py). Los contadores no están
+    protegidos con cerrojos: con LavaderoConcurrente conviene usar una
+    Instrumentacion por lavadero o por hilo y fusionarlas después.
+
+    Métricas:
+    - entradas_fase: veces que se ha entrado en cada fase (índice = FASE_*)
+    - rechazos: lavados rechazados por motivo (texto del ValueError)
+    - latencias: un HistogramaLatencias por operación
+    """
+
+    def __init__(self, reloj=time.perf_counter_ns, bits_subbucket: int = 5):
+        self.reloj = reloj
+        self.entradas_fase = [0] * NUM_FASES
+        self.rechazos = {}
+        self.latencias = {operacion: HistogramaLatencias(bits_subbucket) for operacion in OPERACIONES}
+        self._latencia_avance = self.latencias["avanzarFase"].registrar
+        self._latencia_lavado = self.latencias["hacer_lavado"].registrar
+        self._latencia_cobro = self.latencias["_cobrar"].registrar
+
+    # ================== ACTIVAR / DESACTIVAR ==================
+
+    def instrumentar(self, lavadero):
+        """Empieza a medir un lavadero (ver Lavadero.instrumentar); devuelve el mismo lavadero."""
+        lavadero.instrumentar(self)
+        return lavadero
+
+    @staticmethod
+    def desinstrumentar(lavadero):
+        """Deja de medir un lavadero; devuelve el mismo lavadero."""
+        lavadero.instrumentar(None)
+        return lavadero
+
+    # ================== MEDICIONES (llamadas desde Lavadero) ==================
+
+    def registrar_avance(self, fase, inicio):
+        """Un avance de fase que empezó en `inicio` (ns) ha entrado en `fase`."""
+        self.entradas_fase[fase] += 1
+        self._latencia_avance(self.reloj() - inicio)
+
+    def registrar_lavado(self, inicio):
+        """Un hacer_lavado aceptado que empezó en `inicio` (ns) ha terminado."""
+        self._latencia_lavado(self.reloj() - inicio)
+
+    def medir_cobro(self, cobrar):
+        """Llama a `cobrar` midiendo cuánto tarda; devuelve su resultado."""
+        inicio = self.reloj()
+        precio = cobrar()
+        self._latencia_cobro(self.reloj() - inicio)
+        return precio
+
+    def contar_rechazo(self, motivo):
+        """Cuenta un lavado rechazado por `motivo`."""
+        self.rechazos[motivo] = self.rechazos.get(motivo, 0) + 1
+
+    def contar_ruta(self, ruta):
+        """Cuenta las fases de un ciclo completo (ejecutar_y_obtener_fases no pasa por avanzarFase)."""
+        entradas = self.entradas_fase
+        for fase in ruta[1:]:
+            entradas[fase] += 1
+
+    # ================== EXPORTACIÓN ==================
+
+    def fusionar(self, otra):
+        """Suma a esta instrumentación las métricas de otra."""
+        for fase, cuenta in enumerate(otra.entradas_fase):
+            self.entradas_fase[fase] += cuenta
+        for motivo, cuenta in otra.rechazos.items():
+            self.rechazos[motivo] = self.rechazos.get(motivo, 0) + cuenta
+        for operacion, histograma in otra.latencias.items():
+            self.latencias[operacion].fusionar(histograma)
+
+    def como_dict(self):
+        """
+        Instantánea de las métricas como dict (copia, se puede serializar a JSON).
+
+        Las latencias se dan en nanosegundos: total, media, p50, p90, p99 y máximo.
+        """
+        return {
+            "entradas_fase": list(self.entradas_fase),
+            "rechazos": dict(self.rechazos),
+            "latencias_ns": {
+                operacion: {
+                    "total": histograma.total,
+                    "media": histograma.media(),
+                    "p50": histograma.percentil(50),
+                    "p90": histograma.percentil(90),
+                    "p99": histograma.percentil(99),
+                    "maximo": histograma.maximo,
+                }
+                for operacion, histograma in self.latencias.items()
+            },
+        }
+
+    def a_prometheus(self, prefijo: str = "lavadero") -> str:
+        """Devuelve las métricas en el formato de texto de Prometheus."""
+        lineas = [
+            f"# HELP {prefijo}_entradas_fase_total Veces que se ha entrado en cada fase",
+            f"# TYPE {prefijo}_entradas_fase_total counter",
+        ]
+        for fase, cuenta in enumerate(self.entradas_fase):
+            lineas.append(f'{prefijo}_entradas_fase_total{{fase="{fase}"}} {cuenta}')
+
+        lineas += [
+            f"# HELP {prefijo}_rechazos_total Lavados rechazados por motivo",
+            f"# TYPE {prefijo}_rechazos_total counter",
+        ]
+        for motivo, cuenta in sorted(self.rechazos.items()):
+            etiqueta = motivo.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            lineas.append(f'{prefijo}_rechazos_total{{motivo="{etiqueta}"}} {cuenta}')
+
+        lineas += [
+            f"# HELP {prefijo}_latencia_segundos Latencia de las operaciones del lavadero",
+            f"# TYPE {prefijo}_latencia_segundos histogram",
+        ]
+        for operacion, histograma in self.latencias.items():
+            acumulados = [0] * len(LIMITES_PROMETHEUS)
+            for inferior, cuenta in histograma.tramos():
+                for i, limite in enumerate(LIMITES_PROMETHEUS):
+                    if inferior <= limite * 1e9:
+                        acumulados[i] += cuenta
+            for limite, cuenta in zip(LIMITES_PROMETHEUS, acumulados):
+                lineas.append(f'{prefijo}_latencia_segundos_bucket{{operacion="{operacion}",le="{limite:g}"}} {cuenta}')
+            lineas.append(f'{prefijo}_latencia_segundos_bucket{{operacion="{operacion}",le="+Inf"}} {histograma.total}')
+            lineas.append(f'{prefijo}_latencia_segundos_sum{{operacion="{operacion}"}} {histograma.suma / 1e9:.9f}')
+            lineas.append(f'{prefijo}_latencia_segundos_count{{operacion="{operacion}"}} {histograma.total}')
+        return "\n".join(lineas) + "\n"
+
+    def escribir_prometheus(self, ruta, prefijo: str = "lavadero"):
+        """
+        Escribe las métricas en `ruta` para el colector de ficheros de texto.
+
+        Se escribe en un fichero temporal y se renombra, para que el colector
+        nunca lea un fichero a medias.
+        """
+        temporal = f"{ruta}.tmp"
+        with open(temporal, "w", encoding="utf-8") as fichero:
+            fichero.write(self.a_prometheus(prefijo))
+        os.replace(temporal, ruta)
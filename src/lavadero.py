@@ -2,6 +2,31 @@
 # Clase que simula el funcionamiento de un túnel de lavado de coches
 # con diferentes fases, opciones de servicio y gestión de ingresos
 
+import struct
+from array import array
+from decimal import Decimal
+
+try:
+    from .render import etiqueta_fase, render_estado
+except ImportError:
+    from render import etiqueta_fase, render_estado
+
+# Formato binario de las instantáneas (ver Lavadero.instantanea):
+# firma, versión, fase, estado (código de opciones | ocupado << 3), ingresos en céntimos
+_INSTANTANEA = struct.Struct("<4sBBBq")
+_FIRMA_INSTANTANEA = b"LAVS"
+VERSION_INSTANTANEA = 1
+
+# Tipos de evento que emite un lavadero a sus oyentes (ver Lavadero.suscribir).
+# Cada evento es una tupla (tipo, lavadero, dato1, dato2):
+#   (EVENTO_FASE, lavadero, fase_anterior, fase_nueva)
+#   (EVENTO_COBRO, lavadero, codigo_opciones, precio_centimos)
+#   (EVENTO_RECHAZO, lavadero, mensaje_del_error, None)
+EVENTO_FASE = "fase"
+EVENTO_COBRO = "cobro"
+EVENTO_RECHAZO = "rechazo"
+
+
 class Lavadero:
     """
     Simula el estado y las operaciones de un túnel de lavado de coches.
@@ -20,22 +45,42 @@ class Lavadero:
     FASE_SECADO_MANO = 7                 # Secado manual por personal
     FASE_ENCERADO = 8                    # Aplicación de cera/encerado al vehículo
 
-    def __init__(self):
+    # ================== TABLAS EN USO ==================
+    # Las instancias leen de la clase las tablas estándar (se rellenan al final
+    # del módulo con _usar_tablas_estandar) y solo guardan las suyas al aplicar
+    # una configuración (ver aplicar_configuracion y configuracion.py): así un
+    # lavadero sin configuración no lleva siete referencias más en su __dict__.
+    __transiciones = None
+    __rutas = None
+    __pasos_restantes = None
+    _precios_centimos = None
+    _precios = None
+    __configuracion = None                   # None = configuración estándar
+    __configuracion_pendiente = None         # Se aplica al terminar el ciclo en curso
+
+    def __init__(self, diario=None):
         """
         Constructor de la clase Lavadero.
         Inicializa todos los atributos privados al estado inicial:
-        - ingresos: 0€ (no hay dinero acumulado)
+        - ingresos: 0 céntimos (no hay dinero acumulado)
         - fase: INACTIVO (lavadero en reposo)
         - ocupado: False (no hay vehículo procesándose)
         - opciones de servicio: todas False (no hay servicios adicionales)
+
+        Args:
+            diario: Opcional. Objeto con un método registrar(mascara, precio_centimos)
+                    al que se avisa de cada lavado aceptado (ver diario.DiarioEscritor)
         """
-        self.__ingresos = 0.0                      # Dinero acumulado en euros
+        self.__ingresos_centimos = 0               # Dinero acumulado en céntimos (entero exacto)
         self.__fase = self.FASE_INACTIVO          # Fase actual del proceso
         self.__ocupado = False                     # Indica si hay un vehículo en procesamiento
         self.__prelavado_a_mano = False           # Opción: prelavado manual
         self.__secado_a_mano = False              # Opción: secado manual
         self.__encerado = False                   # Opción: aplicar cera
-
+        self.__codigo_opciones = 0                # Las tres opciones empaquetadas en 3 bits
+        self.__diario = diario                    # Registro persistente de cobros (opcional)
+        self.__oyentes = None                     # Oyentes de eventos (None = ninguno, coste cero)
+        self.__metricas = None                    # Instrumentación (None = desactivada, coste cero)
     # ================== PROPERTIES (SOLO LECTURA) ==================
     # Propiedades que permiten acceder a los atributos privados de forma controlada
     # Sin permitir modificación directa desde fuera de la clase
@@ -47,8 +92,21 @@ class Lavadero:
 
     @property
     def ingresos(self):
-        """Devuelve los ingresos acumulados en euros."""
-        return self.__ingresos
+        """
+        Devuelve los ingresos acumulados en euros (float).
+        Se calcula desde los céntimos exactos, así que no arrastra errores de redondeo.
+        """
+        return self.ingresos_centimos / 100
+
+    @property
+    def ingresos_centimos(self):
+        """Devuelve los ingresos acumulados en céntimos (entero exacto)."""
+        return self.__ingresos_centimos
+
+    @property
+    def ingresos_decimal(self):
+        """Devuelve los ingresos acumulados en euros como Decimal exacto (p. ej. Decimal('13.70'))."""
+        return Decimal(self.ingresos_centimos).scaleb(-2)
 
     @property
     def ocupado(self):
@@ -70,6 +128,104 @@ class Lavadero:
         """Devuelve True si se ha seleccionado encerado."""
         return self.__encerado
 
+    @property
+    def _codigo_actual(self):
+        """Código de opciones (0-7) del ciclo en curso, para las subclases."""
+        return self.__codigo_opciones
+
+    # ================== EVENTOS ==================
+
+    def suscribir(self, oyente):
+        """
+        Añade un oyente que recibirá cada evento del lavadero.
+
+        El oyente es cualquier invocable que acepte una tupla de evento
+        (ver EVENTO_FASE, EVENTO_COBRO y EVENTO_RECHAZO); los sumideros del
+        módulo eventos.py sirven directamente. Sin oyentes, el único coste
+        en el camino caliente es comprobar un atributo a None.
+        """
+        if self.__oyentes is None:
+            self.__oyentes = []
+        self.__oyentes.append(oyente)
+
+    def desuscribir(self, oyente):
+        """Quita un oyente añadido con suscribir()."""
+        if self.__oyentes is None or oyente not in self.__oyentes:
+            raise ValueError("El oyente no está suscrito")
+        self.__oyentes.remove(oyente)
+        if not self.__oyentes:
+            self.__oyentes = None
+
+    def _emitir(self, evento):
+        """Entrega un evento a todos los oyentes suscritos."""
+        for oyente in self.__oyentes:
+            oyente(evento)
+
+    def instrumentar(self, metricas):
+        """
+        Activa la medición de avanzarFase, hacer_lavado y _cobrar.
+
+        Args:
+            metricas: Objeto que recibe las mediciones (ver
+                      instrumentacion.Instrumentacion), o None para desactivarla
+        """
+        self.__metricas = metricas
+
+    # ================== CONFIGURACIÓN ==================
+
+    @property
+    def configuracion(self):
+        """Configuración aplicada (None = precios y fases estándar de la clase)."""
+        return self.__configuracion
+
+    @property
+    def precios(self):
+        """Precio en euros de cada código de opciones (ver codigo_opciones) con la configuración aplicada."""
+        return self._precios
+
+    @property
+    def precios_centimos(self):
+        """Precio en céntimos de cada código de opciones con la configuración aplicada."""
+        return self._precios_centimos
+
+    def aplicar_configuracion(self, configuracion):
+        """
+        Cambia los precios y las fases por los de una configuración compilada
+        (ver configuracion.compilar_configuracion).
+
+        Un ciclo en curso termina con la configuración con la que empezó: en
+        ese caso el cambio queda pendiente y se aplica al terminar el ciclo.
+
+        Args:
+            configuracion: Configuración compilada
+
+        Returns:
+            bool: True si ya está aplicada, False si queda pendiente del ciclo en curso
+        """
+        if self.__ocupado:
+            self.__configuracion_pendiente = configuracion
+            return False
+        self.__usar_configuracion(configuracion)
+        return True
+
+    @classmethod
+    def _usar_tablas_estandar(cls):
+        """Instala en la clase las tablas por defecto que leen las instancias sin configuración."""
+        cls.__transiciones = cls._TABLA_TRANSICIONES
+        cls.__rutas = cls._RUTAS
+        cls.__pasos_restantes = cls._PASOS_RESTANTES
+        cls._precios_centimos = cls._PRECIOS_CENTIMOS
+        cls._precios = cls._PRECIOS
+
+    def __usar_configuracion(self, configuracion):
+        self.__transiciones = configuracion.tabla_transiciones
+        self.__rutas = configuracion.rutas
+        self.__pasos_restantes = configuracion.pasos_restantes
+        self._precios_centimos = configuracion.precios_centimos
+        self._precios = configuracion.precios
+        self.__configuracion = configuracion
+        self.__configuracion_pendiente = None
+
     # ================== CONTROL DE ESTADO ==================
 
     def terminar(self):
@@ -84,6 +240,24 @@ class Lavadero:
         self.__prelavado_a_mano = False           # Resetear opciones
         self.__secado_a_mano = False
         self.__encerado = False
+        self.__codigo_opciones = 0
+        if self.__configuracion_pendiente is not None:
+            self.__usar_configuracion(self.__configuracion_pendiente)
+
+    @staticmethod
+    def codigo_opciones(prelavado_a_mano, secado_a_mano, encerado):
+        """
+        Empaqueta las tres opciones de servicio en un código de 3 bits (0-7).
+
+        - bit 0: prelavado a mano
+        - bit 1: secado a mano
+        - bit 2: encerado
+
+        Es el índice que usan las tablas precompiladas del lavadero.
+        """
+        return (bool(prelavado_a_mano)
+                | bool(secado_a_mano) << 1
+                | bool(encerado) << 2)
 
     # ================== INICIO DEL LAVADO ==================
 
@@ -112,14 +286,19 @@ class Lavadero:
         Raises:
             ValueError: Si el lavadero está ocupado o si intenta encerar sin secado
         """
-        # VALIDACIÓN 1: Comprobar si ya hay un lavado en curso
-        if self.__ocupado:
-            raise ValueError("Lavado en curso")
-
-        # VALIDACIÓN 2: Comprobar regla de negocio sobre encerado y secado
-        # No se puede encerar si no hay secado manual
-        if not secado_a_mano and encerado:
-            raise ValueError("Encerado sin secado a mano no permitido")
+        metricas = self.__metricas
+        if metricas is not None:
+            inicio = metricas.reloj()
+
+        # VALIDACIÓN: lavado en curso y regla de encerado sin secado
+        try:
+            self.validar_lavado(self.__ocupado, secado_a_mano, encerado)
+        except ValueError as error:
+            if metricas is not None:
+                metricas.contar_rechazo(str(error))
+            if self.__oyentes is not None:
+                self._emitir((EVENTO_RECHAZO, self, str(error), None))
+            raise
 
         # CONFIGURAR EL NUEVO CICLO
         self.__fase = self.FASE_INACTIVO          # Comenzar en fase inactiva
@@ -127,9 +306,42 @@ class Lavadero:
         self.__prelavado_a_mano = prelavado_a_mano    # Guardar opciones
         self.__secado_a_mano = secado_a_mano
         self.__encerado = encerado
+        # Mismo código que codigo_opciones, sin la llamada (camino caliente)
+        self.__codigo_opciones = (1 if prelavado_a_mano else 0) | (2 if secado_a_mano else 0) | (4 if encerado else 0)
 
         # COBRAR EL SERVICIO
-        self._cobrar()
+        if metricas is None:
+            self._cobrar()
+        else:
+            metricas.medir_cobro(self._cobrar)
+
+        # DEJAR CONSTANCIA EN EL DIARIO Y AVISAR A LOS OYENTES (si los hay)
+        if self.__diario is not None:
+            self.__diario.registrar(self.__codigo_opciones, self._precios_centimos[self.__codigo_opciones])
+        if self.__oyentes is not None:
+            self._emitir((EVENTO_COBRO, self, self.__codigo_opciones,
+                          self._precios_centimos[self.__codigo_opciones]))
+        if metricas is not None:
+            metricas.registrar_lavado(inicio)
+
+    @staticmethod
+    def validar_lavado(ocupado, secado_a_mano, encerado):
+        """
+        Reglas de negocio para iniciar un lavado, compartidas por todas las
+        variantes de lavadero (ver hacer_lavado).
+
+        Raises:
+            ValueError: "Lavado en curso" si ya hay un vehículo, o
+                        "Encerado sin secado a mano no permitido"
+        """
+        # VALIDACIÓN 1: Comprobar si ya hay un lavado en curso
+        if ocupado:
+            raise ValueError("Lavado en curso")
+
+        # VALIDACIÓN 2: Comprobar regla de negocio sobre encerado y secado
+        # No se puede encerar si no hay secado manual
+        if not secado_a_mano and encerado:
+            raise ValueError("Encerado sin secado a mano no permitido")
 
     # ================== COBRO ==================
 
@@ -153,21 +365,72 @@ class Lavadero:
         Returns:
             float: El coste del lavado actual (antes de añadirse a ingresos)
         """
-        # Precio base del lavado automático
-        coste_lavado = 5.00
+        # Precio ya calculado para esta combinación de opciones
+        # (ver _precio_lavado al final del módulo, o la configuración aplicada)
+        coste_lavado = self._precios[self.__codigo_opciones]
 
-        # Añadir opcionales según lo seleccionado
-        if self.__prelavado_a_mano:
-            coste_lavado += 1.50
-        if self.__secado_a_mano:
-            coste_lavado += 1.00
-        if self.__encerado:
-            coste_lavado += 1.20
-
-        # Acumular ingresos (importante: los ingresos persisten entre ciclos)
-        self.__ingresos += coste_lavado
+        # Acumular ingresos en céntimos enteros: la suma es exacta aunque
+        # se acumulen millones de lavados (importante: persisten entre ciclos)
+        self.__ingresos_centimos += self._precios_centimos[self.__codigo_opciones]
         return coste_lavado
 
+    def cobrar_lote(self, prelavado, secado, encerado):
+        """
+        Cobra de una vez un lote de lavados descritos por tres arrays de opciones.
+
+        Cada posición i de los arrays es un vehículo con las opciones
+        (prelavado[i], secado[i], encerado[i]). Se aceptan listas de booleanos
+        o cualquier objeto con protocolo de buffer (array.array, bytes,
+        arrays de NumPy...). El precio de cada fila es exactamente el que
+        cobraría hacer_lavado con esas opciones.
+
+        La regla de encerado sin secado se valida para todo el lote antes de
+        cobrar nada: si una sola fila la incumple, no se cobra ninguna.
+        No depende del estado del túnel (ocupado o no): es un cobro contable.
+
+        Args:
+            prelavado: Array de opciones de prelavado a mano
+            secado: Array de opciones de secado a mano
+            encerado: Array de opciones de encerado
+
+        Returns:
+            array.array: Precio de cada vehículo en euros (tipo 'd')
+
+        Raises:
+            ValueError: Si los arrays no tienen la misma longitud o alguna
+                        fila pide encerado sin secado a mano
+        """
+        codigos = codificar_opciones_lote(prelavado, secado, encerado)
+        self.cobrar_codigos(codigos)
+        return array("d", map(self._precios.__getitem__, codigos))
+
+    def cobrar_codigos(self, codigos):
+        """
+        Cobra un lote ya codificado (un código de opciones 0-7 por vehículo,
+        ver codificar_opciones_lote). Mismas reglas que cobrar_lote.
+
+        Args:
+            codigos (bytes): Código de opciones de cada vehículo
+
+        Returns:
+            int: Total cobrado en céntimos
+
+        Raises:
+            ValueError: Si algún código pide encerado sin secado a mano o no es válido
+        """
+        # VALIDACIÓN: los códigos 4 y 5 son encerado sin secado a mano
+        fila = _primera_fila_no_permitida(codigos)
+        if fila is not None:
+            raise ValueError(f"Encerado sin secado a mano no permitido (fila {fila})")
+
+        # Total por conteo de cada combinación: 8 pasadas en C en vez de un bucle Python
+        conteos = [codigos.count(codigo) for codigo in range(8)]
+        if sum(conteos) != len(codigos):
+            raise ValueError("Código de opciones no válido en el lote")
+        total = sum(cuenta * centimos for cuenta, centimos in zip(conteos, self._precios_centimos))
+        self.__ingresos_centimos += total
+        return total
+
     # ================== AVANCE DE FASES ==================
 
     def avanzarFase(self):
@@ -189,99 +452,188 @@ class Lavadero:
         3. Con secado [0, 1, 3, 4, 5, 7, 0] (salta a 7 en lugar de 6)
         4. Con secado + encerado [0, 1, 3, 4, 5, 7, 8, 0] (añade fase 8)
         
+        Las reglas de transición no se evalúan en cada paso: están precompiladas
+        en una tabla (ver _construir_transiciones al final del módulo) y cada
+        avance es una única consulta por (fase, código de opciones).
+
         Cuando se termina el ciclo, llama automáticamente a terminar() para resetear.
         """
         # Si no hay vehículo en procesamiento, no avanzar
         if not self.__ocupado:
             return
+        if self.__metricas is not None or self.__oyentes is not None:
+            self.__avanzar_observado()
+            return
 
-        # MÁQUINA DE ESTADOS: Transición según la fase actual
-        if self.__fase == self.FASE_INACTIVO:
-            # Inicio: pasar a cobrando (el cobro ya se hizo en hacer_lavado)
-            self.__fase = self.FASE_COBRANDO
-
-        elif self.__fase == self.FASE_COBRANDO:
-            # Después de cobrar: ¿hay prelavado?
-            if self.__prelavado_a_mano:
-                self.__fase = self.FASE_PRELAVADO_MANO  # Sí: hacer prelavado
-            else:
-                self.__fase = self.FASE_ECHANDO_AGUA    # No: ir directamente al agua
-
-        elif self.__fase == self.FASE_PRELAVADO_MANO:
-            # Después del prelavado: ir al agua
-            self.__fase = self.FASE_ECHANDO_AGUA
-
-        elif self.__fase == self.FASE_ECHANDO_AGUA:
-            # Después del agua: enjabonar
-            self.__fase = self.FASE_ENJABONANDO
-
-        elif self.__fase == self.FASE_ENJABONANDO:
-            # Después de enjabonar: pasar rodillos
-            self.__fase = self.FASE_RODILLOS
-
-        elif self.__fase == self.FASE_RODILLOS:
-            # Después de rodillos: ¿hay secado manual?
-            if self.__secado_a_mano:
-                self.__fase = self.FASE_SECADO_MANO    # Sí: secado a mano
-            else:
-                self.__fase = self.FASE_SECADO_AUTOMATICO  # No: secado automático
-
-        elif self.__fase == self.FASE_SECADO_AUTOMATICO:
-            # Secado automático es la última fase sin opcionales
-            self.terminar()  # Finish: volver a inactivo
-
-        elif self.__fase == self.FASE_SECADO_MANO:
-            # Después del secado manual: ¿hay encerado?
-            if self.__encerado:
-                self.__fase = self.FASE_ENCERADO       # Sí: aplicar cera
-            else:
-                self.terminar()                        # No: fin del ciclo
-
-        elif self.__fase == self.FASE_ENCERADO:
-            # Encerado es la última fase
-            self.terminar()  # Fin del ciclo
+        # MÁQUINA DE ESTADOS: una única consulta en la tabla precompilada
+        # (clave = fase * 8 + código de opciones, ver _construir_transiciones)
+        siguiente = self.__transiciones.get((self.__fase << 3) | self.__codigo_opciones)
 
-        else:
+        if siguiente is None:
             # Estado inválido (nunca debería llegar aquí)
             raise RuntimeError(f"Estado no válido: Fase {self.__fase}. El lavadero va a estallar...")
 
+        if siguiente == self.FASE_INACTIVO:
+            self.terminar()  # Fin del ciclo: volver a inactivo
+        else:
+            self.__fase = siguiente
+
+    def __avanzar_observado(self):
+        """avanzarFase con instrumentación u oyentes activos (fuera del camino caliente)."""
+        metricas = self.__metricas
+        if metricas is not None:
+            inicio = metricas.reloj()
+
+        anterior = self.__fase
+        siguiente = self.__transiciones.get((anterior << 3) | self.__codigo_opciones)
+        if siguiente is None:
+            raise RuntimeError(f"Estado no válido: Fase {anterior}. El lavadero va a estallar...")
+
+        if siguiente == self.FASE_INACTIVO:
+            self.terminar()
+        else:
+            self.__fase = siguiente
+
+        if self.__oyentes is not None:
+            self._emitir((EVENTO_FASE, self, anterior, siguiente))
+        if metricas is not None:
+            metricas.registrar_avance(siguiente, inicio)
+
+    # ================== TIEMPO RESTANTE ==================
+
+    def pasos_restantes(self):
+        """
+        Devuelve cuántas llamadas a avanzarFase faltan para que termine el ciclo
+        en curso (0 si el lavadero está libre).
+
+        Es una consulta en una tabla precalculada por (ocupado, fase, opciones),
+        sin clonar el lavadero ni simular el resto del ciclo.
+        """
+        return self.__pasos_restantes[(self.__ocupado << 7) | (self.__fase << 3) | self.__codigo_opciones]
+
+    def tiempo_restante(self, duraciones):
+        """
+        Devuelve el tiempo que falta para que termine el ciclo en curso,
+        suponiendo que la fase actual acaba de empezar (0 si está libre).
+
+        Args:
+            duraciones (dict): Duración de cada fase {FASE_*: tiempo}; las que
+                               falten cuentan como 0 (ver simulacion_eventos.DURACIONES_POR_DEFECTO)
+
+        Returns:
+            El tiempo restante, en las unidades de `duraciones`
+        """
+        codigo = self.__codigo_opciones
+        pasos = self.__pasos_restantes[(self.__ocupado << 7) | (self.__fase << 3) | codigo]
+        return tiempo_restante_en_ruta(self.__rutas[codigo], pasos, duraciones)
+
+    @staticmethod
+    def siguiente_fase(fase, prelavado_a_mano, secado_a_mano, encerado):
+        """
+        Devuelve la fase a la que pasaría el lavadero desde `fase` con las opciones dadas.
+
+        Consulta la tabla de transiciones precompilada, sin crear ni modificar
+        ningún lavadero. Devolver FASE_INACTIVO significa que el ciclo termina.
+
+        Args:
+            fase (int): Fase actual (una de las constantes FASE_*)
+            prelavado_a_mano (bool): Opción de prelavado manual
+            secado_a_mano (bool): Opción de secado manual
+            encerado (bool): Opción de encerado
+
+        Returns:
+            int: La fase siguiente
+
+        Raises:
+            RuntimeError: Si la fase no es válida
+        """
+        siguiente = Lavadero.TRANSICIONES.get(
+            (fase, bool(prelavado_a_mano), bool(secado_a_mano), bool(encerado)))
+        if siguiente is None:
+            raise RuntimeError(f"Estado no válido: Fase {fase}. El lavadero va a estallar...")
+        return siguiente
+
+    # ================== INSTANTÁNEAS (REINICIO EN CALIENTE) ==================
+
+    def instantanea(self):
+        """
+        Devuelve el estado completo del lavadero en 15 bytes.
+
+        Incluye fase, ocupado, opciones e ingresos, así que un lavadero
+        restaurado a mitad de ciclo continúa la misma ruta con avanzarFase.
+        No incluye la configuración aplicada (ver restaurar).
+        """
+        estado = self.__codigo_opciones | (self.__ocupado << 3)
+        return _INSTANTANEA.pack(_FIRMA_INSTANTANEA, VERSION_INSTANTANEA,
+                                 self.__fase, estado, self.ingresos_centimos)
+
+    @classmethod
+    def restaurar(cls, datos, diario=None, configuracion=None):
+        """
+        Crea un lavadero a partir de una instantánea (ver instantanea()).
+
+        La instantánea no guarda la configuración: un lavadero que tenía una
+        aplicada se restaura con las tablas estándar salvo que se pase aquí
+        la misma configuración, que se aplica antes de recuperar el estado.
+
+        Args:
+            datos (bytes): Instantánea generada por instantanea()
+            diario: Diario opcional para el lavadero restaurado
+            configuracion: Configuración compilada con la que seguir (por defecto la estándar)
+
+        Returns:
+            Lavadero: Nuevo lavadero en el mismo estado que el original
+
+        Raises:
+            ValueError: Si los datos no son una instantánea válida, su versión no está
+                        soportada o el estado no es alcanzable con esa configuración
+        """
+        if len(datos) != _INSTANTANEA.size:
+            raise ValueError("Instantánea de lavadero con tamaño incorrecto")
+        firma, version, fase, estado, ingresos = _INSTANTANEA.unpack(datos)
+        if firma != _FIRMA_INSTANTANEA:
+            raise ValueError("Los datos no son una instantánea de lavadero")
+        if version != VERSION_INSTANTANEA:
+            raise ValueError(f"Versión de instantánea no soportada: {version}")
+        if fase > cls.FASE_ENCERADO or estado > 0x0F:
+            raise ValueError("Instantánea de lavadero con estado no válido")
+
+        lavadero = cls(diario)
+        if configuracion is not None:
+            lavadero.aplicar_configuracion(configuracion)
+        # Libre solo es alcanzable con clave 0; ocupado, con la fase en la ruta de sus
+        # opciones, que es justo donde la tabla de pasos restantes no vale 0
+        codigo = estado & 0x07
+        clave = (estado & 0x08) << 4 | fase << 3 | codigo
+        if clave and not lavadero.__pasos_restantes[clave]:
+            raise ValueError("Instantánea de lavadero con un estado que el ciclo no puede alcanzar")
+
+        lavadero.__fase = fase
+        lavadero.__ocupado = bool(estado & 0x08)
+        lavadero.__prelavado_a_mano = bool(codigo & 1)
+        lavadero.__secado_a_mano = bool(codigo & 2)
+        lavadero.__encerado = bool(codigo & 4)
+        lavadero.__codigo_opciones = codigo
+        lavadero.__ingresos_centimos = ingresos
+        return lavadero
+
     # ================== IMPRESIÓN (DEBUG) ==================
 
     def imprimir_fase(self):
         """
         Imprime el nombre descriptivo de la fase actual.
         Útil para depuración y visualización del estado.
+        Las etiquetas son una tabla de módulo (ver render.ETIQUETAS_FASE).
         """
-        # Diccionario que mapea números de fase a nombres descriptivos
-        fases_map = {
-            self.FASE_INACTIVO: "0 - Inactivo",
-            self.FASE_COBRANDO: "1 - Cobrando",
-            self.FASE_PRELAVADO_MANO: "2 - Haciendo prelavado a mano",
-            self.FASE_ECHANDO_AGUA: "3 - Echándole agua",
-            self.FASE_ENJABONANDO: "4 - Enjabonando",
-            self.FASE_RODILLOS: "5 - Pasando rodillos",
-            self.FASE_SECADO_AUTOMATICO: "6 - Haciendo secado automático",
-            self.FASE_SECADO_MANO: "7 - Haciendo secado a mano",
-            self.FASE_ENCERADO: "8 - Encerando a mano",
-        }
-
-        # Imprimir la descripción de la fase actual
-        print(fases_map.get(self.__fase, f"{self.__fase} - En estado no válido"), end="")
+        print(etiqueta_fase(self.__fase), end="")
 
     def imprimir_estado(self):
         """
         Imprime un resumen completo del estado actual del lavadero.
         Incluye ingresos, ocupación, opciones y fase actual.
+        El texto sale de render.render_estado y se escribe con un solo print.
         """
-        print("----------------------------------------")
-        print(f"Ingresos Acumulados: {self.ingresos:.2f} €")
-        print(f"Ocupado: {self.ocupado}")
-        print(f"Prelavado a mano: {self.prelavado_a_mano}")
-        print(f"Secado a mano: {self.secado_a_mano}")
-        print(f"Encerado: {self.encerado}")
-        print("Fase: ", end="")
-        self.imprimir_fase()
-        print("\n----------------------------------------")
+        print(render_estado(self), end="")
 
     # ================== FUNCIÓN PARA TESTS ==================
 
@@ -305,21 +657,305 @@ class Lavadero:
             fases = lavadero.ejecutar_y_obtener_fases(False, True, True)
             # Devuelve: [0, 1, 3, 4, 5, 7, 8, 0]
         """
-        # Inicia el lavado mediante la API interna
+        # Inicia el lavado mediante la API interna (valida y cobra)
         self.hacer_lavado(prelavado, secado, encerado)
-        
-        # Registrar la fase inicial (siempre INACTIVO)
-        fases_visitadas = [self.fase]
-
-        # Avanzar fase por fase hasta que el lavadero se libere
-        while self.ocupado:
-            # Límite de seguridad contra bucles infinitos (debería ser nunca)
-            if len(fases_visitadas) > 20:
-                raise Exception("Bucle infinito detectado en la simulación de fases.")
-            
-            # Avanzar una fase y registrar dónde estamos ahora
-            self.avanzarFase()
-            fases_visitadas.append(self.fase)
-
-        # Devolver el recorrido completo de fases
-        return fases_visitadas
+
+        # El recorrido ya está precalculado: se toma del catálogo de rutas
+        # y se deja el lavadero como quedaría al final del ciclo
+        ruta = self.__rutas[self.__codigo_opciones]
+        self.terminar()
+
+        # Los oyentes reciben las mismas transiciones que si se avanzase fase a fase
+        if self.__oyentes is not None:
+            for anterior, siguiente in zip(ruta, ruta[1:]):
+                self._emitir((EVENTO_FASE, self, anterior, siguiente))
+        if self.__metricas is not None:
+            self.__metricas.contar_ruta(ruta)
+
+        # Devolver el recorrido completo de fases (copia mutable para el llamante)
+        return list(ruta)
+
+    @classmethod
+    def ruta_para(cls, opciones):
+        """
+        Devuelve la ruta de fases de un ciclo completo para unas opciones dadas.
+
+        Las rutas se calculan una sola vez al importar el módulo, así que esta
+        consulta no simula nada ni modifica ningún lavadero. Es la ruta
+        estándar; la de un túnel con configuración la da ruta_configurada.
+
+        Args:
+            opciones (tuple): Terna (prelavado, secado, encerado) de booleanos
+
+        Returns:
+            tuple: Fases del ciclo, comenzando y terminando en FASE_INACTIVO (0)
+
+        Raises:
+            ValueError: Si se pide encerado sin secado a mano
+
+        Ejemplo:
+            Lavadero.ruta_para((False, True, True))
+            # Devuelve: (0, 1, 3, 4, 5, 7, 8, 0)
+        """
+        prelavado, secado, encerado = opciones
+        if not secado and encerado:
+            raise ValueError("Encerado sin secado a mano no permitido")
+        return cls._RUTAS[cls.codigo_opciones(prelavado, secado, encerado)]
+
+    def ruta_configurada(self, opciones):
+        """
+        Como ruta_para, pero con la configuración aplicada a este túnel: la
+        ruta que seguirá su próximo ciclo con esas opciones.
+
+        Raises:
+            ValueError: Si se pide encerado sin secado a mano
+        """
+        prelavado, secado, encerado = opciones
+        if not secado and encerado:
+            raise ValueError("Encerado sin secado a mano no permitido")
+        return self.__rutas[self.codigo_opciones(prelavado, secado, encerado)]
+
+
+# ================== TABLAS PRECOMPILADAS ==================
+# Se construyen una sola vez al importar el módulo, a partir de las reglas
+# de negocio, y las consulta avanzarFase en lugar de evaluar las reglas.
+
+def _regla_transicion(fase, prelavado_a_mano, secado_a_mano, encerado):
+    """
+    Reglas de transición del ciclo de lavado: fase actual + opciones → fase siguiente.
+    Devuelve FASE_INACTIVO cuando el ciclo termina.
+    """
+    L = Lavadero
+    if fase == L.FASE_INACTIVO:
+        # Inicio: pasar a cobrando (el cobro ya se hizo en hacer_lavado)
+        return L.FASE_COBRANDO
+    if fase == L.FASE_COBRANDO:
+        # Después de cobrar: prelavado si se pidió, si no directamente al agua
+        return L.FASE_PRELAVADO_MANO if prelavado_a_mano else L.FASE_ECHANDO_AGUA
+    if fase == L.FASE_PRELAVADO_MANO:
+        return L.FASE_ECHANDO_AGUA
+    if fase == L.FASE_ECHANDO_AGUA:
+        return L.FASE_ENJABONANDO
+    if fase == L.FASE_ENJABONANDO:
+        return L.FASE_RODILLOS
+    if fase == L.FASE_RODILLOS:
+        # Después de rodillos: secado a mano o automático
+        return L.FASE_SECADO_MANO if secado_a_mano else L.FASE_SECADO_AUTOMATICO
+    if fase == L.FASE_SECADO_MANO:
+        # Después del secado manual: encerado si se pidió, si no fin del ciclo
+        return L.FASE_ENCERADO if encerado else L.FASE_INACTIVO
+    # SECADO_AUTOMATICO y ENCERADO son siempre la última fase
+    return L.FASE_INACTIVO
+
+
+def _construir_transiciones():
+    """
+    Genera la tabla pública {(fase, prelavado, secado, encerado): siguiente}
+    para las 9 fases y las 8 combinaciones de opciones.
+    """
+    tabla = {}
+    for fase in range(Lavadero.FASE_INACTIVO, Lavadero.FASE_ENCERADO + 1):
+        for codigo in range(8):
+            opciones = (bool(codigo & 1), bool(codigo & 2), bool(codigo & 4))
+            tabla[(fase,) + opciones] = _regla_transicion(fase, *opciones)
+    return tabla
+
+
+Lavadero.TRANSICIONES = _construir_transiciones()
+
+# Versión interna indexada por un entero (fase << 3 | código): más rápida de consultar
+Lavadero._TABLA_TRANSICIONES = {
+    (fase << 3) | Lavadero.codigo_opciones(p, s, e): siguiente
+    for (fase, p, s, e), siguiente in Lavadero.TRANSICIONES.items()
+}
+
+
+def _construir_rutas():
+    """
+    Recorre la tabla de transiciones para cada código de opciones y devuelve
+    una tupla de 8 rutas (tuplas de fases), indexada por el código.
+    Los códigos no permitidos (encerado sin secado) quedan como None.
+    """
+    rutas = []
+    for codigo in range(8):
+        if codigo & 4 and not codigo & 2:
+            rutas.append(None)
+            continue
+
+        ruta = [Lavadero.FASE_INACTIVO]
+        fase = Lavadero._TABLA_TRANSICIONES[codigo]  # Primer paso desde INACTIVO
+        ruta.append(fase)
+        while fase != Lavadero.FASE_INACTIVO:
+            # Límite de seguridad contra bucles infinitos en la tabla
+            if len(ruta) > 20:
+                raise RuntimeError("Bucle infinito detectado en la tabla de transiciones.")
+            fase = Lavadero._TABLA_TRANSICIONES[(fase << 3) | codigo]
+            ruta.append(fase)
+        rutas.append(tuple(ruta))
+    return tuple(rutas)
+
+
+Lavadero._RUTAS = _construir_rutas()
+
+# Catálogo público de rutas por combinación válida de opciones
+Lavadero.RUTAS = {
+    (bool(codigo & 1), bool(codigo & 2), bool(codigo & 4)): ruta
+    for codigo, ruta in enumerate(Lavadero._RUTAS) if ruta is not None
+}
+
+
+def visitas_por_fase(rutas, conteos):
+    """
+    Veces que se pasa por cada fase en conteos[codigo] ciclos completos de cada código.
+
+    Un ciclo cuenta cada fase de su ruta salvo el INACTIVO final (ruta[:-1]),
+    así que INACTIVO sale una vez por ciclo, igual que en duracion_ruta y
+    tiempo_restante. Es el convenio de todos los informes de visitas por fase.
+    """
+    visitas = [0] * (Lavadero.FASE_ENCERADO + 1)
+    for codigo, cuenta in enumerate(conteos):
+        ruta = rutas[codigo]
+        if cuenta and ruta is not None:
+            for fase in ruta[:-1]:
+                visitas[fase] += cuenta
+    return visitas
+
+
+# Las tablas de tiempo restante se indexan por un byte-clave
+# ocupado (bit 7) | fase (bits 3-6) | código de opciones (bits 0-2), el mismo que
+# usa FlotaLavaderos: un lavadero libre siempre tiene 0 por delante.
+
+def tabla_pasos_restantes(rutas):
+    """
+    Tabla de 256 bytes: byte-clave → avances de fase que faltan para terminar el ciclo.
+    Sirve tal cual para bytes.translate sobre las claves de una flota.
+    """
+    tabla = bytearray(256)
+    for codigo, ruta in enumerate(rutas):
+        if ruta is None:
+            continue
+        for posicion, fase in enumerate(ruta[:-1]):
+            tabla[0x80 | (fase << 3) | codigo] = len(ruta) - 1 - posicion
+    return bytes(tabla)
+
+
+def tabla_tiempo_restante(rutas, duraciones):
+    """
+    Lista de 256 tiempos: byte-clave → tiempo que falta para terminar el ciclo,
+    contando entera la fase actual.
+
+    Cuesta unos cientos de operaciones: quien consulte muchos túneles con las
+    mismas duraciones debe calcularla una vez y guardarla (ver FlotaLavaderos.tiempo_restante).
+    """
+    por_fase = tuple(duraciones.get(fase, 0) for fase in range(Lavadero.FASE_ENCERADO + 1))
+    return _calcular_tiempo_restante(rutas, por_fase)
+
+
+def tiempo_restante_en_ruta(ruta, pasos_restantes, duraciones):
+    """
+    Tiempo de las `pasos_restantes` últimas fases de una ruta (sin el INACTIVO final):
+    lo que le falta a un túnel de esa ruta contando entera la fase actual.
+    """
+    if not pasos_restantes:
+        return 0
+    return sum(duraciones.get(fase, 0) for fase in ruta[-1 - pasos_restantes:-1])
+
+
+def _calcular_tiempo_restante(rutas, por_fase):
+    """Construye la tabla de tabla_tiempo_restante con la duración de cada fase por índice."""
+    tabla = [0] * 256
+    for codigo, ruta in enumerate(rutas):
+        if ruta is None:
+            continue
+        for posicion, fase in enumerate(ruta[:-1]):
+            tabla[0x80 | (fase << 3) | codigo] = sum(por_fase[f] for f in ruta[posicion:-1])
+    return tabla
+
+
+Lavadero._PASOS_RESTANTES = tabla_pasos_restantes(Lavadero._RUTAS)
+
+
+def _precio_lavado_centimos(prelavado_a_mano, secado_a_mano, encerado):
+    """
+    Estructura de precios del lavado en céntimos: 5.00€ base + opcionales.
+    """
+    # Precio base del lavado automático
+    coste_lavado = 500
+
+    # Añadir opcionales según lo seleccionado
+    if prelavado_a_mano:
+        coste_lavado += 150
+    if secado_a_mano:
+        coste_lavado += 100
+    if encerado:
+        coste_lavado += 120
+    return coste_lavado
+
+
+# Precio de cada código de opciones (0-7), en céntimos exactos y en euros
+Lavadero._PRECIOS_CENTIMOS = tuple(
+    _precio_lavado_centimos(codigo & 1, codigo & 2, codigo & 4) for codigo in range(8)
+)
+Lavadero._PRECIOS = tuple(centimos / 100 for centimos in Lavadero._PRECIOS_CENTIMOS)
+Lavadero._usar_tablas_estandar()
+
+
+# ================== OPERACIONES POR LOTES ==================
+# Utilidades para procesar miles de vehículos sin un bucle Python por fila.
+# Un lote de códigos es un objeto bytes con un código de opciones (0-7) por vehículo.
+
+# Tabla para bytes.translate: cualquier byte distinto de 0 pasa a ser 1
+_A_BINARIO = bytes([0] + [1] * 255)
+
+
+def _a_bytes_binarios(valores):
+    """Convierte un array de booleanos (o buffer de 1 byte por elemento) en bytes de 0/1."""
+    try:
+        vista = memoryview(valores)
+    except TypeError:
+        # Listas, tuplas, generadores... cualquier iterable de valores de verdad
+        return bytes(map(bool, valores))
+
+    if vista.itemsize == 1 and vista.c_contiguous:
+        return vista.cast("B").tobytes().translate(_A_BINARIO)
+    return bytes(map(bool, vista.tolist()))
+
+
+def codificar_opciones_lote(prelavado, secado, encerado):
+    """
+    Empaqueta tres arrays de opciones en un lote de códigos (ver Lavadero.codigo_opciones).
+
+    Cada array se convierte en un entero enorme (un byte por vehículo) y los
+    tres se combinan con desplazamientos de bits: como cada byte vale 0 o 1,
+    no hay acarreos entre vehículos y todo el trabajo se hace en C.
+
+    Returns:
+        bytes: Un código de opciones (0-7) por vehículo
+
+    Raises:
+        ValueError: Si los arrays no tienen la misma longitud
+    """
+    n, p, s, e = _enteros_opciones(prelavado, secado, encerado)
+    return (p | s << 1 | e << 2).to_bytes(n, "little")
+
+
+def _enteros_opciones(prelavado, secado, encerado):
+    """
+    (vehículos, prelavado, secado, encerado) con cada array de opciones
+    convertido en un entero con un byte 0/1 por vehículo (ver codificar_opciones_lote).
+
+    Raises:
+        ValueError: Si los arrays no tienen la misma longitud
+    """
+    p = _a_bytes_binarios(prelavado)
+    s = _a_bytes_binarios(secado)
+    e = _a_bytes_binarios(encerado)
+    if not len(p) == len(s) == len(e):
+        raise ValueError("Los arrays de opciones deben tener la misma longitud")
+    return len(p), int.from_bytes(p, "little"), int.from_bytes(s, "little"), int.from_bytes(e, "little")
+
+
+def _primera_fila_no_permitida(codigos):
+    """Índice de la primera fila con encerado sin secado (códigos 4 y 5), o None."""
+    filas = [fila for fila in (codigos.find(b"\x04"), codigos.find(b"\x05")) if fila != -1]
+    return min(filas) if filas else None
@@ -0,0 +1,171 @@
+# lavadero_async.py
+# Control asíncrono (asyncio) de túneles de lavado cuyas fases terminan a destiempo
+# Un único bucle de eventos maneja miles de túneles sin un hilo por túnel
+
+import asyncio
+
+try:
+    from .lavadero import Lavadero
+    from .simulacion_eventos import DURACIONES_POR_DEFECTO
+except ImportError:
+    from lavadero import Lavadero
+    from simulacion_eventos import DURACIONES_POR_DEFECTO
+
+
+# Políticas cuando se pide un lavado y el túnel está ocupado
+POLITICA_ESPERAR = "esperar"        # Esperar turno en una cola FIFO (contrapresión)
+POLITICA_RECHAZAR = "rechazar"      # Lanzar ValueError("Lavado en curso") como Lavadero
+
+
+class ColaLlena(Exception):
+    """Se lanza cuando la cola de espera de un túnel ha alcanzado su límite."""
+
+
+class LavaderoAsincrono:
+    """
+    Envoltorio asyncio de un Lavadero.
+
+    Cada fase es un awaitable que dura lo indicado en `duraciones` (segundos
+    simulados) multiplicado por `escala` (segundos reales por segundo
+    simulado; con escala=0 las fases solo ceden el control al bucle).
+
+    En lugar de que los lavados simultáneos acaben en "Lavado en curso", la
+    política por defecto los pone en una cola FIFO: lavar() espera su turno.
+    """
+
+    def __init__(self, lavadero=None, duraciones=None, escala: float = 1.0,
+                 politica: str = POLITICA_ESPERAR, max_cola=None):
+        """
+        Args:
+            lavadero (Lavadero): Túnel a controlar (por defecto, uno nuevo)
+            duraciones (dict): Segundos simulados por fase (ver DURACIONES_POR_DEFECTO)
+            escala (float): Segundos reales que dura cada segundo simulado
+            politica (str): POLITICA_ESPERAR o POLITICA_RECHAZAR
+            max_cola (int): Máximo de lavados esperando turno (None = sin límite)
+        """
+        if politica not in (POLITICA_ESPERAR, POLITICA_RECHAZAR):
+            raise ValueError(f"Política desconocida: {politica}")
+        self.lavadero = lavadero if lavadero is not None else Lavadero()
+        self.duraciones = dict(DURACIONES_POR_DEFECTO)
+        if duraciones:
+            self.duraciones.update(duraciones)
+        self.escala = escala
+        self.politica = politica
+        self.max_cola = max_cola
+        self._turno = asyncio.Lock()        # Los asyncio.Lock atienden a los que esperan en orden FIFO
+        self._en_espera = 0
+
+    @property
+    def en_espera(self):
+        """Número de lavados esperando a que el túnel quede libre."""
+        return self._en_espera
+
+    async def avanzar(self):
+        """
+        Espera la duración de la fase actual y avanza a la siguiente.
+
+        Returns:
+            int: La fase en la que queda el lavadero
+        """
+        await asyncio.sleep(self.duraciones[self.lavadero.fase] * self.escala)
+        self.lavadero.avanzarFase()
+        return self.lavadero.fase
+
+    async def lavar(self, opciones):
+        """
+        Realiza un ciclo de lavado completo con las opciones dadas.
+
+        Args:
+            opciones (tuple): (prelavado, secado, encerado)
+
+        Returns:
+            list: Fases visitadas, como Lavadero.ejecutar_y_obtener_fases
+
+        Raises:
+            ValueError: Si las opciones no son válidas, o si el túnel está
+                        ocupado y la política es POLITICA_RECHAZAR
+            ColaLlena: Si la cola de espera ha alcanzado max_cola
+            asyncio.CancelledError: Si se cancela la tarea; si el ciclo ya había
+                                    empezado, el túnel queda libre (terminar())
+        """
+        if self._turno.locked():
+            if self.politica == POLITICA_RECHAZAR:
+                raise ValueError("Lavado en curso")
+            if self.max_cola is not None and self._en_espera >= self.max_cola:
+                raise ColaLlena(f"Cola de espera llena ({self.max_cola})")
+
+        self._en_espera += 1
+        try:
+            await self._turno.acquire()
+        finally:
+            self._en_espera -= 1
+
+        try:
+            self.lavadero.hacer_lavado(*opciones)
+            fases = [self.lavadero.fase]
+            try:
+                while self.lavadero.ocupado:
+                    fases.append(await self.avanzar())
+            except BaseException:
+                # Cancelado (o fallo) a mitad de ciclo: se da el ciclo por terminado
+                # para que el túnel no quede ocupado para siempre. Lo cobrado se mantiene.
+                if self.lavadero.ocupado:
+                    self.lavadero.terminar()
+                raise
+            return fases
+        finally:
+            self._turno.release()
+
+
+class ControladorAsincrono:
+    """
+    Controlador de un centro con muchos túneles asíncronos.
+
+    Los pedidos entran en una asyncio.Queue acotada: si está llena, enviar()
+    espera (contrapresión) en vez de fallar. Cada túnel tiene una tarea que
+    toma pedidos de la cola cuando queda libre.
+    """
+
+    def __init__(self, tuneles, max_pendientes: int = 0):
+        """
+        Args:
+            tuneles (list): Lista de LavaderoAsincrono
+            max_pendientes (int): Tamaño máximo de la cola de pedidos (0 = sin límite)
+        """
+        self.tuneles = tuneles
+        self.pedidos = asyncio.Queue(maxsize=max_pendientes)
+        self.completados = 0
+        self.rechazados = 0                  # Pedidos que las reglas de negocio no permiten (ValueError)
+        self.fallidos = 0                    # Pedidos que fallan por otra causa (mal formados, ColaLlena...)
+        self._tareas = []
+
+    def iniciar(self):
+        """Arranca una tarea por túnel (debe llamarse con el bucle de eventos en marcha)."""
+        self._tareas = [asyncio.create_task(self._atender(tunel)) for tunel in self.tuneles]
+
+    async def _atender(self, tunel):
+        while True:
+            opciones = await self.pedidos.get()
+            try:
+                await tunel.lavar(opciones)
+                self.completados += 1
+            except ValueError:
+                self.rechazados += 1
+            except Exception:
+                # Un pedido que falla no puede tumbar la tarea del túnel: los pedidos
+                # siguientes se quedarían en la cola y cerrar() no terminaría nunca
+                self.fallidos += 1
+            finally:
+                self.pedidos.task_done()
+
+    async def enviar(self, opciones):
+        """Encola un pedido de lavado; espera si la cola de pedidos está llena."""
+        await self.pedidos.put(opciones)
+
+    async def cerrar(self):
+        """Espera a que se atiendan todos los pedidos y detiene las tareas de los túneles."""
+        await self.pedidos.join()
+        for tarea in self._tareas:
+            tarea.cancel()
+        await asyncio.gather(*self._tareas, return_exceptions=True)
+        self._tareas = []
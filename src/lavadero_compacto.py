@@ -0,0 +1,151 @@
+# lavadero_compacto.py
+# Variante de Lavadero de bajo consumo de memoria para crear millones de instancias
+# Misma interfaz y mismas reglas que Lavadero, pero con __slots__ y las opciones en un campo de bits
+
+from decimal import Decimal
+
+try:
+    from .lavadero import Lavadero, tiempo_restante_en_ruta
+except ImportError:
+    from lavadero import Lavadero, tiempo_restante_en_ruta
+
+
+class LavaderoCompacto:
+    """
+    Túnel de lavado con el mismo comportamiento que Lavadero y menos memoria.
+
+    En lugar de seis atributos en un __dict__ por instancia, guarda solo tres
+    huecos (__slots__): la fase, un campo de bits con las opciones y el
+    indicador de ocupado, y los ingresos en céntimos.
+
+    Campo de bits __estado:
+    - bits 0-2: código de opciones (ver Lavadero.codigo_opciones)
+    - bit 3: ocupado
+    """
+
+    __slots__ = ("__fase", "__estado", "__ingresos_centimos")
+
+    # Mismas constantes de fase que Lavadero
+    FASE_INACTIVO = Lavadero.FASE_INACTIVO
+    FASE_COBRANDO = Lavadero.FASE_COBRANDO
+    FASE_PRELAVADO_MANO = Lavadero.FASE_PRELAVADO_MANO
+    FASE_ECHANDO_AGUA = Lavadero.FASE_ECHANDO_AGUA
+    FASE_ENJABONANDO = Lavadero.FASE_ENJABONANDO
+    FASE_RODILLOS = Lavadero.FASE_RODILLOS
+    FASE_SECADO_AUTOMATICO = Lavadero.FASE_SECADO_AUTOMATICO
+    FASE_SECADO_MANO = Lavadero.FASE_SECADO_MANO
+    FASE_ENCERADO = Lavadero.FASE_ENCERADO
+
+    _OPCIONES = 0b0111                    # Máscara del código de opciones
+    _OCUPADO = 0b1000                     # Bit de ocupado
+
+    def __init__(self):
+        """Inicializa el lavadero en estado inicial (como Lavadero())."""
+        self.__fase = self.FASE_INACTIVO
+        self.__estado = 0
+        self.__ingresos_centimos = 0
+
+    # ================== PROPERTIES (SOLO LECTURA) ==================
+
+    @property
+    def fase(self):
+        """Devuelve la fase actual del lavadero."""
+        return self.__fase
+
+    @property
+    def ingresos(self):
+        """Devuelve los ingresos acumulados en euros."""
+        return self.__ingresos_centimos / 100
+
+    @property
+    def ingresos_centimos(self):
+        """Devuelve los ingresos acumulados en céntimos (entero exacto)."""
+        return self.__ingresos_centimos
+
+    @property
+    def ingresos_decimal(self):
+        """Devuelve los ingresos acumulados en euros como Decimal exacto."""
+        return Decimal(self.__ingresos_centimos).scaleb(-2)
+
+    @property
+    def ocupado(self):
+        """Devuelve True si el lavadero está procesando un vehículo."""
+        return bool(self.__estado & self._OCUPADO)
+
+    @property
+    def prelavado_a_mano(self):
+        """Devuelve True si se ha seleccionado prelavado manual."""
+        return bool(self.__estado & 1)
+
+    @property
+    def secado_a_mano(self):
+        """Devuelve True si se ha seleccionado secado manual."""
+        return bool(self.__estado & 2)
+
+    @property
+    def encerado(self):
+        """Devuelve True si se ha seleccionado encerado."""
+        return bool(self.__estado & 4)
+
+    # ================== OPERACIONES ==================
+
+    def terminar(self):
+        """Resetea el estado al modo inactivo. No modifica los ingresos."""
+        self.__fase = self.FASE_INACTIVO
+        self.__estado = 0
+
+    def hacer_lavado(self, prelavado_a_mano: bool, secado_a_mano: bool, encerado: bool):
+        """
+        Inicia un nuevo ciclo de lavado (mismas reglas que Lavadero.hacer_lavado).
+
+        Raises:
+            ValueError: Si el lavadero está ocupado o si intenta encerar sin secado
+        """
+        Lavadero.validar_lavado(self.__estado & self._OCUPADO, secado_a_mano, encerado)
+
+        self.__fase = self.FASE_INACTIVO
+        self.__estado = self._OCUPADO | Lavadero.codigo_opciones(prelavado_a_mano, secado_a_mano, encerado)
+        self._cobrar()
+
+    def _cobrar(self):
+        """Añade el precio del lavado actual a los ingresos y lo devuelve en euros."""
+        codigo = self.__estado & self._OPCIONES
+        self.__ingresos_centimos += Lavadero._PRECIOS_CENTIMOS[codigo]
+        return Lavadero._PRECIOS[codigo]
+
+    def avanzarFase(self):
+        """Avanza una fase en el ciclo de lavado (mismas transiciones que Lavadero)."""
+        if not self.__estado & self._OCUPADO:
+            return
+
+        siguiente = Lavadero._TABLA_TRANSICIONES.get((self.__fase << 3) | (self.__estado & self._OPCIONES))
+        if siguiente is None:
+            raise RuntimeError(f"Estado no válido: Fase {self.__fase}. El lavadero va a estallar...")
+
+        if siguiente == self.FASE_INACTIVO:
+            self.terminar()
+        else:
+            self.__fase = siguiente
+
+    def _clave(self):
+        """Byte-clave ocupado | fase | opciones de la tabla de pasos restantes."""
+        return ((self.__estado & self._OCUPADO) << 4) | (self.__fase << 3) | (self.__estado & self._OPCIONES)
+
+    def pasos_restantes(self):
+        """Avances de fase que faltan para terminar el ciclo (ver Lavadero.pasos_restantes)."""
+        return Lavadero._PASOS_RESTANTES[self._clave()]
+
+    def tiempo_restante(self, duraciones):
+        """Tiempo que falta para terminar el ciclo (ver Lavadero.tiempo_restante)."""
+        return tiempo_restante_en_ruta(Lavadero._RUTAS[self.__estado & self._OPCIONES], self.pasos_restantes(), duraciones)
+
+    def ruta_configurada(self, opciones):
+        """Ruta de fases de un ciclo completo (siempre la estándar, ver Lavadero.ruta_configurada)."""
+        return Lavadero.ruta_para(opciones)
+
+    def ejecutar_y_obtener_fases(self, prelavado, secado, encerado):
+        """Ejecuta un ciclo completo y devuelve la lista de fases visitadas."""
+        self.hacer_lavado(prelavado, secado, encerado)
+        ruta = Lavadero._RUTAS[self.__estado & self._OPCIONES]
+        self.terminar()
+        return list(ruta)
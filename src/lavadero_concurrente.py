@@ -0,0 +1,117 @@
+# lavadero_concurrente.py
+# Variante de Lavadero segura para usar desde varios hilos a la vez
+# La comprobación y reserva del túnel es atómica y los ingresos se reparten en franjas por hilo
+
+import threading
+import weakref
+
+try:
+    from .lavadero import Lavadero
+except ImportError:
+    from lavadero import Lavadero
+
+
+class _Testigo:
+    """Objeto que vive en el threading.local del hilo: muere con él y avisa (ver _plegar_franja)."""
+    __slots__ = ("__weakref__",)
+
+
+def _plegar_franja(referencia, franja):
+    """Pasa la franja de un hilo que ha terminado al total de su lavadero y la olvida."""
+    lavadero = referencia()
+    if lavadero is not None:
+        with lavadero._cerrojo:
+            lavadero._plegados += franja[0]
+            del lavadero._franjas[id(franja)]
+
+
+class LavaderoConcurrente(Lavadero):
+    """
+    Lavadero con el mismo comportamiento que la clase base, seguro entre hilos.
+
+    - hacer_lavado comprueba "Lavado en curso" y marca el túnel como ocupado
+      dentro de un mismo cerrojo, así que dos hilos no pueden pasar la
+      comprobación a la vez.
+    - Cada hilo acumula lo que cobra en su propia franja (un contador local
+      del hilo), así que no hay un += compartido entre hilos. El cobro se
+      apunta antes de escribir el diario y avisar a los oyentes, que ven los
+      ingresos ya actualizados, igual que con Lavadero.
+    - Cuando un hilo termina, su franja se suma a un total común y se
+      olvida: los hilos de corta vida no hacen crecer la lista de franjas.
+      ingresos_centimos suma el total común y las franjas vivas.
+    """
+
+    def __init__(self, diario=None):
+        super().__init__(diario)
+        # RLock: avanzarFase llama a terminar() con el cerrojo ya tomado
+        self._cerrojo = threading.RLock()
+        self._local = threading.local()
+        self._franjas = {}                   # id → contador [céntimos] de cada hilo vivo que ha cobrado
+        self._plegados = 0                   # Céntimos de las franjas de hilos ya terminados
+
+    # ================== INGRESOS POR FRANJAS ==================
+
+    def _nueva_franja(self):
+        """Crea y registra el contador de céntimos del hilo actual."""
+        franja = [0]
+        testigo = _Testigo()
+        with self._cerrojo:
+            self._franjas[id(franja)] = franja
+        weakref.finalize(testigo, _plegar_franja, weakref.ref(self), franja)
+        self._local.testigo = testigo
+        self._local.franja = franja
+        return franja
+
+    @property
+    def ingresos_centimos(self):
+        """Devuelve los ingresos acumulados en céntimos, sumando las franjas de todos los hilos."""
+        with self._cerrojo:
+            return (super().ingresos_centimos + self._plegados
+                    + sum(franja[0] for franja in self._franjas.values()))
+
+    def _cobrar(self):
+        """Suma el precio del lavado en curso a la franja del hilo que lo cobra."""
+        codigo = self._codigo_actual
+        try:
+            franja = self._local.franja
+        except AttributeError:
+            franja = self._nueva_franja()
+        franja[0] += self._precios_centimos[codigo]
+        return self._precios[codigo]
+
+    # ================== OPERACIONES ATÓMICAS ==================
+
+    def hacer_lavado(self, prelavado_a_mano: bool, secado_a_mano: bool, encerado: bool):
+        """Inicia un lavado (ver Lavadero.hacer_lavado): comprobar y reservar el túnel es atómico."""
+        with self._cerrojo:
+            super().hacer_lavado(prelavado_a_mano, secado_a_mano, encerado)
+
+    def avanzarFase(self):
+        """Avanza una fase (ver Lavadero.avanzarFase) sin carreras con otros hilos."""
+        with self._cerrojo:
+            super().avanzarFase()
+
+    def terminar(self):
+        """Resetea el lavadero al modo inactivo (ver Lavadero.terminar)."""
+        with self._cerrojo:
+            super().terminar()
+
+    def ejecutar_y_obtener_fases(self, prelavado, secado, encerado):
+        """Ejecuta un ciclo completo de forma atómica (ver Lavadero.ejecutar_y_obtener_fases)."""
+        with self._cerrojo:
+            return super().ejecutar_y_obtener_fases(prelavado, secado, encerado)
+
+    def cobrar_lote(self, prelavado, secado, encerado):
+        """Cobra un lote (ver Lavadero.cobrar_lote) sin carreras con otros hilos."""
+        with self._cerrojo:
+            return super().cobrar_lote(prelavado, secado, encerado)
+
+    def cobrar_codigos(self, codigos):
+        """Cobra un lote codificado (ver Lavadero.cobrar_codigos) sin carreras con otros hilos."""
+        with self._cerrojo:
+            return super().cobrar_codigos(codigos)
+
+    def aplicar_configuracion(self, configuracion):
+        """Cambia de configuración (ver Lavadero.aplicar_configuracion) sin carreras con un lavado que empieza."""
+        with self._cerrojo:
+            return super().aplicar_configuracion(configuracion)
@@ -1,11 +1,27 @@
 # main_app.py
 # Aplicación de demostración del funcionamiento del lavadero
-# Ejecuta 4 ejemplos de uso mostrando distintas configuraciones de lavado
+# Sin argumentos ejecuta 4 ejemplos de uso mostrando distintas configuraciones de lavado
+# Ejemplo de alto volumen: python src/main_app.py --vehiculos 10000000 --resumen
 
-from lavadero import Lavadero
+import argparse
+import cProfile
+import json
+import pstats
+import random
+import sys
+import time
+from itertools import accumulate
 
+try:
+    from .configuracion import cargar_configuracion
+    from .lavadero import Lavadero, visitas_por_fase
+except ImportError:
+    from configuracion import cargar_configuracion
+    from lavadero import Lavadero, visitas_por_fase
 
-def ejecutarSimulacion(lavadero: Lavadero, prelavado: bool, secado_mano: bool, encerado: bool):
+
+def ejecutarSimulacion(lavadero: Lavadero, prelavado: bool, secado_mano: bool, encerado: bool,
+                       silencioso: bool = False):
     """
     Simula el proceso completo de lavado para un vehículo con las opciones dadas.
     Muestra el estado inicial, avanza fase por fase y muestra el estado final.
@@ -15,7 +31,18 @@ def ejecutarSimulacion(lavadero: Lavadero, prelavado: bool, secado_mano: bool, e
         prelavado (bool): True si se solicita prelavado a mano
         secado_mano (bool): True si se solicita secado a mano
         encerado (bool): True si se solicita encerado
+        silencioso (bool): Si True no imprime nada: ejecuta el ciclo completo
+                           de una vez (ver Lavadero.ejecutar_y_obtener_fases)
+
+    Returns:
+        list: Fases visitadas, o None si el lavado no se pudo realizar
     """
+    if silencioso:
+        try:
+            return lavadero.ejecutar_y_obtener_fases(prelavado, secado_mano, encerado)
+        except (ValueError, RuntimeError):
+            return None
+
     print("--- INICIO: Prueba de Lavado con Opciones Personalizadas ---")
     print(f"Opciones solicitadas: [Prelavado: {prelavado}, Secado a mano: {secado_mano}, Encerado: {encerado}]")
     print()
@@ -31,10 +58,12 @@ def ejecutarSimulacion(lavadero: Lavadero, prelavado: bool, secado_mano: bool, e
         # Avanzar fase por fase hasta que termine
         print("\nAVANZANDO FASE POR FASE:")
         pasos = 0
+        fases = [lavadero.fase]
         # Límite de seguridad para evitar bucles infinitos
         while lavadero.ocupado and pasos < 20:
             # Avanzar una fase
             lavadero.avanzarFase()
+            fases.append(lavadero.fase)
             
             # Mostrar en qué fase estamos ahora
             print("-> Fase actual: ", end="")
@@ -49,6 +78,7 @@ def ejecutarSimulacion(lavadero: Lavadero, prelavado: bool, secado_mano: bool, e
         lavadero.imprimir_estado()
         print(f"Ingresos acumulados: {lavadero.ingresos:.2f} €")
         print("----------------------------------------")
+        return fases
 
     except ValueError as e:
         # Capturar errores de validación (argumentos inválidos)
@@ -61,8 +91,9 @@ def ejecutarSimulacion(lavadero: Lavadero, prelavado: bool, secado_mano: bool, e
         print(f"❌ ERROR INESPERADO: {e}")
 
 
-# ===================== PUNTO DE ENTRADA (MAIN) =====================
-if __name__ == "__main__":
+# ===================== EJEMPLOS DE DEMOSTRACIÓN =====================
+def ejecutar_ejemplos():
+    """Ejecuta los 4 ejemplos de demostración (comportamiento sin argumentos)."""
     # Crear una única instancia de Lavadero que será reutilizada
     # Esto permite que los ingresos se acumulen entre ejemplos
     lavadero_global = Lavadero()
@@ -117,3 +148,216 @@ if __name__ == "__main__":
     print("- Ejemplo 4 (Prelavado): +6.50 €")
     print(f"- Total esperado: {8.70 + 5.00 + 0.00 + 6.50:.2f} €")
     print("="*55)
+
+
+# ===================== SIMULACIÓN DE ALTO VOLUMEN =====================
+
+# Opciones (prelavado, secado, encerado) de cada código (ver Lavadero.codigo_opciones)
+OPCIONES_POR_CODIGO = tuple((bool(codigo & 1), bool(codigo & 2), bool(codigo & 4)) for codigo in range(8))
+TAMANO_BLOQUE = 65536                    # Vehículos generados / líneas escritas de una vez
+_VALORES_FICHERO = {"1": True, "0": False, "true": True, "false": False, "si": True, "sí": True, "no": False}
+
+
+def codigos_aleatorios(n: int, prob_prelavado: float, prob_secado: float, prob_encerado: float, semilla=None):
+    """
+    Genera n códigos de opciones al azar; cada opción se pide con su probabilidad,
+    de forma independiente (así que aparecen encerados sin secado, que se rechazan).
+    """
+    pesos = []
+    for prelavado, secado, encerado in OPCIONES_POR_CODIGO:
+        pesos.append((prob_prelavado if prelavado else 1 - prob_prelavado)
+                     * (prob_secado if secado else 1 - prob_secado)
+                     * (prob_encerado if encerado else 1 - prob_encerado))
+    acumulados = list(accumulate(pesos))
+    azar = random.Random(semilla)
+    codigos = range(8)
+    while n > 0:
+        bloque = min(n, TAMANO_BLOQUE)
+        yield from azar.choices(codigos, cum_weights=acumulados, k=bloque)
+        n -= bloque
+
+
+def codigos_de_fichero(ruta):
+    """
+    Lee un vehículo por línea con el formato prelavado,secado,encerado
+    (cada valor 0/1, true/false o sí/no). Lo que va detrás de # se ignora.
+
+    Raises:
+        ValueError: Si una línea no tiene ese formato
+    """
+    with open(ruta, encoding="utf-8") as fichero:
+        for numero, linea in enumerate(fichero, 1):
+            linea = linea.split("#", 1)[0].strip()
+            if not linea:
+                continue
+            try:
+                prelavado, secado, encerado = (_VALORES_FICHERO[campo.strip().lower()] for campo in linea.split(","))
+            except (KeyError, ValueError):
+                raise ValueError(f"{ruta}:{numero}: línea no válida: {linea!r}") from None
+            yield Lavadero.codigo_opciones(prelavado, secado, encerado)
+
+
+def simular_vehiculos(lavadero: Lavadero, codigos, modo: str = "detallado", salida=None):
+    """
+    Pasa una secuencia de vehículos por ejecutarSimulacion y agrega los resultados.
+
+    Args:
+        lavadero (Lavadero): Lavadero a utilizar (los ingresos se acumulan en él)
+        codigos: Iterable de códigos de opciones, uno por vehículo
+        modo (str): "detallado" (fase a fase, como los ejemplos), "silencioso"
+                    (una línea por vehículo, escritas por bloques) o "resumen"
+                    (nada por vehículo)
+        salida: Fichero de texto para las líneas del modo silencioso (por defecto stdout)
+
+    Returns:
+        dict: Resumen agregado (ver imprimir_resumen)
+    """
+    aceptados = [0] * 8
+    rechazados = [0] * 8
+    centimos_iniciales = lavadero.ingresos_centimos
+    inicio = time.perf_counter()
+
+    if modo == "detallado":
+        for codigo in codigos:
+            if ejecutarSimulacion(lavadero, *OPCIONES_POR_CODIGO[codigo]) is None:
+                rechazados[codigo] += 1
+            else:
+                aceptados[codigo] += 1
+    elif modo == "silencioso":
+        salida = salida if salida is not None else sys.stdout
+        textos = [f"{p:d}{s:d}{e:d} " for p, s, e in OPCIONES_POR_CODIGO]
+        lineas = []
+        for numero, codigo in enumerate(codigos, 1):
+            if ejecutarSimulacion(lavadero, *OPCIONES_POR_CODIGO[codigo], silencioso=True) is None:
+                rechazados[codigo] += 1
+                lineas.append(f"{numero} {textos[codigo]}RECHAZADO\n")
+            else:
+                aceptados[codigo] += 1
+                lineas.append(f"{numero} {textos[codigo]}{lavadero.precios[codigo]:.2f}\n")
+            if len(lineas) >= TAMANO_BLOQUE:
+                salida.write("".join(lineas))
+                lineas.clear()
+        salida.write("".join(lineas))
+    else:
+        opciones = OPCIONES_POR_CODIGO
+        for codigo in codigos:
+            if ejecutarSimulacion(lavadero, *opciones[codigo], silencioso=True) is None:
+                rechazados[codigo] += 1
+            else:
+                aceptados[codigo] += 1
+
+    segundos = time.perf_counter() - inicio
+    rutas = Lavadero._RUTAS if lavadero.configuracion is None else lavadero.configuracion.rutas
+    visitas = visitas_por_fase(rutas, aceptados)
+    vehiculos = sum(aceptados) + sum(rechazados)
+    return {
+        "vehiculos": vehiculos,
+        "aceptados": sum(aceptados),
+        "rechazados": sum(rechazados),
+        "ingresos_centimos": lavadero.ingresos_centimos - centimos_iniciales,
+        "aceptados_por_codigo": aceptados,
+        "rechazados_por_codigo": rechazados,
+        "visitas_por_fase": visitas,
+        "segundos": segundos,
+        "vehiculos_por_segundo": vehiculos / segundos if segundos else 0.0,
+    }
+
+
+def imprimir_resumen(resumen, fichero=None):
+    """Escribe el informe agregado de una simulación."""
+    fichero = fichero if fichero is not None else sys.stdout
+    lineas = [
+        "=" * 55,
+        "RESUMEN DE LA SIMULACIÓN",
+        "=" * 55,
+        f"Vehículos:   {resumen['vehiculos']:,}",
+        f"Aceptados:   {resumen['aceptados']:,}",
+        f"Rechazados:  {resumen['rechazados']:,}",
+        f"Ingresos:    {resumen['ingresos_centimos'] / 100:,.2f} €",
+        f"Tiempo:      {resumen['segundos']:.2f} s ({resumen['vehiculos_por_segundo']:,.0f} vehículos/s)",
+        "",
+        "Por opciones (prelavado, secado, encerado):",
+    ]
+    for codigo, (prelavado, secado, encerado) in enumerate(OPCIONES_POR_CODIGO):
+        lineas.append(f"  {prelavado:d}{secado:d}{encerado:d}  aceptados {resumen['aceptados_por_codigo'][codigo]:>12,}"
+                      f"  rechazados {resumen['rechazados_por_codigo'][codigo]:>12,}")
+    lineas.append("Entradas por fase:")
+    for fase, cuenta in enumerate(resumen["visitas_por_fase"]):
+        lineas.append(f"  {fase}  {cuenta:>12,}")
+    lineas.append("=" * 55)
+    fichero.write("\n".join(lineas) + "\n")
+
+
+# ===================== LÍNEA DE COMANDOS =====================
+
+def crear_parser():
+    """Define los argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        description="Simula lavados de vehículos. Sin argumentos ejecuta los 4 ejemplos de demostración.")
+    origen = parser.add_mutually_exclusive_group()
+    origen.add_argument("--vehiculos", type=int, default=None,
+                        help="Número de vehículos con opciones aleatorias a simular")
+    origen.add_argument("--entrada", default=None,
+                        help="Fichero con un vehículo por línea: prelavado,secado,encerado (0/1)")
+    parser.add_argument("--prob-prelavado", type=float, default=0.3, help="Probabilidad de pedir prelavado")
+    parser.add_argument("--prob-secado", type=float, default=0.5, help="Probabilidad de pedir secado a mano")
+    parser.add_argument("--prob-encerado", type=float, default=0.3, help="Probabilidad de pedir encerado")
+    parser.add_argument("--semilla", type=int, default=None, help="Semilla del generador aleatorio")
+    parser.add_argument("--configuracion", default=None, metavar="FICHERO",
+                        help="Fichero JSON con los precios y fases de la sede (ver configuracion.py)")
+    salida = parser.add_mutually_exclusive_group()
+    salida.add_argument("-q", "--quiet", action="store_true",
+                        help="No imprime las fases: una línea por vehículo y el resumen")
+    salida.add_argument("--resumen", action="store_true",
+                        help="No imprime nada por vehículo: solo el informe agregado final")
+    parser.add_argument("--salida", default=None, help="Fichero JSON donde guardar el resumen agregado")
+    parser.add_argument("--profile", nargs="?", const="main_app.prof", default=None, metavar="FICHERO",
+                        help="Ejecuta bajo cProfile y guarda las estadísticas (por defecto main_app.prof)")
+    return parser
+
+
+def _ejecutar(args):
+    if args.vehiculos is None and args.entrada is None:
+        ejecutar_ejemplos()
+        return
+
+    if args.entrada is not None:
+        codigos = codigos_de_fichero(args.entrada)
+    else:
+        codigos = codigos_aleatorios(args.vehiculos, args.prob_prelavado, args.prob_secado,
+                                     args.prob_encerado, args.semilla)
+    modo = "silencioso" if args.quiet else "resumen" if args.resumen else "detallado"
+    lavadero = Lavadero()
+    if args.configuracion is not None:
+        lavadero.aplicar_configuracion(cargar_configuracion(args.configuracion))
+    resumen = simular_vehiculos(lavadero, codigos, modo)
+    imprimir_resumen(resumen)
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as fichero:
+            json.dump(resumen, fichero, indent=2)
+        print(f"Resumen guardado en {args.salida}")
+
+
+def main(argv=None):
+    args = crear_parser().parse_args(argv)
+    for nombre in ("prob_prelavado", "prob_secado", "prob_encerado"):
+        if not 0.0 <= getattr(args, nombre) <= 1.0:
+            crear_parser().error(f"--{nombre.replace('_', '-')} debe estar entre 0 y 1")
+
+    try:
+        if args.profile:
+            perfil = cProfile.Profile()
+            perfil.runcall(_ejecutar, args)
+            perfil.dump_stats(args.profile)
+            pstats.Stats(perfil, stream=sys.stderr).sort_stats("cumulative").print_stats(15)
+            print(f"Estadísticas de cProfile guardadas en {args.profile}", file=sys.stderr)
+        else:
+            _ejecutar(args)
+    except (OSError, ValueError) as error:
+        crear_parser().exit(1, f"❌ ERROR: {error}\n")
+
+
+# ===================== PUNTO DE ENTRADA (MAIN) =====================
+if __name__ == "__main__":
+    main()
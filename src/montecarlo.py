@@ -0,0 +1,137 @@
+# montecarlo.py
+# Ejecución de miles de escenarios "¿y si...?" de capacidad repartidos entre varios procesos
+# Cada escenario es una simulación de eventos discretos independiente (ver simulacion_eventos.py)
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .lavadero import Lavadero
+    from .simulacion_eventos import SimuladorEventos, NUM_FASES
+except ImportError:
+    from lavadero import Lavadero
+    from simulacion_eventos import SimuladorEventos, NUM_FASES
+
+
+def semilla_escenario(semilla_base: int, indice: int) -> int:
+    """
+    Semilla determinista del escenario `indice`.
+
+    Depende solo de la semilla base y del índice, no del proceso que lo
+    ejecute ni del orden de reparto, así que los resultados son idénticos
+    con 1 o con 64 procesos.
+    """
+    return random.Random(semilla_base * 1_000_003 + indice).getrandbits(64)
+
+
+def ejecutar_escenario(tarea):
+    """
+    Ejecuta un escenario y devuelve sus resultados agregados.
+
+    Es una función de módulo (no un método) para que ProcessPoolExecutor
+    pueda enviarla a los procesos. Devuelve solo números y listas cortas,
+    nunca objetos Lavadero.
+
+    Args:
+        tarea (tuple): (índice, escenario, semilla). El escenario es un dict con
+                       "tuneles", "llegadas_por_hora", "horas" y opcionalmente
+                       "mezcla", "duraciones" y "por_fases".
+
+    Returns:
+        dict: índice, ingresos, atendidos, completados, esperas, ocupación e histogramas por fase
+    """
+    indice, escenario, semilla = tarea
+    simulador = SimuladorEventos(escenario["tuneles"],
+                                 duraciones=escenario.get("duraciones"),
+                                 por_fases=escenario.get("por_fases", False),
+                                 semilla=semilla)
+    informe = simulador.simular(escenario["horas"], escenario["llegadas_por_hora"],
+                                mezcla=escenario.get("mezcla"))
+    return {
+        "indice": indice,
+        "tuneles": escenario["tuneles"],
+        "llegadas_por_hora": escenario["llegadas_por_hora"],
+        "ingresos_centimos": informe["ingresos_centimos"],
+        "atendidos": informe["atendidos"],
+        "completados": informe["completados"],
+        "en_cola_al_final": informe["en_cola_al_final"],
+        "cola_maxima": informe["cola_maxima"],
+        "espera_p50": informe["espera_p50"],
+        "espera_p90": informe["espera_p90"],
+        "espera_p99": informe["espera_p99"],
+        "ocupacion_media": informe["ocupacion_media"],
+        "visitas_por_fase": informe["visitas_por_fase"],
+        "tiempo_por_fase": informe["tiempo_por_fase"],
+    }
+
+
+def ejecutar_escenarios(escenarios, procesos=None, semilla: int = 0, bloque: int = 4):
+    """
+    Ejecuta una lista de escenarios en paralelo y devuelve sus resultados en orden.
+
+    Args:
+        escenarios (list): Escenarios (dicts, ver ejecutar_escenario)
+        procesos (int): Número de procesos; None usa todos los núcleos y 1
+                        ejecuta todo en el proceso actual, sin pool
+        semilla (int): Semilla base de la que se derivan las de cada escenario
+        bloque (int): Escenarios enviados juntos a cada proceso (reduce la
+                      comunicación entre procesos cuando los escenarios son cortos)
+
+    Returns:
+        list: Un dict de resultados por escenario, en el mismo orden de entrada
+    """
+    tareas = [(i, escenario, semilla_escenario(semilla, i)) for i, escenario in enumerate(escenarios)]
+    if procesos == 1:
+        return [ejecutar_escenario(tarea) for tarea in tareas]
+
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        return list(pool.map(ejecutar_escenario, tareas, chunksize=bloque))
+
+
+def resumir(resultados):
+    """
+    Agrega los resultados de muchos escenarios en un único resumen.
+
+    Returns:
+        dict: número de escenarios, ingresos y coches atendidos y completados totales,
+              histogramas de visitas y tiempo por fase sumados, y el
+              escenario con más ingresos y el de peor espera p90
+    """
+    visitas = [0] * NUM_FASES
+    tiempo = [0.0] * NUM_FASES
+    for resultado in resultados:
+        for fase in range(NUM_FASES):
+            visitas[fase] += resultado["visitas_por_fase"][fase]
+            tiempo[fase] += resultado["tiempo_por_fase"][fase]
+
+    return {
+        "escenarios": len(resultados),
+        "ingresos_centimos": sum(r["ingresos_centimos"] for r in resultados),
+        "atendidos": sum(r["atendidos"] for r in resultados),
+        "completados": sum(r["completados"] for r in resultados),
+        "visitas_por_fase": visitas,
+        "tiempo_por_fase": tiempo,
+        "mejor_ingresos": max(resultados, key=lambda r: r["ingresos_centimos"])["indice"] if resultados else None,
+        "peor_espera_p90": max(resultados, key=lambda r: r["espera_p90"])["indice"] if resultados else None,
+    }
+
+
+def generar_escenarios(n: int, semilla: int = 0, tuneles=(1, 20), llegadas_por_tunel=(2.0, 8.0), horas=24.0):
+    """
+    Genera n escenarios aleatorios (reproducibles) para un barrido de capacidad.
+
+    Cada escenario tiene un número de túneles, una tasa de llegadas
+    proporcional a los túneles y una mezcla de opciones con pesos al azar.
+    """
+    azar = random.Random(semilla)
+    combinaciones = list(Lavadero.RUTAS)
+    escenarios = []
+    for _ in range(n):
+        num_tuneles = azar.randint(*tuneles)
+        escenarios.append({
+            "tuneles": num_tuneles,
+            "llegadas_por_hora": round(num_tuneles * azar.uniform(*llegadas_por_tunel), 3),
+            "horas": horas,
+            "mezcla": {opciones: azar.randint(1, 10) for opciones in combinaciones},
+        })
+    return escenarios
@@ -0,0 +1,59 @@
+# montecarlo_app.py
+# Punto de entrada de línea de comandos para los barridos Monte Carlo de capacidad
+# Ejemplo: python src/montecarlo_app.py --escenarios 1000 --horas 24 --procesos 8 --salida resultados.json
+
+import argparse
+import json
+import time
+
+try:
+    from .montecarlo import ejecutar_escenarios, generar_escenarios, resumir
+except ImportError:
+    from montecarlo import ejecutar_escenarios, generar_escenarios, resumir
+
+
+def crear_parser():
+    """Define los argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(
+        description="Ejecuta escenarios de capacidad de túneles de lavado en paralelo.")
+    parser.add_argument("--escenarios", type=int, default=100,
+                        help="Número de escenarios aleatorios a generar (por defecto 100)")
+    parser.add_argument("--horas", type=float, default=24.0,
+                        help="Horas simuladas en cada escenario (por defecto 24)")
+    parser.add_argument("--tuneles-min", type=int, default=1, help="Mínimo de túneles por escenario")
+    parser.add_argument("--tuneles-max", type=int, default=20, help="Máximo de túneles por escenario")
+    parser.add_argument("--procesos", type=int, default=None,
+                        help="Procesos en paralelo (por defecto, todos los núcleos)")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla base (reproducibilidad)")
+    parser.add_argument("--salida", default=None,
+                        help="Fichero JSON donde guardar los resultados de cada escenario")
+    return parser
+
+
+def main(argv=None):
+    args = crear_parser().parse_args(argv)
+
+    escenarios = generar_escenarios(args.escenarios, semilla=args.semilla,
+                                    tuneles=(args.tuneles_min, args.tuneles_max), horas=args.horas)
+
+    inicio = time.perf_counter()
+    resultados = ejecutar_escenarios(escenarios, procesos=args.procesos, semilla=args.semilla)
+    segundos = time.perf_counter() - inicio
+    resumen = resumir(resultados)
+
+    print(f"Escenarios ejecutados: {resumen['escenarios']} en {segundos:.2f} s")
+    print(f"Coches atendidos:      {resumen['atendidos']:,}")
+    print(f"Lavados completados:   {resumen['completados']:,}")
+    print(f"Ingresos totales:      {resumen['ingresos_centimos'] / 100:,.2f} €")
+    print(f"Escenario con más ingresos:  #{resumen['mejor_ingresos']}")
+    print(f"Escenario con peor espera p90: #{resumen['peor_espera_p90']}")
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as fichero:
+            json.dump({"resumen": resumen, "resultados": resultados}, fichero)
+        print(f"Resultados guardados en {args.salida}")
+
+
+# ===================== PUNTO DE ENTRADA (MAIN) =====================
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+# render.py
+# Representación en texto del estado de los lavaderos para consolas y paneles de control
+# Las etiquetas y líneas se precalculan; los estados ya mostrados se sirven de caché y se puede pedir solo lo que cambia
+
+from array import array
+from itertools import compress
+from operator import ne, or_
+
+# ================== ETIQUETAS ==================
+
+# Nombre descriptivo de cada fase, indexado por Lavadero.FASE_*
+ETIQUETAS_FASE = (
+    "0 - Inactivo",
+    "1 - Cobrando",
+    "2 - Haciendo prelavado a mano",
+    "3 - Echándole agua",
+    "4 - Enjabonando",
+    "5 - Pasando rodillos",
+    "6 - Haciendo secado automático",
+    "7 - Haciendo secado a mano",
+    "8 - Encerando a mano",
+)
+
+SEPARADOR = "-" * 40 + "\n"
+
+
+def etiqueta_fase(fase):
+    """Nombre descriptivo de una fase, o "<fase> - En estado no válido" si no existe."""
+    if 0 <= fase < len(ETIQUETAS_FASE):
+        return ETIQUETAS_FASE[fase]
+    return f"{fase} - En estado no válido"
+
+
+# ================== ESTADO DE UN LAVADERO ==================
+# Un estado es la tupla (ingresos en céntimos, ocupado, prelavado, secado, encerado, fase),
+# en el orden en que se muestran los campos.
+
+NOMBRES_CAMPOS = ("ingresos", "ocupado", "prelavado_a_mano", "secado_a_mano", "encerado", "fase")
+
+# Líneas de los campos booleanos: índice 0 para False y 1 para True
+_LINEAS_BOOLEANAS = tuple(
+    (f"{titulo}: False\n", f"{titulo}: True\n")
+    for titulo in ("Ocupado", "Prelavado a mano", "Secado a mano", "Encerado")
+)
+
+_LINEAS_FASE = tuple(f"Fase: {etiqueta}\n" for etiqueta in ETIQUETAS_FASE)
+
+_CACHE_ESTADOS = {}                          # estado → (líneas de cada campo, texto completo)
+_MAX_CACHE_ESTADOS = 4096
+
+
+def estado_de(lavadero):
+    """Tupla de estado de cualquier objeto con la interfaz de Lavadero."""
+    return (lavadero.ingresos_centimos, bool(lavadero.ocupado), bool(lavadero.prelavado_a_mano),
+            bool(lavadero.secado_a_mano), bool(lavadero.encerado), lavadero.fase)
+
+
+def _renderizado(estado):
+    """(líneas de cada campo, texto completo) de un estado, desde la caché si ya se mostró."""
+    guardado = _CACHE_ESTADOS.get(estado)
+    if guardado is not None:
+        return guardado
+
+    centimos, ocupado, prelavado, secado, encerado, fase = estado
+    lineas = (
+        f"Ingresos Acumulados: {centimos / 100:.2f} €\n",
+        _LINEAS_BOOLEANAS[0][ocupado],
+        _LINEAS_BOOLEANAS[1][prelavado],
+        _LINEAS_BOOLEANAS[2][secado],
+        _LINEAS_BOOLEANAS[3][encerado],
+        _LINEAS_FASE[fase] if 0 <= fase < len(_LINEAS_FASE) else f"Fase: {etiqueta_fase(fase)}\n",
+    )
+    guardado = (lineas, SEPARADOR + "".join(lineas) + SEPARADOR)
+    if len(_CACHE_ESTADOS) >= _MAX_CACHE_ESTADOS:
+        _CACHE_ESTADOS.clear()
+    _CACHE_ESTADOS[estado] = guardado
+    return guardado
+
+
+def render_estado(lavadero):
+    """
+    Texto del resumen de estado de un lavadero, el mismo que escribe
+    Lavadero.imprimir_estado (separadores incluidos).
+
+    Args:
+        lavadero: Un lavadero o directamente su tupla de estado (ver estado_de)
+
+    Returns:
+        str: El resumen, terminado en salto de línea
+    """
+    estado = lavadero if type(lavadero) is tuple else estado_de(lavadero)
+    return _renderizado(estado)[1]
+
+
+def render_cambios(anterior, actual):
+    """
+    Solo las líneas de los campos que han cambiado entre dos estados.
+
+    Args:
+        anterior (tuple): Estado mostrado la última vez, o None si no se ha mostrado nada
+        actual (tuple): Estado actual
+
+    Returns:
+        str: Las líneas cambiadas ("" si no hay cambios); el resumen completo si anterior es None
+    """
+    if anterior is None:
+        return _renderizado(actual)[1]
+    if anterior == actual:
+        return ""
+    lineas = _renderizado(actual)[0]
+    return "".join(linea for linea, antes, ahora in zip(lineas, anterior, actual) if antes != ahora)
+
+
+class RenderIncremental:
+    """
+    Recuerda el último estado mostrado de un lavadero para emitir solo lo
+    que cambia en cada refresco.
+    """
+
+    def __init__(self, lavadero):
+        self.lavadero = lavadero
+        self.ultimo = None                   # Último estado mostrado (None = nada todavía)
+
+    def render(self):
+        """Cambios desde el último render() (todo el resumen la primera vez)."""
+        estado = estado_de(self.lavadero)
+        texto = render_cambios(self.ultimo, estado)
+        self.ultimo = estado
+        return texto
+
+
+# ================== FLOTAS ==================
+# Una línea por túnel. El final de cada línea depende solo del byte-clave
+# ocupado (bit 7) | fase (bits 3-6) | código de opciones (bits 0-2) que usa
+# FlotaLavaderos, así que se precalcula para las 256 claves.
+
+CABECERA_FLOTA = f"{'Túnel':>7} | {'Ingresos':>12} | {'Fase':<30} | Opciones\n"
+
+
+def _final_de_linea(clave):
+    fase, codigo = (clave >> 3) & 0x0F, clave & 0x07
+    if not clave & 0x80:
+        opciones = "libre"
+    else:
+        opciones = " ".join(nombre for bit, nombre in ((1, "prelavado"), (2, "secado"), (4, "encerado"))
+                            if codigo & bit) or "básico"
+    return f" | {etiqueta_fase(fase):<30} | {opciones}\n"
+
+
+_FINALES_LINEA = tuple(_final_de_linea(clave) for clave in range(256))
+
+
+def _claves_de_lavaderos(lavaderos):
+    """Byte-clave de cada lavadero de una secuencia cualquiera (no FlotaLavaderos)."""
+    return bytes(
+        (bool(l.ocupado) << 7) | (l.fase << 3) | (bool(l.prelavado_a_mano) | bool(l.secado_a_mano) << 1
+                                                  | bool(l.encerado) << 2)
+        for l in lavaderos)
+
+
+class RenderFlota:
+    """
+    Tabla de estado de miles de túneles, generada como un único texto para
+    escribirla de una vez.
+
+    Guarda la línea de cada túnel y, en cada refresco, solo vuelve a
+    formatear la de los túneles cuya clave o ingresos han cambiado; la
+    detección de cambios se hace comparando arrays, sin bucle Python.
+    """
+
+    def __init__(self, tuneles):
+        """
+        Args:
+            tuneles: Una FlotaLavaderos o una secuencia de lavaderos
+        """
+        # Importación diferida: flota importa lavadero, que a su vez importa este módulo
+        try:
+            from .flota import FlotaLavaderos
+        except ImportError:
+            from flota import FlotaLavaderos
+        self.tuneles = tuneles
+        self._es_flota = isinstance(tuneles, FlotaLavaderos)
+        self._lineas = []
+        self._claves = b""
+        self._ingresos = array("q")
+
+    def _leer(self):
+        """(claves, ingresos por túnel) del estado actual."""
+        tuneles = self.tuneles
+        if self._es_flota:
+            return tuneles.claves_estado(), tuneles.ingresos_centimos_por_tunel
+        return _claves_de_lavaderos(tuneles), array("q", [l.ingresos_centimos for l in tuneles])
+
+    def _actualizar(self):
+        """Reformatea las líneas de los túneles que han cambiado y devuelve sus índices."""
+        claves, ingresos = self._leer()
+        n = len(claves)
+        if n != len(self._claves):
+            cambiados = range(n)
+            self._lineas = [""] * n
+        else:
+            cambiados = list(compress(range(n), map(or_, map(ne, claves, self._claves),
+                                                     map(ne, ingresos, self._ingresos))))
+        lineas, finales = self._lineas, _FINALES_LINEA
+        for idx in cambiados:
+            lineas[idx] = f"{idx:>7} | {ingresos[idx] / 100:>10.2f} €{finales[claves[idx]]}"
+        self._claves = claves
+        self._ingresos = array("q", ingresos)
+        return cambiados
+
+    def render(self, solo_cambios=False):
+        """
+        Texto de la tabla.
+
+        Args:
+            solo_cambios (bool): Solo las líneas de los túneles que han cambiado
+                                 desde el último render (sin cabecera)
+
+        Returns:
+            str: Una línea por túnel
+        """
+        cambiados = self._actualizar()
+        if solo_cambios:
+            lineas = self._lineas
+            return "".join([lineas[idx] for idx in cambiados])
+        return CABECERA_FLOTA + "".join(self._lineas)
+
+    def escribir(self, fichero, solo_cambios=False):
+        """Escribe render() en el fichero con una sola llamada a write()."""
+        fichero.write(self.render(solo_cambios))
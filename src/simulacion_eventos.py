@@ -0,0 +1,249 @@
+# simulacion_eventos.py
+# Simulación de eventos discretos de un centro de lavado con varios túneles
+# Cada fase tiene una duración configurable y los coches llegan según un proceso de Poisson
+
+import heapq
+import random
+from array import array
+from collections import deque
+
+try:
+    from .lavadero import Lavadero, visitas_por_fase
+except ImportError:
+    from lavadero import Lavadero, visitas_por_fase
+
+
+# Duración de cada fase en segundos (configurable al crear el simulador)
+DURACIONES_POR_DEFECTO = {
+    Lavadero.FASE_INACTIVO: 0,
+    Lavadero.FASE_COBRANDO: 30,
+    Lavadero.FASE_PRELAVADO_MANO: 120,
+    Lavadero.FASE_ECHANDO_AGUA: 60,
+    Lavadero.FASE_ENJABONANDO: 60,
+    Lavadero.FASE_RODILLOS: 90,
+    Lavadero.FASE_SECADO_AUTOMATICO: 60,
+    Lavadero.FASE_SECADO_MANO: 180,
+    Lavadero.FASE_ENCERADO: 150,
+}
+
+# Las llegadas y las opciones elegidas se sortean en bloques (más rápido que una a una)
+TAMANO_BLOQUE_AZAR = 4096
+
+NUM_FASES = Lavadero.FASE_ENCERADO + 1
+
+
+def duracion_ruta(ruta, duraciones):
+    """Segundos que tarda un ciclo completo: suma de las fases de la ruta menos el INACTIVO final."""
+    return sum(duraciones[fase] for fase in ruta[:-1])
+
+
+def percentil(valores_ordenados, p):
+    """Percentil p (0-100) por rango más cercano de una secuencia ya ordenada."""
+    if not valores_ordenados:
+        return 0.0
+    rango = max(1, -(-len(valores_ordenados) * p // 100))
+    return valores_ordenados[int(rango) - 1]
+
+
+class SimuladorEventos:
+    """
+    Simulador de eventos discretos para planificar la capacidad de un centro de lavado.
+
+    Los coches llegan con tiempos entre llegadas exponenciales, eligen una
+    combinación de opciones según una mezcla de probabilidades y esperan en
+    una única cola FIFO hasta que queda libre alguno de los túneles (objetos
+    Lavadero). Los eventos se procesan en orden temporal desde un montículo.
+
+    Con por_fases=True se programa un evento por cada fase y el túnel avanza
+    con avanzarFase; por defecto se programa un único evento por ciclo con la
+    duración total de la ruta, que da los mismos resultados y es mucho más rápido.
+    """
+
+    def __init__(self, tuneles: int, duraciones=None, por_fases: bool = False, semilla=None):
+        """
+        Args:
+            tuneles (int): Número de túneles (instancias de Lavadero) del centro
+            duraciones (dict): Segundos por fase {FASE_*: segundos}; las que falten
+                               toman el valor de DURACIONES_POR_DEFECTO
+            por_fases (bool): Si True, un evento por fase en lugar de uno por ciclo
+            semilla: Semilla del generador aleatorio (reproducibilidad)
+        """
+        if tuneles < 1:
+            raise ValueError("Hace falta al menos un túnel")
+
+        self.duraciones = dict(DURACIONES_POR_DEFECTO)
+        if duraciones:
+            self.duraciones.update(duraciones)
+        self.por_fases = por_fases
+        self.azar = random.Random(semilla)
+        self.lavaderos = [Lavadero() for _ in range(tuneles)]
+
+        # Duración total de un ciclo para cada código de opciones
+        self._duracion_codigo = [
+            duracion_ruta(ruta, self.duraciones) if ruta is not None else None
+            for ruta in Lavadero._RUTAS
+        ]
+
+    def _llegadas(self, tasa, num_combinaciones, pesos):
+        """Generador infinito de (segundos hasta la siguiente llegada, índice de combinación)."""
+        azar = self.azar
+        indices = range(num_combinaciones)
+        while True:
+            intervalos = [azar.expovariate(tasa) for _ in range(TAMANO_BLOQUE_AZAR)]
+            elegidas = azar.choices(indices, weights=pesos, k=TAMANO_BLOQUE_AZAR)
+            yield from zip(intervalos, elegidas)
+
+    def simular(self, horas: float, llegadas_por_hora: float, mezcla=None):
+        """
+        Simula `horas` de funcionamiento y devuelve un informe agregado.
+
+        Args:
+            horas (float): Horizonte de simulación
+            llegadas_por_hora (float): Tasa media de llegada de coches
+            mezcla (dict): Probabilidad relativa de cada combinación de opciones
+                           {(prelavado, secado, encerado): peso}. Por defecto,
+                           todas las combinaciones válidas por igual.
+
+        Returns:
+            dict: Informe con llegadas, atendidos (lavados empezados y cobrados),
+                  completados (terminados dentro del horizonte), rendimiento por
+                  hora (de los completados), ingresos,
+                  longitud de cola (máxima y media), percentiles de espera,
+                  ocupación media de los túneles y visitas/tiempo por fase
+
+        Raises:
+            ValueError: Si llegadas_por_hora no es positiva, la mezcla está vacía,
+                        tiene algún peso no positivo o pide encerado sin secado
+        """
+        if not llegadas_por_hora > 0:
+            raise ValueError("La tasa de llegadas por hora debe ser positiva")
+        if mezcla is None:
+            mezcla = {opciones: 1 for opciones in Lavadero.RUTAS}
+        if not mezcla:
+            raise ValueError("La mezcla debe tener al menos una combinación de opciones")
+        if not all(peso > 0 for peso in mezcla.values()):
+            raise ValueError("Los pesos de la mezcla deben ser positivos")
+        combinaciones = list(mezcla)
+        for opciones in combinaciones:
+            Lavadero.ruta_para(opciones)          # Valida la combinación (encerado sin secado)
+        codigos = [Lavadero.codigo_opciones(*opciones) for opciones in combinaciones]
+        pesos = [mezcla[opciones] for opciones in combinaciones]
+
+        fin = horas * 3600
+        tasa = llegadas_por_hora / 3600                    # Llegadas por segundo
+        por_fases = self.por_fases
+        duraciones = self.duraciones
+        duracion_codigo = self._duracion_codigo
+        lavaderos = self.lavaderos
+        ingresos_iniciales = sum(lavadero.ingresos_centimos for lavadero in lavaderos)
+        llegadas_futuras = self._llegadas(tasa, len(combinaciones), pesos)
+        empujar, sacar = heapq.heappush, heapq.heappop
+
+        # ESTADO DE LA SIMULACIÓN
+        # El montículo guarda los eventos de los túneles (tiempo, secuencia, túnel);
+        # la llegada siguiente es siempre una sola, así que se guarda aparte.
+        eventos = []
+        secuencia = 0                                      # Desempate estable entre eventos simultáneos
+        libres = [i for i in range(len(lavaderos)) if not lavaderos[i].ocupado]
+        cola = deque()                                     # (tiempo de llegada, índice de combinación)
+        esperas = array("d")
+        servicios_por_codigo = [0] * 8
+        llegadas = 0
+        completados = 0                                    # Ciclos terminados dentro del horizonte
+        cola_maxima = 0
+        area_cola = 0.0                                    # Integral de la longitud de cola
+        tiempo_ocupado = 0.0                               # Tiempo de túnel usado dentro del horizonte
+        ahora = 0.0
+        intervalo, combinacion = next(llegadas_futuras)
+        proxima_llegada = intervalo
+
+        # BUCLE PRINCIPAL: procesar eventos en orden temporal hasta el horizonte
+        while True:
+            if eventos and eventos[0][0] <= proxima_llegada:
+                # EVENTO DE TÚNEL: termina una fase (por_fases) o el ciclo completo
+                tiempo, _, idx = sacar(eventos)
+                if tiempo > fin:
+                    break
+                area_cola += len(cola) * (tiempo - ahora)
+                ahora = tiempo
+
+                lavadero = lavaderos[idx]
+                if por_fases:
+                    lavadero.avanzarFase()
+                    if lavadero.ocupado:
+                        secuencia += 1
+                        empujar(eventos, (ahora + duraciones[lavadero.fase], secuencia, idx))
+                        continue
+                else:
+                    lavadero.terminar()
+                completados += 1
+
+                # El túnel ha quedado libre: entra el siguiente coche de la cola
+                if not cola:
+                    libres.append(idx)
+                    continue
+                llegada, siguiente = cola.popleft()
+            else:
+                # EVENTO DE LLEGADA: un coche nuevo entra al centro
+                if proxima_llegada > fin:
+                    break
+                area_cola += len(cola) * (proxima_llegada - ahora)
+                ahora = llegada = proxima_llegada
+                llegadas += 1
+                siguiente = combinacion
+                intervalo, combinacion = next(llegadas_futuras)
+                proxima_llegada = ahora + intervalo
+
+                if not libres:
+                    cola.append((llegada, siguiente))
+                    if len(cola) > cola_maxima:
+                        cola_maxima = len(cola)
+                    continue
+                idx = libres.pop()
+
+            # INICIO DE LAVADO en el túnel idx y programación de su siguiente evento
+            lavadero = lavaderos[idx]
+            lavadero.hacer_lavado(*combinaciones[siguiente])
+            codigo = codigos[siguiente]
+            servicios_por_codigo[codigo] += 1
+            esperas.append(ahora - llegada)
+            duracion = duracion_codigo[codigo]
+            tiempo_ocupado += duracion if ahora + duracion <= fin else fin - ahora
+            secuencia += 1
+            if por_fases:
+                empujar(eventos, (ahora + duraciones[lavadero.fase], secuencia, idx))
+            else:
+                empujar(eventos, (ahora + duracion, secuencia, idx))
+
+        area_cola += len(cola) * (fin - ahora)
+
+        # Los ciclos que no terminan antes del horizonte se cortan: túneles libres
+        for lavadero in lavaderos:
+            lavadero.terminar()
+
+        # INFORME
+        esperas_ordenadas = sorted(esperas)
+        atendidos = len(esperas)
+        visitas = visitas_por_fase(Lavadero._RUTAS, servicios_por_codigo)
+        tiempo_fase = [float(cuenta * duraciones[fase]) for fase, cuenta in enumerate(visitas)]
+
+        return {
+            "horas": horas,
+            "tuneles": len(lavaderos),
+            "llegadas": llegadas,
+            "atendidos": atendidos,
+            "completados": completados,
+            "en_cola_al_final": len(cola),
+            "rendimiento_por_hora": completados / horas if horas else 0.0,
+            "ingresos_centimos": sum(l.ingresos_centimos for l in lavaderos) - ingresos_iniciales,
+            "cola_maxima": cola_maxima,
+            "cola_media": area_cola / fin if fin else 0.0,
+            "espera_media": sum(esperas) / atendidos if atendidos else 0.0,
+            "espera_p50": percentil(esperas_ordenadas, 50),
+            "espera_p90": percentil(esperas_ordenadas, 90),
+            "espera_p99": percentil(esperas_ordenadas, 99),
+            "ocupacion_media": tiempo_ocupado / (fin * len(lavaderos)) if fin else 0.0,
+            "servicios_por_codigo": servicios_por_codigo,
+            "visitas_por_fase": visitas,
+            "tiempo_por_fase": tiempo_fase,
+        }
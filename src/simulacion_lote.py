@@ -0,0 +1,123 @@
+# simulacion_lote.py
+# Simulación de ciclos completos de lavado para millones de vehículos sin un bucle Python por vehículo
+# Da el mismo resultado que llamar a Lavadero.ejecutar_y_obtener_fases coche a coche
+
+from array import array
+
+try:
+    from .lavadero import Lavadero, _enteros_opciones, visitas_por_fase
+except ImportError:
+    from lavadero import Lavadero, _enteros_opciones, visitas_por_fase
+
+
+def _conteos_por_codigo(n, p, s, e):
+    """
+    Vehículos de cada código de opciones (0-7), contados sobre los enteros
+    de _enteros_opciones: cada AND y cada bit_count es una pasada en C.
+    """
+    ps, pe, se = p & s, p & e, s & e
+    n_p, n_s, n_e = p.bit_count(), s.bit_count(), e.bit_count()
+    n_ps, n_pe, n_se = ps.bit_count(), pe.bit_count(), se.bit_count()
+    n_pse = (ps & e).bit_count()
+
+    # Inclusión-exclusión: cada código es una combinación exacta de los tres bits
+    conteos = [0] * 8
+    conteos[7] = n_pse
+    conteos[3] = n_ps - n_pse
+    conteos[5] = n_pe - n_pse
+    conteos[6] = n_se - n_pse
+    conteos[1] = n_p - n_ps - n_pe + n_pse
+    conteos[2] = n_s - n_ps - n_se + n_pse
+    conteos[4] = n_e - n_pe - n_se + n_pse
+    conteos[0] = n - sum(conteos)
+    return conteos
+
+
+def simular_lote(prelavado, secado, encerado, configuracion=None, por_vehiculo=True):
+    """
+    Simula el ciclo completo de cada vehículo de un lote, como si se llamase
+    a ejecutar_y_obtener_fases coche a coche en un Lavadero, pero sin
+    crear lavaderos ni avanzar fases.
+
+    A diferencia de Lavadero.cobrar_lote, las filas no permitidas (encerado
+    sin secado a mano) no anulan el lote: se rechazan una a una, igual que
+    hacer_lavado rechazaría ese coche, y no se cobran.
+
+    Los totales salen de contar cuántos vehículos hay de cada código de
+    opciones (con operaciones de bits sobre enteros de un byte por vehículo)
+    y multiplicar por el precio y la ruta de cada código.
+
+    Rendimiento: solo el modo por_vehiculo=False alcanza el objetivo de ser
+    100 veces más rápido que el bucle coche a coche (ver
+    benchmarks/bench_simulacion_lote.py). El modo por vehículo tiene que
+    materializar un byte de longitud por vehículo y se queda por debajo
+    (entre x60 y x90 según la máquina).
+
+    Args:
+        prelavado: Array de opciones de prelavado a mano (ver codificar_opciones_lote)
+        secado: Array de opciones de secado a mano
+        encerado: Array de opciones de encerado
+        configuracion: Configuracion con las rutas y precios a usar (por defecto las de Lavadero)
+        por_vehiculo (bool): Si False, solo se calculan los totales (sin "longitudes"
+                             ni "filas_rechazadas"); es el único modo que llega a x100
+
+    Returns:
+        dict: vehiculos, lavados, rechazados, filas_rechazadas (array de índices),
+              longitudes (bytes: fases que devolvería ejecutar_y_obtener_fases para
+              cada vehículo, 0 si se rechaza), conteos por código de opciones,
+              visitas_por_fase (ver lavadero.visitas_por_fase: cada fase de esas
+              listas salvo el INACTIVO final) e ingresos_centimos
+
+    Raises:
+        ValueError: Si los arrays no tienen la misma longitud
+    """
+    if configuracion is None:
+        rutas, precios_centimos = Lavadero._RUTAS, Lavadero._PRECIOS_CENTIMOS
+    else:
+        rutas, precios_centimos = configuracion.rutas, configuracion.precios_centimos
+
+    n, p, s, e = _enteros_opciones(prelavado, secado, encerado)
+    conteos = _conteos_por_codigo(n, p, s, e)
+
+    ingresos = rechazados = 0
+    for codigo, cuenta in enumerate(conteos):
+        if rutas[codigo] is None:
+            rechazados += cuenta
+        else:
+            ingresos += cuenta * precios_centimos[codigo]
+
+    resultado = {
+        "vehiculos": n,
+        "lavados": n - rechazados,
+        "rechazados": rechazados,
+        "filas_rechazadas": None,
+        "longitudes": None,
+        "conteos": conteos,
+        "visitas_por_fase": visitas_por_fase(rutas, conteos),
+        "ingresos_centimos": ingresos,
+    }
+    if por_vehiculo:
+        codigos = (p | s << 1 | e << 2).to_bytes(n, "little")
+        longitudes = bytearray(256)
+        for codigo, ruta in enumerate(rutas):
+            if ruta is not None:
+                longitudes[codigo] = len(ruta)
+        resultado["longitudes"] = codigos.translate(longitudes)
+        resultado["filas_rechazadas"] = _filas_rechazadas(n, s, e) if rechazados else array("q")
+    return resultado
+
+
+def _filas_rechazadas(n, s, e):
+    """
+    Índices de las filas con encerado sin secado a mano (las que rechaza
+    hacer_lavado). Se buscan con bytes.find sobre una máscara de 0/1, así
+    que el bucle Python es de una vuelta por fila rechazada, no por fila.
+    """
+    mascara = (e & ~s).to_bytes(n, "little")
+    filas = array("q")
+    buscar = mascara.find
+    fila = buscar(1)
+    while fila != -1:
+        filas.append(fila)
+        fila = buscar(1, fila + 1)
+    return filas
@@ -0,0 +1,202 @@
+# tunel_segmentado.py
+# Túnel de lavado segmentado: varios coches a la vez, cada uno en una fase distinta
+# Cada fase es una estación con su propia capacidad; los coches avanzan cuando la siguiente queda libre
+
+from collections import deque
+
+try:
+    from .lavadero import Lavadero
+except ImportError:
+    from lavadero import Lavadero
+
+
+NUM_FASES = Lavadero.FASE_ENCERADO + 1
+
+# Estaciones en orden inverso al del túnel. Todas las rutas recorren las fases en
+# orden creciente, así que procesando de la última a la primera cada coche que
+# avanza entra en una estación ya procesada en ese tick y no avanza dos veces.
+_ORDEN_ESTACIONES = range(Lavadero.FASE_ENCERADO, Lavadero.FASE_INACTIVO, -1)
+
+
+class TunelSegmentado:
+    """
+    Modelo de un túnel real en el que varios coches se lavan a la vez.
+
+    Cada fase (FASE_COBRANDO ... FASE_ENCERADO) es una estación con una
+    capacidad propia. Un coche recorre la misma ruta que produce avanzarFase
+    (ver Lavadero._RUTAS), permanece en cada estación los ticks de su
+    duración y pasa a la siguiente en cuanto hay sitio; si no lo hay, espera
+    bloqueado en la suya. Los coches que llegan sin sitio en la caja esperan
+    en una cola FIFO.
+
+    El estado de cada coche es una lista [código de opciones, posición en la
+    ruta, ticks que le quedan en la estación], y cada tick() recorre solo
+    los coches en el túnel: O(coches).
+    """
+
+    def __init__(self, capacidades=None, duraciones=None):
+        """
+        Args:
+            capacidades (dict): Coches a la vez en cada estación {FASE_*: n}; por defecto 1
+            duraciones (dict): Ticks que pasa un coche en cada estación {FASE_*: n}; por defecto 1
+                               (con todo a 1, cada tick equivale a un avanzarFase)
+
+        Raises:
+            ValueError: Si alguna capacidad o duración es menor que 1
+        """
+        self.capacidades = [1] * NUM_FASES
+        self.duraciones = [1] * NUM_FASES
+        for destino, valores in ((self.capacidades, capacidades), (self.duraciones, duraciones)):
+            for fase, valor in (valores or {}).items():
+                if fase == Lavadero.FASE_INACTIVO or not 0 < fase < NUM_FASES:
+                    raise ValueError(f"Fase no válida para una estación: {fase}")
+                if valor < 1:
+                    raise ValueError("Las capacidades y duraciones deben ser de al menos 1")
+                destino[fase] = valor
+
+        self._estaciones = [[] for _ in range(NUM_FASES)]
+        self._cola = deque()                 # Códigos de los coches que esperan para entrar
+        self.ticks = 0
+        self.terminados = 0
+        self.bloqueos = 0                    # Ticks-coche esperando a que se libere la estación siguiente
+        self.ingresos_centimos = 0
+
+    # ================== CONSULTAS ==================
+
+    @property
+    def en_curso(self):
+        """Coches dentro del túnel o esperando en la cola."""
+        return sum(map(len, self._estaciones)) + len(self._cola)
+
+    @property
+    def en_cola(self):
+        """Coches que esperan a que haya sitio en la caja."""
+        return len(self._cola)
+
+    @property
+    def libre(self):
+        """True si un coche que llegue ahora entraría directamente en la caja."""
+        return not self._cola and len(self._estaciones[Lavadero.FASE_COBRANDO]) < self.capacidades[Lavadero.FASE_COBRANDO]
+
+    def ocupacion(self):
+        """Coches en cada estación (lista indexada por FASE_*)."""
+        return [len(estacion) for estacion in self._estaciones]
+
+    # ================== OPERACIONES ==================
+
+    def entrar(self, prelavado_a_mano: bool, secado_a_mano: bool, encerado: bool):
+        """
+        Cobra un coche y lo pone en la caja, o en la cola si la caja está llena.
+
+        A diferencia de Lavadero.hacer_lavado, nunca falla con "Lavado en curso".
+
+        Raises:
+            ValueError: Si intenta encerar sin secado a mano
+        """
+        Lavadero.validar_lavado(False, secado_a_mano, encerado)
+        self.entrar_codigo(Lavadero.codigo_opciones(prelavado_a_mano, secado_a_mano, encerado))
+
+    def entrar_codigo(self, codigo: int):
+        """Como entrar(), con las opciones ya codificadas (ver Lavadero.codigo_opciones)."""
+        if Lavadero._RUTAS[codigo] is None:
+            raise ValueError("Encerado sin secado a mano no permitido")
+        self.ingresos_centimos += Lavadero._PRECIOS_CENTIMOS[codigo]
+        self._cola.append(codigo)
+        self._admitir()
+
+    def _admitir(self):
+        """Pasa coches de la cola a la caja mientras haya sitio."""
+        caja = self._estaciones[Lavadero.FASE_COBRANDO]
+        capacidad = self.capacidades[Lavadero.FASE_COBRANDO]
+        duracion = self.duraciones[Lavadero.FASE_COBRANDO]
+        cola = self._cola
+        while cola and len(caja) < capacidad:
+            caja.append([cola.popleft(), 1, duracion])
+
+    def tick(self):
+        """
+        Avanza una unidad de tiempo todos los coches del túnel.
+
+        Returns:
+            int: Coches que han terminado su ciclo en este tick
+        """
+        estaciones, capacidades, duraciones = self._estaciones, self.capacidades, self.duraciones
+        rutas = Lavadero._RUTAS
+        terminados = bloqueos = 0
+        for fase in _ORDEN_ESTACIONES:
+            estacion = estaciones[fase]
+            if not estacion:
+                continue
+            quedan = []
+            for coche in estacion:
+                coche[2] -= 1
+                if coche[2] <= 0:
+                    siguiente = rutas[coche[0]][coche[1] + 1]
+                    if siguiente == Lavadero.FASE_INACTIVO:
+                        terminados += 1
+                        continue
+                    destino = estaciones[siguiente]
+                    if len(destino) < capacidades[siguiente]:
+                        coche[1] += 1
+                        coche[2] = duraciones[siguiente]
+                        destino.append(coche)
+                        continue
+                    bloqueos += 1
+                quedan.append(coche)
+            estaciones[fase] = quedan
+
+        self._admitir()
+        self.ticks += 1
+        self.terminados += terminados
+        self.bloqueos += bloqueos
+        return terminados
+
+
+# ================== COMPARACIÓN CON EL TÚNEL DE OCUPACIÓN ÚNICA ==================
+
+def ticks_ocupacion_unica(codigos, duraciones=None):
+    """
+    Ticks que tarda un Lavadero (un coche cada vez) en lavar todos los coches:
+    la suma de las duraciones de las estaciones de cada ruta.
+    """
+    por_fase = [1] * NUM_FASES
+    for fase, valor in (duraciones or {}).items():
+        por_fase[fase] = valor
+    por_codigo = [sum(por_fase[fase] for fase in ruta[1:-1]) if ruta else 0 for ruta in Lavadero._RUTAS]
+    return sum(por_codigo[codigo] * bytes(codigos).count(codigo) for codigo in range(8))
+
+
+def comparar_con_ocupacion_unica(codigos, capacidades=None, duraciones=None):
+    """
+    Lava la misma cola de coches con el túnel segmentado y con un único
+    coche a la vez, y compara cuánto tardan.
+
+    Args:
+        codigos: Códigos de opciones de los coches, en orden de llegada
+        capacidades (dict): Capacidad de cada estación del túnel segmentado
+        duraciones (dict): Ticks por estación (los mismos para ambos modelos)
+
+    Returns:
+        dict: coches, ticks de cada modelo, aceleración, coches por tick
+              del túnel segmentado y ocupación media de cada estación
+    """
+    tunel = TunelSegmentado(capacidades, duraciones)
+    for codigo in codigos:
+        tunel.entrar_codigo(codigo)
+    suma_ocupacion = [0] * NUM_FASES
+    while tunel.en_curso:
+        tunel.tick()
+        for fase, coches in enumerate(tunel.ocupacion()):
+            suma_ocupacion[fase] += coches
+
+    segmentado = tunel.ticks
+    unica = ticks_ocupacion_unica(codigos, duraciones)
+    return {
+        "coches": tunel.terminados,
+        "ticks_segmentado": segmentado,
+        "ticks_ocupacion_unica": unica,
+        "aceleracion": unica / segmentado if segmentado else 1.0,
+        "coches_por_tick": tunel.terminados / segmentado if segmentado else 0.0,
+        "ocupacion_media": [total / segmentado if segmentado else 0.0 for total in suma_ocupacion],
+        "bloqueos": tunel.bloqueos,
+    }
@@ -0,0 +1,93 @@
+# test_analitica_unittest.py
+# Tests unitarios de los agregados de ingresos por combinación, ruta y franja horaria
+
+import pickle
+import random
+import unittest
+
+from src.analitica import NANOSEGUNDOS, AgregadoLavados
+from src.configuracion import compilar_configuracion
+from src.lavadero import Lavadero
+from src.simulacion_eventos import DURACIONES_POR_DEFECTO
+
+HORA = 3600 * NANOSEGUNDOS
+
+
+class TestAnalitica(unittest.TestCase):
+    """
+    Suite de pruebas de registro, consultas y fusión de agregados.
+    """
+
+    def setUp(self):
+        azar = random.Random(11)
+        codigos = [c for c in range(8) if c not in (4, 5)]
+        self.registros = []
+        for i in range(2000):
+            codigo = azar.choice(codigos)
+            self.registros.append((i * 90 * NANOSEGUNDOS, Lavadero._PRECIOS_CENTIMOS[codigo], codigo))
+
+    def test01_consultas(self):
+        """
+        TEST 1: Totales, combinaciones, rutas, adjunción y tiempo por fase cuadran con los registros.
+        """
+        agregado = AgregadoLavados().consumir(self.registros)
+        self.assertEqual(agregado.totales()["lavados"], 2000)
+        self.assertEqual(agregado.totales()["centimos"], sum(r[1] for r in self.registros))
+
+        completos = agregado.por_combinacion()[7]
+        self.assertEqual(completos["lavados"], sum(1 for r in self.registros if r[2] == 7))
+        self.assertEqual(agregado.por_ruta()[Lavadero.ruta_para((True, True, True))], completos)
+
+        secado = sum(1 for r in self.registros if r[2] & 2) / 2000
+        self.assertAlmostEqual(agregado.tasas_adjuncion()["secado_a_mano"], secado)
+
+        tiempo_encerado = sum(1 for r in self.registros if r[2] == 6 or r[2] == 7) * DURACIONES_POR_DEFECTO[8]
+        self.assertEqual(agregado.tiempo_por_fase()[Lavadero.FASE_ENCERADO], tiempo_encerado)
+
+    def test02_cubetas(self):
+        """
+        TEST 2: Cada cubeta horaria tiene solo los lavados de su hora.
+        """
+        agregado = AgregadoLavados(segundos_por_cubeta=3600).consumir(self.registros)
+        primera_hora = [r for r in self.registros if r[0] < HORA]
+        self.assertEqual(sum(agregado.cubeta(0)["lavados"]), len(primera_hora))
+        self.assertEqual(sum(agregado.cubeta(HORA - 1)["centimos"]), sum(r[1] for r in primera_hora))
+        serie = agregado.serie_temporal()
+        self.assertEqual(serie[1][0], HORA)
+        self.assertEqual(sum(lavados for _, lavados, _ in serie), 2000)
+
+    def test03_fusion_de_trabajadores(self):
+        """
+        TEST 3: Fusionar agregados parciales (también tras pasar por pickle) da el agregado completo.
+        """
+        completo = AgregadoLavados().consumir(self.registros)
+        parte1 = AgregadoLavados().consumir(self.registros[:700])
+        parte2 = pickle.loads(pickle.dumps(AgregadoLavados().consumir(self.registros[700:])))
+        fusionado = parte1.fusionar(parte2)
+        self.assertEqual(fusionado.lavados, completo.lavados)
+        self.assertEqual(fusionado.centimos, completo.centimos)
+        self.assertEqual(fusionado.cubetas, completo.cubetas)
+
+        lote = AgregadoLavados().registrar_lote(bytes([0, 3, 3, 7]), marca_tiempo=0)
+        self.assertEqual(lote.totales()["centimos"], 500 + 750 + 750 + 870)
+        with self.assertRaises(ValueError):
+            lote.fusionar(AgregadoLavados(segundos_por_cubeta=60))
+
+    def test04_rutas_del_tunel_configurado(self):
+        """
+        TEST 4: Con el lavadero de origen, rutas y tiempo por fase salen de su configuración.
+        """
+        lavadero = Lavadero()
+        lavadero.aplicar_configuracion(compilar_configuracion({"secado_automatico": False}))
+        agregado = AgregadoLavados(lavadero=lavadero).consumir(self.registros)
+        self.assertEqual(agregado.rutas[0], lavadero.ruta_configurada((False, False, False)))
+        self.assertNotEqual(agregado.rutas[0], Lavadero.ruta_para((False, False, False)))
+        self.assertIn(lavadero.ruta_configurada((True, True, True)), agregado.por_ruta())
+        self.assertEqual(agregado.tiempo_por_fase()[Lavadero.FASE_SECADO_AUTOMATICO], 0)
+        self.assertGreater(AgregadoLavados().consumir(self.registros).tiempo_por_fase()[6], 0)
+        with self.assertRaises(ValueError):
+            agregado.fusionar(AgregadoLavados())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
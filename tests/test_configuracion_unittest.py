@@ -0,0 +1,184 @@
+# test_configuracion_unittest.py
+# Tests unitarios de la configuración de precios y fases y de su recarga en caliente
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+
+from src.configuracion import RecargadorConfiguracion, cargar_configuracion, compilar_configuracion
+from src.flota import FlotaLavaderos
+from src.lavadero import Lavadero
+from src.main_app import main, simular_vehiculos
+
+# Sede sin enjabonado, con los rodillos antes del agua y sin secador automático
+SEDE_NORTE = {
+    "nombre": "norte",
+    "precios_centimos": {"base": 600, "encerado": 200},
+    "orden_lavado": ["rodillos", "echando_agua"],
+    "secado_automatico": False,
+}
+
+
+class TestConfiguracion(unittest.TestCase):
+    """
+    Suite de pruebas de compilación, aplicación y recarga de configuraciones.
+    """
+
+    def test01_configuracion_por_defecto(self):
+        """
+        TEST 1: La configuración por defecto compila exactamente las tablas de Lavadero.
+        """
+        configuracion = compilar_configuracion()
+        self.assertEqual(configuracion.precios_centimos, Lavadero._PRECIOS_CENTIMOS)
+        self.assertEqual(configuracion.precios, Lavadero._PRECIOS)
+        self.assertEqual(configuracion.rutas, Lavadero._RUTAS)
+        for clave, siguiente in configuracion.tabla_transiciones.items():
+            self.assertEqual(Lavadero._TABLA_TRANSICIONES[clave], siguiente)
+
+    def test02_configuracion_de_sede(self):
+        """
+        TEST 2: Precios, fases y orden de la sede se aplican; los datos no válidos se rechazan.
+        """
+        lavadero = Lavadero()
+        self.assertTrue(lavadero.aplicar_configuracion(compilar_configuracion(SEDE_NORTE)))
+        self.assertEqual(lavadero.ejecutar_y_obtener_fases(False, False, False), [0, 1, 5, 3, 0])
+        self.assertEqual(lavadero.ejecutar_y_obtener_fases(True, True, True), [0, 1, 2, 5, 3, 7, 8, 0])
+        self.assertEqual(lavadero.ingresos_centimos, 600 + 600 + 150 + 100 + 200)
+
+        lavadero.hacer_lavado(False, True, False)
+        fases = [lavadero.fase]
+        while lavadero.ocupado:
+            lavadero.avanzarFase()
+            fases.append(lavadero.fase)
+        self.assertEqual(fases, [0, 1, 5, 3, 7, 0])
+
+        for datos in ({"precio": 1}, {"precios_centimos": {"base": -1}}, {"precios_centimos": {"base": 5.5}},
+                      {"orden_lavado": ["rodillos", "rodillos"]}, {"orden_lavado": ["encerado"]},
+                      {"secado_automatico": "no"}):
+            with self.assertRaises(ValueError):
+                compilar_configuracion(datos)
+
+    def test03_recarga_entre_ciclos(self):
+        """
+        TEST 3: Un ciclo en curso termina con su configuración; el siguiente usa la nueva.
+        """
+        lavadero = Lavadero()
+        lavadero.hacer_lavado(False, False, False)
+        lavadero.avanzarFase()
+        self.assertFalse(lavadero.aplicar_configuracion(compilar_configuracion(SEDE_NORTE)))
+        self.assertIsNone(lavadero.configuracion)
+
+        fases = [lavadero.fase]
+        while lavadero.ocupado:
+            lavadero.avanzarFase()
+            fases.append(lavadero.fase)
+        self.assertEqual(fases, [1, 3, 4, 5, 6, 0])
+        self.assertEqual(lavadero.configuracion.nombre, "norte")
+        self.assertEqual(lavadero.ejecutar_y_obtener_fases(False, False, False), [0, 1, 5, 3, 0])
+        self.assertEqual(lavadero.ingresos_centimos, 500 + 600)
+
+    def test04_recarga_en_flota(self):
+        """
+        TEST 4: En una flota, los túneles ocupados acaban con las tablas anteriores y los libres usan las nuevas.
+        """
+        flota = FlotaLavaderos(3)
+        flota.hacer_lavado(0, False, True, True)
+        flota.avanzar_todas()
+        flota.aplicar_configuracion(compilar_configuracion(SEDE_NORTE))
+        flota.hacer_lavado(1, False, True, True)
+        flota.hacer_lavado(2, False, False, False)
+
+        recorridos = [[flota[i].fase] for i in range(3)]
+        for _ in range(6):
+            flota.avanzar_todas()
+            for i in range(3):
+                recorridos[i].append(flota[i].fase)
+        self.assertEqual(recorridos[0], [1, 3, 4, 5, 7, 8, 0])
+        self.assertEqual(recorridos[1], [0, 1, 5, 3, 7, 8, 0])
+        self.assertEqual(recorridos[2], [0, 1, 5, 3, 0, 0, 0])
+        self.assertEqual(len(flota._configuraciones), 1)
+        self.assertEqual(flota.ingresos_centimos, 720 + 900 + 600)
+        self.assertEqual(flota[0].ejecutar_y_obtener_fases(False, False, False), [0, 1, 5, 3, 0])
+
+    def test05_recargador(self):
+        """
+        TEST 5: El recargador solo aplica la configuración cuando el fichero cambia y la deja intacta si es errónea.
+        """
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "sede.json")
+            with open(ruta, "w", encoding="utf-8") as fichero:
+                json.dump(SEDE_NORTE, fichero)
+            self.assertEqual(cargar_configuracion(ruta).precios_centimos[0], 600)
+
+            lavadero, flota = Lavadero(), FlotaLavaderos(2)
+            recargador = RecargadorConfiguracion(ruta, [lavadero, flota])
+            self.assertTrue(recargador.comprobar())
+            self.assertFalse(recargador.comprobar())
+            self.assertEqual(flota.configuracion.nombre, "norte")
+
+            with open(ruta, "w", encoding="utf-8") as fichero:
+                fichero.write("{no es json")
+            with self.assertRaises(ValueError):
+                recargador.comprobar()
+            self.assertEqual(lavadero.configuracion.nombre, "norte")
+
+
+    def test06_tablas_por_instancia_solo_con_configuracion(self):
+        """
+        TEST 6: Un lavadero sin configuración lee las tablas de la clase; solo al
+        aplicar una guarda las suyas, y los demás lavaderos no se ven afectados.
+        """
+        estandar, configurado = Lavadero(), Lavadero()
+        self.assertNotIn("_precios_centimos", vars(estandar))
+        configurado.aplicar_configuracion(compilar_configuracion(SEDE_NORTE))
+        self.assertIn("_precios_centimos", vars(configurado))
+        self.assertNotIn("_precios_centimos", vars(estandar))
+        self.assertEqual(estandar.ejecutar_y_obtener_fases(False, False, False), [0, 1, 3, 4, 5, 6, 0])
+        self.assertEqual(configurado.ejecutar_y_obtener_fases(False, False, False), [0, 1, 5, 3, 0])
+        self.assertEqual((estandar.ingresos_centimos, configurado.ingresos_centimos), (500, 600))
+
+    def test07_precios_publicos(self):
+        """
+        TEST 7: precios y precios_centimos siguen la configuración aplicada, y las
+        líneas del modo silencioso de main_app muestran ese precio.
+        """
+        lavadero = Lavadero()
+        self.assertEqual(lavadero.precios_centimos[0], 500)
+        self.assertEqual(lavadero.precios[7], 8.70)
+        lavadero.aplicar_configuracion(compilar_configuracion(SEDE_NORTE))
+        self.assertEqual(lavadero.precios_centimos[0], 600)
+        self.assertEqual(lavadero.precios[0], 6.0)
+        self.assertEqual(Lavadero().precios_centimos[0], 500)
+
+        salida = io.StringIO()
+        simular_vehiculos(lavadero, [0], "silencioso", salida=salida)
+        self.assertEqual(salida.getvalue(), "1 000 6.00\n")
+
+    def test08_tipos_no_validos(self):
+        """
+        TEST 8: Datos que no son un objeto, o con claves del tipo equivocado, se
+        rechazan con ValueError (no TypeError ni AttributeError), y main_app lo
+        muestra como error en lugar de una traza.
+        """
+        for datos in ([1, 2], [], 3, "", "norte", {"precios_centimos": [1]}, {"precios_centimos": 5},
+                      {"orden_lavado": 3}, {"orden_lavado": [1]}, {"nombre": 7}):
+            with self.assertRaises(ValueError):
+                compilar_configuracion(datos)
+        self.assertEqual(compilar_configuracion(None).rutas, Lavadero._RUTAS)
+
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "cfg.json")
+            with open(ruta, "w", encoding="utf-8") as fichero:
+                fichero.write("[1, 2]")
+            errores = io.StringIO()
+            with redirect_stderr(errores), self.assertRaises(SystemExit) as salida:
+                main(["--vehiculos", "3", "--configuracion", ruta])
+        self.assertEqual(salida.exception.code, 1)
+        self.assertIn("objeto JSON", errores.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
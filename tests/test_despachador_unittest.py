@@ -0,0 +1,121 @@
+# test_despachador_unittest.py
+# Tests unitarios del despachador de coches entre varios túneles y de sus políticas
+
+import heapq
+import random
+import unittest
+
+from src.configuracion import compilar_configuracion
+from src.despachador import Despachador, PoliticaAfinidad, PoliticaMenorRestante
+from src.lavadero import Lavadero
+
+
+class TestDespachador(unittest.TestCase):
+    """
+    Suite de pruebas de asignación, liberación y políticas de reparto.
+    """
+
+    def test01_menos_cargado(self):
+        """
+        TEST 1: Primero los túneles libres, después la cola del menos cargado; liberar da paso al siguiente.
+        """
+        despachador = Despachador([Lavadero() for _ in range(3)])
+        self.assertEqual([despachador.asignar(False, False, False) for _ in range(3)], [0, 1, 2])
+        self.assertTrue(all(lavadero.ocupado for lavadero in despachador.lavaderos))
+
+        self.assertEqual(despachador.asignar(True, True, True), 0)
+        self.assertEqual(despachador.asignar(False, False, False), 1)
+        self.assertEqual(despachador.cargas, [2, 2, 1])
+        with self.assertRaises(ValueError):
+            despachador.asignar(False, False, True)
+        self.assertEqual(despachador.asignados, 5)
+
+        self.assertEqual(despachador.liberar(0), 7)
+        self.assertTrue(despachador.lavaderos[0].encerado)
+        self.assertIsNone(despachador.liberar(2))
+        self.assertFalse(despachador.lavaderos[2].ocupado)
+        self.assertEqual(despachador.asignar(False, True, False), 2)
+        self.assertEqual(sum(lavadero.ingresos_centimos for lavadero in despachador.lavaderos), 3 * 500 + 870 + 600)
+
+        despachador.liberar(2)
+        with self.assertRaises(ValueError):
+            despachador.liberar(2)
+
+    def test02_menor_restante(self):
+        """
+        TEST 2: Sin túneles libres, el coche va al que se espera que termine antes según su fase y opciones.
+        """
+        avanzado = Lavadero()
+        avanzado.hacer_lavado(True, True, True)
+        for _ in range(6):
+            avanzado.avanzarFase()                    # En secado a mano: le quedan 2 fases
+        despachador = Despachador([Lavadero(), avanzado, Lavadero()], politica=PoliticaMenorRestante())
+        self.assertEqual(despachador.fin_estimado[1], 2)
+
+        self.assertEqual(despachador.asignar(True, True, True, ahora=0), 0)    # 7 fases
+        self.assertEqual(despachador.asignar(False, False, False, ahora=0), 2)  # 5 fases
+        self.assertEqual(despachador.asignar(False, False, False, ahora=1), 1)
+        self.assertEqual(despachador.fin_estimado, [7, 7, 5])
+        self.assertEqual(despachador.asignar(False, False, False, ahora=1), 2)
+
+    def test03_afinidad_por_servicio_a_mano(self):
+        """
+        TEST 3: Los servicios a mano van a las bahías con personal y el resto a los túneles automáticos.
+        """
+        despachador = Despachador([Lavadero() for _ in range(4)], politica=PoliticaAfinidad({0, 1}))
+        self.assertIn(despachador.asignar(False, True, False), (0, 1))
+        self.assertIn(despachador.asignar(False, False, False), (2, 3))
+        self.assertIn(despachador.asignar(False, False, False), (2, 3))
+        self.assertIn(despachador.asignar(False, False, False), (0, 1))    # Automáticos llenos: bahía libre
+        self.assertIn(despachador.asignar(True, False, False), (0, 1))     # Todo lleno: cola de una bahía
+        self.assertEqual(despachador.encolados, 1)
+
+    def test04_simulacion_aleatoria(self):
+        """
+        TEST 4: Con llegadas y liberaciones al azar, la carga de cada túnel cuadra y se cobra cada coche una vez.
+        """
+        azar = random.Random(5)
+        codigos = [0, 1, 2, 3, 6, 7]
+        for politica in (None, PoliticaMenorRestante(), PoliticaAfinidad(range(0, 20, 3))):
+            despachador = Despachador([Lavadero() for _ in range(20)], politica=politica)
+            ahora, en_curso, esperado = 0, [], 0
+            for _ in range(3000):
+                ahora += azar.random() * 0.5
+                while en_curso and en_curso[0][0] <= ahora:
+                    fin, idx = heapq.heappop(en_curso)
+                    siguiente = despachador.liberar(idx, fin)
+                    if siguiente is not None:
+                        duracion = despachador.lavaderos[idx].tiempo_restante(despachador._duraciones)
+                        heapq.heappush(en_curso, (fin + duracion, idx))
+                codigo = azar.choice(codigos)
+                idx = despachador.asignar(*[bool(codigo & bit) for bit in (1, 2, 4)], ahora=ahora)
+                esperado += Lavadero._PRECIOS_CENTIMOS[codigo]
+                if despachador.cargas[idx] == 1:
+                    duracion = despachador.lavaderos[idx].tiempo_restante(despachador._duraciones)
+                    heapq.heappush(en_curso, (ahora + duracion, idx))
+
+            for idx, lavadero in enumerate(despachador.lavaderos):
+                self.assertEqual(despachador.cargas[idx], lavadero.ocupado + len(despachador._colas[idx]))
+            cobrado = sum(lavadero.ingresos_centimos for lavadero in despachador.lavaderos)
+            pendiente = sum(Lavadero._PRECIOS_CENTIMOS[c] for cola in despachador._colas for c, _ in cola)
+            self.assertEqual(cobrado + pendiente, esperado)
+
+    def test05_duracion_segun_la_configuracion_de_cada_tunel(self):
+        """
+        TEST 5: El fin estimado usa la ruta de cada túnel: sin secado automático el ciclo
+        tiene una fase menos, tanto el que empieza como los que esperan en cola.
+        """
+        corto = Lavadero()
+        corto.aplicar_configuracion(compilar_configuracion({"secado_automatico": False}))
+        despachador = Despachador([Lavadero(), corto], politica=PoliticaMenorRestante())
+        self.assertEqual(despachador.asignar(False, False, False, ahora=0), 0)
+        self.assertEqual(despachador.asignar(False, False, False, ahora=0), 1)
+        self.assertEqual(despachador.fin_estimado, [5, 4])
+        self.assertEqual(despachador.asignar(False, False, False, ahora=0), 1)
+        self.assertEqual(despachador.fin_estimado, [5, 8])
+        self.assertEqual(despachador.liberar(1, ahora=4), 0)
+        self.assertEqual(despachador.fin_estimado, [5, 8])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,112 @@
+# test_diario_unittest.py
+# Tests unitarios del diario binario de lavados
+
+import gc
+import os
+import tempfile
+import unittest
+import warnings
+
+from src.diario import DiarioEscritor, iterar_diario, reproducir_diario, REGISTRO
+from src.lavadero import Lavadero
+
+
+class TestDiario(unittest.TestCase):
+    """
+    Suite de pruebas del diario: escritura por lotes, lectura y reproducción.
+    """
+
+    def setUp(self):
+        descriptor, self.ruta = tempfile.mkstemp(suffix=".diario")
+        os.close(descriptor)
+        os.remove(self.ruta)
+
+    def tearDown(self):
+        if os.path.exists(self.ruta):
+            os.remove(self.ruta)
+
+    def test01_lavadero_registra_cada_lavado_aceptado(self):
+        """
+        TEST 1: Cada hacer_lavado aceptado deja un registro; los rechazados no.
+
+        La reproducción del diario debe dar los mismos ingresos que el lavadero.
+        """
+        with DiarioEscritor(self.ruta, registros_por_lote=4) as diario:
+            lavadero = Lavadero(diario=diario)
+            for opciones in list(Lavadero.RUTAS) * 3:
+                lavadero.ejecutar_y_obtener_fases(*opciones)
+            with self.assertRaises(ValueError):
+                lavadero.hacer_lavado(False, False, True)
+
+        resumen = reproducir_diario(self.ruta)
+        self.assertEqual(resumen["registros"], 18)
+        self.assertEqual(resumen["ingresos_centimos"], lavadero.ingresos_centimos)
+        self.assertEqual(resumen["por_opcion"]["encerado"], 6)
+        self.assertEqual(resumen["por_codigo"][Lavadero.codigo_opciones(True, True, True)], 3)
+
+    def test02_iterar_registros_y_anadir(self):
+        """
+        TEST 2: Los registros se leen tal cual se escribieron, también al reabrir el diario.
+        """
+        with DiarioEscritor(self.ruta) as diario:
+            diario.registrar(3, 750, marca_tiempo=1)
+        with DiarioEscritor(self.ruta) as diario:
+            diario.registrar(7, 870, marca_tiempo=2)
+
+        self.assertEqual(list(iterar_diario(self.ruta)), [(1, 750, 3), (2, 870, 7)])
+
+    def test03_registro_incompleto_ignorado(self):
+        """
+        TEST 3: Un registro final a medio escribir (caída) se ignora al reproducir.
+        """
+        with DiarioEscritor(self.ruta) as diario:
+            diario.registrar(0, 500)
+            diario.registrar(1, 650)
+        with open(self.ruta, "ab") as fichero:
+            fichero.write(b"\x01" * (REGISTRO.size // 2))
+
+        resumen = reproducir_diario(self.ruta)
+        self.assertEqual(resumen["registros"], 2)
+        self.assertEqual(resumen["ingresos_centimos"], 1150)
+
+    def test04_fichero_ajeno_rechazado(self):
+        """
+        TEST 4: Un fichero que no es un diario se rechaza con ValueError.
+        """
+        with open(self.ruta, "wb") as fichero:
+            fichero.write(b"esto no es un diario de lavados")
+        with self.assertRaises(ValueError):
+            reproducir_diario(self.ruta)
+        # Abrirlo para añadir también falla, sin dejar el fichero abierto
+        with warnings.catch_warnings(record=True) as avisos:
+            warnings.simplefilter("always", ResourceWarning)
+            with self.assertRaises(ValueError):
+                DiarioEscritor(self.ruta)
+            gc.collect()
+        self.assertEqual([aviso for aviso in avisos if aviso.category is ResourceWarning], [])
+        with open(self.ruta, "rb") as fichero:
+            self.assertEqual(fichero.read(), b"esto no es un diario de lavados")
+
+
+    def test05_reabrir_tras_registro_incompleto(self):
+        """
+        TEST 5: Al reabrir un diario cortado a mitad de registro, los nuevos
+        registros quedan alineados y se reproducen todos.
+        """
+        with DiarioEscritor(self.ruta) as diario:
+            for mascara, precio in ((0, 500), (3, 750), (7, 870)):
+                diario.registrar(mascara, precio, marca_tiempo=1)
+        with open(self.ruta, "ab") as fichero:
+            fichero.write(b"\xff" * 5)
+        with DiarioEscritor(self.ruta) as diario:
+            for _ in range(3):
+                diario.registrar(0, 500, marca_tiempo=2)
+
+        resumen = reproducir_diario(self.ruta)
+        self.assertEqual(resumen["registros"], 6)
+        self.assertEqual(resumen["ingresos_centimos"], 2120 + 1500)
+        self.assertEqual([marca for marca, _, _ in iterar_diario(self.ruta)], [1, 1, 1, 2, 2, 2])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
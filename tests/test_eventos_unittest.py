@@ -0,0 +1,114 @@
+# test_eventos_unittest.py
+# Tests unitarios del flujo de eventos de Lavadero y de sus sumideros
+
+import gc
+import json
+import os
+import tempfile
+import unittest
+
+from src.eventos import BufferCircular, SumideroCallback, SumideroNDJSON
+from src.lavadero import EVENTO_COBRO, EVENTO_FASE, EVENTO_RECHAZO, Lavadero
+
+
+class TestEventos(unittest.TestCase):
+    """
+    Suite de pruebas de los eventos de fase, cobro y rechazo.
+    """
+
+    def setUp(self):
+        self.lavadero = Lavadero()
+        self.buffer = BufferCircular()
+        self.lavadero.suscribir(self.buffer)
+
+    def test01_eventos_de_un_ciclo(self):
+        """
+        TEST 1: Un ciclo emite un cobro y una transición por cada paso de la ruta.
+        """
+        self.lavadero.hacer_lavado(False, True, True)
+        while self.lavadero.ocupado:
+            self.lavadero.avanzarFase()
+
+        eventos = self.buffer.eventos()
+        self.assertEqual(eventos[0], (EVENTO_COBRO, self.lavadero, 6, 720))
+        ruta = Lavadero.ruta_para((False, True, True))
+        self.assertEqual([(e[2], e[3]) for e in eventos[1:]], list(zip(ruta, ruta[1:])))
+        self.assertTrue(all(e[0] == EVENTO_FASE for e in eventos[1:]))
+
+    def test02_ejecutar_y_obtener_fases_emite_lo_mismo(self):
+        """
+        TEST 2: ejecutar_y_obtener_fases emite los mismos eventos que avanzar fase a fase.
+        """
+        self.lavadero.hacer_lavado(True, False, False)
+        while self.lavadero.ocupado:
+            self.lavadero.avanzarFase()
+        paso_a_paso = self.buffer.vaciar()
+
+        self.lavadero.ejecutar_y_obtener_fases(True, False, False)
+        self.assertEqual(self.buffer.vaciar(), paso_a_paso)
+
+    def test03_rechazo_y_desuscribir(self):
+        """
+        TEST 3: Los ValueError se emiten como rechazo; sin oyentes no se emite nada.
+        """
+        with self.assertRaises(ValueError):
+            self.lavadero.hacer_lavado(False, False, True)
+        self.assertEqual(self.buffer.eventos(),
+                         [(EVENTO_RECHAZO, self.lavadero, "Encerado sin secado a mano no permitido", None)])
+
+        self.lavadero.desuscribir(self.buffer)
+        self.lavadero.ejecutar_y_obtener_fases(False, False, False)
+        self.assertEqual(self.buffer.recibidos, 1)
+        with self.assertRaises(ValueError):
+            self.lavadero.desuscribir(self.buffer)
+
+    def test04_sumideros_por_lotes(self):
+        """
+        TEST 4: Los sumideros de callback y NDJSON entregan los eventos por lotes.
+        """
+        lotes = []
+        self.lavadero.suscribir(SumideroCallback(lotes.append, tamano_lote=3))
+        self.lavadero.ejecutar_y_obtener_fases(False, False, False)     # 1 cobro + 6 fases
+        self.assertEqual([len(lote) for lote in lotes], [3, 3])
+
+        descriptor, ruta = tempfile.mkstemp(suffix=".ndjson")
+        os.close(descriptor)
+        try:
+            with SumideroNDJSON(ruta, nombrar=lambda lavadero: "tunel-1") as sumidero:
+                otro = Lavadero()
+                otro.suscribir(sumidero)
+                otro.ejecutar_y_obtener_fases(True, True, False)
+            with open(ruta, encoding="utf-8") as fichero:
+                lineas = [json.loads(linea) for linea in fichero]
+        finally:
+            os.remove(ruta)
+
+        self.assertEqual(lineas[0], {"tipo": "cobro", "lavadero": "tunel-1", "opciones": 3, "centimos": 750})
+        self.assertEqual(len(lineas), 1 + len(Lavadero.ruta_para((True, True, False))) - 1)
+
+    def test05_sumidero_ndjson_no_retiene_lavaderos(self):
+        """
+        TEST 5: Por defecto el sumidero NDJSON numera los lavaderos 1, 2... sin retenerlos:
+        un lavadero que desaparece se suelta y su número no se reutiliza.
+        """
+        descriptor, ruta = tempfile.mkstemp(suffix=".ndjson")
+        os.close(descriptor)
+        try:
+            with SumideroNDJSON(ruta, tamano_lote=1) as sumidero:
+                for _ in range(2):
+                    temporal = Lavadero()
+                    temporal.suscribir(sumidero)
+                    temporal.hacer_lavado(False, False, False)
+                    del temporal
+                    gc.collect()
+                    self.assertEqual(len(sumidero._nombres), 0)
+            with open(ruta, encoding="utf-8") as fichero:
+                lineas = [json.loads(linea) for linea in fichero]
+        finally:
+            os.remove(ruta)
+
+        self.assertEqual([linea["lavadero"] for linea in lineas], [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,155 @@
+# test_flota_unittest.py
+# Tests unitarios de FlotaLavaderos: la flota debe comportarse como N objetos Lavadero
+
+import unittest
+
+from src.configuracion import compilar_configuracion
+from src.flota import FlotaLavaderos
+from src.lavadero import Lavadero
+
+
+class TestFlotaLavaderos(unittest.TestCase):
+    """
+    Suite de pruebas de la flota de túneles.
+    Se compara siempre contra Lavadero, que es la implementación de referencia.
+    """
+
+    def setUp(self):
+        """Crea una flota nueva con un túnel por cada combinación válida de opciones."""
+        self.opciones = list(Lavadero.RUTAS)
+        self.flota = FlotaLavaderos(len(self.opciones))
+
+    def test01_estado_inicial(self):
+        """
+        TEST 1: Todos los túneles empiezan como un Lavadero recién creado.
+        """
+        for tunel in self.flota:
+            self.assertEqual(tunel.fase, Lavadero.FASE_INACTIVO)
+            self.assertEqual(tunel.ingresos, 0.0)
+            self.assertFalse(tunel.ocupado)
+            self.assertFalse(tunel.prelavado_a_mano)
+            self.assertFalse(tunel.secado_a_mano)
+            self.assertFalse(tunel.encerado)
+
+    def test02_avanzar_todas_sigue_las_rutas(self):
+        """
+        TEST 2: avanzar_todas recorre en cada túnel la misma ruta que Lavadero.
+
+        Cada túnel usa una combinación distinta, así que avanzan en paralelo
+        por rutas de longitudes diferentes.
+        """
+        for idx, opciones in enumerate(self.opciones):
+            self.flota.hacer_lavado(idx, *opciones)
+
+        recorridos = [[tunel.fase] for tunel in self.flota]
+        while self.flota.ocupados:
+            self.flota.avanzar_todas()
+            for idx, tunel in enumerate(self.flota):
+                if recorridos[idx][-1] != Lavadero.FASE_INACTIVO or len(recorridos[idx]) == 1:
+                    recorridos[idx].append(tunel.fase)
+
+        for idx, opciones in enumerate(self.opciones):
+            self.assertEqual(tuple(recorridos[idx]), Lavadero.ruta_para(opciones))
+            self.assertFalse(self.flota[idx].encerado)
+
+    def test03_vista_igual_que_lavadero(self):
+        """
+        TEST 3: La vista de un túnel cobra y avanza exactamente como Lavadero.
+        """
+        referencia = Lavadero()
+        tunel = self.flota[-1]
+        for opciones in self.opciones:
+            self.assertEqual(tunel.ejecutar_y_obtener_fases(*opciones),
+                             referencia.ejecutar_y_obtener_fases(*opciones))
+        self.assertEqual(tunel.ingresos_centimos, referencia.ingresos_centimos)
+        self.assertEqual(self.flota.ingresos_centimos, referencia.ingresos_centimos)
+
+    def test04_reglas_de_negocio(self):
+        """
+        TEST 4: La flota aplica las mismas validaciones que Lavadero.
+        """
+        with self.assertRaises(ValueError) as context:
+            self.flota.hacer_lavado(0, False, False, True)
+        self.assertEqual(str(context.exception), "Encerado sin secado a mano no permitido")
+
+        self.flota[0].hacer_lavado(False, False, False)
+        with self.assertRaises(ValueError) as context:
+            self.flota[0].hacer_lavado(False, False, False)
+        self.assertEqual(str(context.exception), "Lavado en curso")
+
+        # El resto de túneles no se ven afectados
+        self.assertEqual(self.flota.ocupados, 1)
+        self.assertEqual(self.flota.ingresos, 5.0)
+
+    def test05_instantanea_a_mitad_de_ciclo(self):
+        """
+        TEST 5: Una flota restaurada desde una instantánea a mitad de ciclo
+        continúa exactamente igual que la original.
+        """
+        for idx, opciones in enumerate(self.opciones):
+            self.flota.hacer_lavado(idx, *opciones)
+        self.flota.avanzar_todas()
+        self.flota.avanzar_todas()
+
+        restaurada = FlotaLavaderos.restaurar(self.flota.instantanea())
+        self.assertEqual(restaurada.ingresos_centimos, self.flota.ingresos_centimos)
+        while self.flota.ocupados:
+            self.assertEqual(restaurada.avanzar_todas(), self.flota.avanzar_todas())
+            self.assertEqual([t.fase for t in restaurada], [t.fase for t in self.flota])
+
+        with self.assertRaises(ValueError):
+            FlotaLavaderos.restaurar(b"XXXX" + self.flota.instantanea()[4:])
+
+        # Estados que el ciclo no puede alcanzar: ocupado con opciones 4 o libre en otra fase
+        for array_estado, valor in (("_opciones", 4), ("_fases", Lavadero.FASE_ENJABONANDO)):
+            flota = FlotaLavaderos.restaurar(self.flota.instantanea())
+            flota.terminar(0)
+            if array_estado == "_opciones":
+                flota.hacer_lavado(0, False, False, False)
+            getattr(flota, array_estado)[0] = valor
+            with self.assertRaises(ValueError):
+                FlotaLavaderos.restaurar(flota.instantanea())
+
+        # La configuración no viaja en la instantánea: se pasa a restaurar
+        configuracion = compilar_configuracion({"precios_centimos": {"base": 650}})
+        self.flota.aplicar_configuracion(configuracion)
+        self.flota.hacer_lavado(0, False, False, False)
+        self.assertIsNone(FlotaLavaderos.restaurar(self.flota.instantanea()).configuracion)
+        restaurada = FlotaLavaderos.restaurar(self.flota.instantanea(), configuracion)
+        self.assertIs(restaurada.configuracion, configuracion)
+        restaurada.avanzar_todas()
+        restaurada.hacer_lavado(1, False, False, False)
+        self.assertEqual(restaurada.ingresos_centimos, self.flota.ingresos_centimos + 650)
+
+
+    def test06_tiempo_restante_de_toda_la_flota(self):
+        """
+        TEST 6: pasos_restantes y tiempo_restante de la flota devuelven lo mismo
+        que cada túnel por separado, también con dos configuraciones a la vez.
+        """
+        duraciones = {fase: fase + 1 for fase in range(Lavadero.FASE_ENCERADO + 1)}
+        for idx, opciones in enumerate(self.opciones):
+            self.flota.hacer_lavado(idx, *opciones)
+        self.flota.avanzar_todas()
+        # Una configuración sin secado automático: los túneles ocupados siguen con la anterior
+        self.flota.aplicar_configuracion(compilar_configuracion({"secado_automatico": False}))
+        self.flota.terminar(0)
+        self.flota.hacer_lavado(0, False, True, True)
+        self.assertEqual(len(self.flota._configuraciones), 2)
+
+        while True:
+            pasos = self.flota.pasos_restantes()
+            self.assertIsInstance(pasos, bytes)
+            self.assertEqual(list(pasos), [t.pasos_restantes() for t in self.flota])
+            self.assertEqual(self.flota.tiempo_restante(duraciones),
+                             [t.tiempo_restante(duraciones) for t in self.flota])
+            if not self.flota.ocupados:
+                break
+            esperados = [max(p - 1, 0) for p in pasos]
+            self.flota.avanzar_todas()
+            self.assertEqual(list(self.flota.pasos_restantes()), esperados)
+        self.assertEqual(self.flota[0].pasos_restantes(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,79 @@
+# test_fuzz_diferencial_unittest.py
+# Tests unitarios del banco de comparación diferencial entre implementaciones de lavadero
+
+import unittest
+
+from src.fuzz_diferencial import (CANDIDATAS, OP_AVANZAR, OP_TERMINAR, AdaptadorLavadero,
+                                  buscar_divergencias, formatear_reproductor, primera_divergencia, reducir)
+
+
+class LavaderoSinCobroPrelavado(AdaptadorLavadero):
+    """Motor con un fallo sembrado: no cobra el prelavado a mano."""
+
+    def estado(self):
+        fase, ocupado, prelavado, secado, encerado, centimos = super().estado()
+        return fase, ocupado, prelavado, secado, encerado, centimos - 150 * self.prelavados
+
+    def aplicar(self, op):
+        resultado = super().aplicar(op)
+        if resultado is None and op < OP_AVANZAR and op & 1:
+            self.prelavados += 1
+        return resultado
+
+    def __init__(self):
+        super().__init__()
+        self.prelavados = 0
+
+
+class TestFuzzDiferencial(unittest.TestCase):
+    """
+    Suite de pruebas de la comparación paso a paso y de la reducción de secuencias.
+    """
+
+    def test01_implementaciones_equivalentes(self):
+        """
+        TEST 1: Las variantes de Lavadero del repositorio no divergen de la referencia.
+        """
+        for nombre in ("compacto", "concurrente", "flota"):
+            resultado = buscar_divergencias(CANDIDATAS[nombre], secuencias=1500, longitud=30, semilla=3)
+            self.assertEqual(resultado["comprobadas"], 1500, nombre)
+            self.assertIsNone(resultado["reproductor"], nombre)
+
+    def test02_lavadero_mal_diverge(self):
+        """
+        TEST 2: lavadero_mal diverge y el reproductor mínimo es un único hacer_lavado sin opciones.
+        """
+        resultado = buscar_divergencias(CANDIDATAS["mal"], secuencias=100, semilla=1)
+        self.assertEqual(resultado["reproductor"], bytes([0]))
+        self.assertEqual(resultado["divergencia"]["referencia"][1][5], 500)
+        self.assertEqual(resultado["divergencia"]["candidata"][1][5], 0)
+        self.assertIn("hacer_lavado(False, False, False)", formatear_reproductor(
+            resultado["reproductor"], resultado["divergencia"]))
+
+    def test03_reduccion(self):
+        """
+        TEST 3: Una secuencia larga que diverge se reduce al mínimo que conserva el fallo.
+        """
+        secuencia = bytes([2, OP_AVANZAR, OP_TERMINAR, 0, OP_AVANZAR, OP_TERMINAR] * 5 + [7, OP_AVANZAR])
+        self.assertIsNotNone(primera_divergencia(AdaptadorLavadero, LavaderoSinCobroPrelavado, secuencia))
+        self.assertIsNone(primera_divergencia(AdaptadorLavadero, LavaderoSinCobroPrelavado, secuencia[:30]))
+        self.assertEqual(reducir(AdaptadorLavadero, LavaderoSinCobroPrelavado, secuencia), bytes([1]))
+
+    def test04_mismo_resultado_con_varios_procesos(self):
+        """
+        TEST 4: Con una divergencia en un bloque intermedio, uno y dos procesos se
+        detienen en el mismo bloque y devuelven lo mismo, "comprobadas" incluido.
+        """
+        # Prelavado poco probable y secuencias cortas: la primera divergencia no está en el primer bloque
+        pesos = (40, 1, 40, 1, 40, 1, 40, 1, 60, 16)
+        resultados = [buscar_divergencias(LavaderoSinCobroPrelavado, secuencias=400, longitud=3, semilla=4,
+                                          procesos=procesos, bloque=20, pesos=pesos)
+                      for procesos in (1, 2)]
+        self.assertEqual(resultados[0], resultados[1])
+        self.assertGreater(resultados[0]["comprobadas"], 20)
+        self.assertLess(resultados[0]["comprobadas"], 400)
+        self.assertEqual(resultados[0]["reproductor"], bytes([1]))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,106 @@
+# test_ingesta_unittest.py
+# Tests unitarios de la ingesta por bloques de volcados CSV y NDJSON
+
+import json
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from itertools import product
+
+from src.ingesta import MOTIVO_ENCERADO, MOTIVO_FILA_NO_VALIDA, ingerir
+from src.lavadero import Lavadero
+
+
+class TestIngesta(unittest.TestCase):
+    """
+    Suite de pruebas de la ingesta: validación, cobro y ficheros de salida.
+    """
+
+    def setUp(self):
+        self.directorio = tempfile.mkdtemp()
+        azar = random.Random(5)
+        self.pedidos = [azar.choice(list(product((False, True), repeat=3))) for _ in range(3000)]
+
+    def tearDown(self):
+        shutil.rmtree(self.directorio)
+
+    def _ruta(self, nombre):
+        return os.path.join(self.directorio, nombre)
+
+    def _esperado(self):
+        """Cobra los mismos pedidos con Lavadero, uno a uno."""
+        lavadero = Lavadero()
+        rechazados = 0
+        for opciones in self.pedidos:
+            try:
+                lavadero.ejecutar_y_obtener_fases(*opciones)
+            except ValueError:
+                rechazados += 1
+        return lavadero.ingresos_centimos, rechazados
+
+    def test01_csv_igual_que_lavadero(self):
+        """
+        TEST 1: La ingesta CSV cobra lo mismo que Lavadero y separa aceptados y rechazados.
+        """
+        with open(self._ruta("pedidos.csv"), "w", encoding="utf-8") as fichero:
+            fichero.write("id,prelavado,secado,encerado\n")
+            for i, opciones in enumerate(self.pedidos):
+                fichero.write(f"{i},{','.join(str(int(o)) for o in opciones)}\n")
+
+        # Bloques diminutos: las líneas quedan partidas entre bloques
+        resumen = ingerir(self._ruta("pedidos.csv"), self._ruta("ok.csv"), self._ruta("ko.csv"), tamano_bloque=100)
+        ingresos, rechazados = self._esperado()
+        self.assertEqual(resumen["ingresos_centimos"], ingresos)
+        self.assertEqual(resumen["rechazadas"][MOTIVO_ENCERADO], rechazados)
+        self.assertEqual(resumen["filas"], 3000)
+
+        with open(self._ruta("ok.csv"), encoding="utf-8") as fichero:
+            aceptados = fichero.read().splitlines()
+        with open(self._ruta("ko.csv"), encoding="utf-8") as fichero:
+            rechazadas = fichero.read().splitlines()
+        self.assertEqual(aceptados[0], "id,prelavado,secado,encerado,precio")
+        self.assertEqual(len(aceptados) - 1 + len(rechazadas) - 1, 3000)
+        self.assertEqual(round(sum(float(linea.rsplit(",", 1)[1]) for linea in aceptados[1:]) * 100), ingresos)
+        self.assertTrue(all(linea.endswith(MOTIVO_ENCERADO) for linea in rechazadas[1:]))
+
+    def test02_ndjson_igual_que_lavadero(self):
+        """
+        TEST 2: La ingesta NDJSON da el mismo resultado y añade el precio a cada objeto.
+        """
+        with open(self._ruta("pedidos.ndjson"), "w", encoding="utf-8") as fichero:
+            for opciones in self.pedidos:
+                fichero.write(json.dumps(dict(zip(("prelavado", "secado", "encerado"), opciones))) + "\n")
+
+        resumen = ingerir(self._ruta("pedidos.ndjson"), self._ruta("ok.ndjson"), self._ruta("ko.ndjson"))
+        ingresos, rechazados = self._esperado()
+        self.assertEqual((resumen["ingresos_centimos"], resumen["rechazadas"][MOTIVO_ENCERADO]),
+                         (ingresos, rechazados))
+        with open(self._ruta("ok.ndjson"), encoding="utf-8") as fichero:
+            objetos = [json.loads(linea) for linea in fichero]
+        self.assertEqual(round(sum(objeto["precio"] for objeto in objetos) * 100), ingresos)
+
+    def test03_filas_no_validas(self):
+        """
+        TEST 3: Las filas que no se pueden interpretar se rechazan sin detener la ingesta.
+        """
+        with open(self._ruta("pedidos.ndjson"), "w", encoding="utf-8") as fichero:
+            fichero.write('{"prelavado": true, "secado": true, "encerado": true}\n'
+                          '{"prelavado": 1, "secado": 0\n'
+                          '\n'
+                          '{"prelavado_a_mano": false, "secado_a_mano": 1, "encerado": 0}\n'
+                          '{"prelavado": "quizá", "secado": 0, "encerado": 0}\n')
+        lavadero = Lavadero()
+        resumen = ingerir(self._ruta("pedidos.ndjson"), self._ruta("ok.ndjson"), self._ruta("ko.ndjson"),
+                          lavadero=lavadero)
+        self.assertEqual(resumen["filas"], 4)
+        self.assertEqual(resumen["rechazadas"][MOTIVO_FILA_NO_VALIDA], 2)
+        self.assertEqual(lavadero.ingresos_centimos, 870 + 600)
+        with open(self._ruta("ko.ndjson"), encoding="utf-8") as fichero:
+            motivos = [json.loads(linea)["motivo"] for linea in fichero]
+        self.assertEqual(motivos, [MOTIVO_FILA_NO_VALIDA] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,95 @@
+# test_instrumentacion_unittest.py
+# Tests unitarios de la instrumentación (contadores e histogramas) de Lavadero
+
+import os
+import tempfile
+import unittest
+
+from src.instrumentacion import HistogramaLatencias, Instrumentacion
+from src.lavadero import Lavadero
+
+
+class TestInstrumentacion(unittest.TestCase):
+    """
+    Suite de pruebas de contadores por fase, rechazos, latencias y exportación.
+    """
+
+    def setUp(self):
+        self.metricas = Instrumentacion()
+        self.lavadero = self.metricas.instrumentar(Lavadero())
+
+    def test01_entradas_por_fase(self):
+        """
+        TEST 1: Se cuentan las fases visitadas, avanzando paso a paso o con el ciclo completo.
+        """
+        self.lavadero.hacer_lavado(True, True, True)
+        while self.lavadero.ocupado:
+            self.lavadero.avanzarFase()
+        self.lavadero.avanzarFase()                                 # Inactivo: no entra en ninguna fase
+        self.lavadero.ejecutar_y_obtener_fases(False, False, False)
+
+        esperado = [0] * 9
+        for opciones in ((True, True, True), (False, False, False)):
+            for fase in Lavadero.ruta_para(opciones)[1:]:
+                esperado[fase] += 1
+        self.assertEqual(self.metricas.entradas_fase, esperado)
+        self.assertEqual(self.lavadero.ingresos_centimos, 870 + 500)
+
+    def test02_rechazos_y_latencias(self):
+        """
+        TEST 2: Los rechazos se cuentan por motivo y cada operación tiene su histograma.
+        """
+        self.lavadero.hacer_lavado(False, False, False)
+        with self.assertRaises(ValueError):
+            self.lavadero.hacer_lavado(False, False, False)
+        self.lavadero.terminar()
+        with self.assertRaises(ValueError):
+            self.lavadero.hacer_lavado(False, False, True)
+
+        self.assertEqual(self.metricas.rechazos, {"Lavado en curso": 1,
+                                                  "Encerado sin secado a mano no permitido": 1})
+        datos = self.metricas.como_dict()
+        self.assertEqual(datos["latencias_ns"]["hacer_lavado"]["total"], 1)
+        self.assertEqual(datos["latencias_ns"]["_cobrar"]["total"], 1)
+
+    def test03_histograma_hdr(self):
+        """
+        TEST 3: Los percentiles del histograma tienen un error relativo acotado.
+        """
+        histograma = HistogramaLatencias(bits_subbucket=5)
+        for valor in range(1, 100_001):
+            histograma.registrar(valor)
+        for p in (50, 90, 99):
+            exacto = 100_000 * p // 100
+            self.assertLessEqual(abs(histograma.percentil(p) - exacto) / exacto, 1 / 32)
+        self.assertEqual(histograma.percentil(100), 100_000)
+
+        otro = HistogramaLatencias(bits_subbucket=5)
+        otro.registrar(7)
+        histograma.fusionar(otro)
+        self.assertEqual(histograma.total, 100_001)
+
+    def test04_desinstrumentar_y_prometheus(self):
+        """
+        TEST 4: Al desinstrumentar no se mide nada más; la exportación Prometheus es coherente.
+        """
+        self.lavadero.ejecutar_y_obtener_fases(False, True, False)
+        Instrumentacion.desinstrumentar(self.lavadero)
+        self.lavadero.ejecutar_y_obtener_fases(False, True, False)
+        self.assertEqual(self.metricas.latencias["hacer_lavado"].total, 1)
+
+        descriptor, ruta = tempfile.mkstemp(suffix=".prom")
+        os.close(descriptor)
+        try:
+            self.metricas.escribir_prometheus(ruta)
+            with open(ruta, encoding="utf-8") as fichero:
+                texto = fichero.read()
+        finally:
+            os.remove(ruta)
+        self.assertIn('lavadero_entradas_fase_total{fase="7"} 1', texto)
+        self.assertIn('lavadero_latencia_segundos_bucket{operacion="hacer_lavado",le="+Inf"} 1', texto)
+        self.assertIn('lavadero_latencia_segundos_count{operacion="avanzarFase"} 0', texto)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
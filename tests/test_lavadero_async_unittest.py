@@ -0,0 +1,112 @@
+# test_lavadero_async_unittest.py
+# Tests unitarios del control asíncrono de túneles
+
+import asyncio
+import unittest
+
+from src.lavadero import Lavadero
+from src.lavadero_async import (ColaLlena, ControladorAsincrono, LavaderoAsincrono,
+                                POLITICA_RECHAZAR)
+
+
+class TestLavaderoAsincrono(unittest.IsolatedAsyncioTestCase):
+    """
+    Suite de pruebas del envoltorio asyncio.
+    Se usa escala=0 para que las fases no esperen tiempo real.
+    """
+
+    async def test01_lavar_recorre_la_ruta(self):
+        """
+        TEST 1: lavar() recorre la misma ruta y cobra lo mismo que Lavadero.
+        """
+        tunel = LavaderoAsincrono(escala=0)
+        fases = await tunel.lavar((True, True, True))
+        self.assertEqual(tuple(fases), Lavadero.ruta_para((True, True, True)))
+        self.assertEqual(tunel.lavadero.ingresos, 8.70)
+        self.assertFalse(tunel.lavadero.ocupado)
+
+    async def test02_lavados_simultaneos_esperan_turno(self):
+        """
+        TEST 2: Con la política por defecto, los lavados simultáneos no lanzan
+        "Lavado en curso": esperan y se atienden todos en orden.
+        """
+        tunel = LavaderoAsincrono(escala=0)
+        resultados = await asyncio.gather(*(tunel.lavar((False, False, False)) for _ in range(5)))
+        self.assertEqual(len(resultados), 5)
+        self.assertEqual(tunel.lavadero.ingresos_centimos, 5 * 500)
+
+    async def test03_politicas_de_rechazo(self):
+        """
+        TEST 3: POLITICA_RECHAZAR mantiene el ValueError de Lavadero y max_cola limita la espera.
+        """
+        tunel = LavaderoAsincrono(escala=0, politica=POLITICA_RECHAZAR)
+        primero = asyncio.create_task(tunel.lavar((False, False, False)))
+        await asyncio.sleep(0)
+        with self.assertRaises(ValueError):
+            await tunel.lavar((False, False, False))
+        await primero
+
+        tunel = LavaderoAsincrono(escala=0, max_cola=1)
+        tareas = [asyncio.create_task(tunel.lavar((False, False, False))) for _ in range(2)]
+        await asyncio.sleep(0)
+        with self.assertRaises(ColaLlena):
+            await tunel.lavar((False, False, False))
+        await asyncio.gather(*tareas)
+
+    async def test04_controlador_reparte_pedidos(self):
+        """
+        TEST 4: El controlador reparte los pedidos entre los túneles y cuenta los inválidos.
+        """
+        tuneles = [LavaderoAsincrono(escala=0) for _ in range(3)]
+        controlador = ControladorAsincrono(tuneles, max_pendientes=2)
+        controlador.iniciar()
+        for _ in range(10):
+            await controlador.enviar((True, False, False))
+        await controlador.enviar((False, False, True))          # Encerado sin secado
+        await controlador.cerrar()
+
+        self.assertEqual(controlador.completados, 10)
+        self.assertEqual(controlador.rechazados, 1)
+        self.assertEqual(sum(t.lavadero.ingresos_centimos for t in tuneles), 10 * 650)
+
+
+    async def test05_cancelar_a_mitad_de_ciclo(self):
+        """
+        TEST 5: Cancelar un lavar() a mitad de ciclo deja el túnel libre y el
+        siguiente lavado, también el que ya esperaba turno, se completa.
+        """
+        tunel = LavaderoAsincrono(escala=0)
+        primero = asyncio.create_task(tunel.lavar((True, True, True)))
+        for _ in range(3):
+            await asyncio.sleep(0)
+        self.assertTrue(tunel.lavadero.ocupado)
+        segundo = asyncio.create_task(tunel.lavar((False, False, False)))
+        await asyncio.sleep(0)
+
+        primero.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await primero
+        self.assertEqual(tuple(await segundo), Lavadero.ruta_para((False, False, False)))
+        self.assertEqual(tuple(await tunel.lavar((False, True, False))), Lavadero.ruta_para((False, True, False)))
+        self.assertFalse(tunel.lavadero.ocupado)
+        self.assertEqual(tunel.lavadero.ingresos_centimos, 870 + 500 + 600)
+
+    async def test06_pedido_mal_formado_no_detiene_el_tunel(self):
+        """
+        TEST 6: Un pedido que lanza otra excepción se cuenta como fallido, el túnel
+        sigue atendiendo los siguientes y cerrar() termina.
+        """
+        tunel = LavaderoAsincrono(escala=0)
+        controlador = ControladorAsincrono([tunel])
+        controlador.iniciar()
+        await controlador.enviar((True,))                        # TypeError en hacer_lavado
+        await controlador.enviar((False, False, False))
+        await asyncio.wait_for(controlador.cerrar(), timeout=5)
+
+        self.assertEqual((controlador.completados, controlador.rechazados, controlador.fallidos), (1, 0, 1))
+        self.assertEqual(tunel.lavadero.ingresos_centimos, 500)
+        self.assertFalse(tunel.lavadero.ocupado)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,67 @@
+# test_lavadero_compacto_unittest.py
+# Tests unitarios de LavaderoCompacto: mismo comportamiento que Lavadero con menos memoria
+
+import unittest
+
+from src.lavadero import Lavadero
+from src.lavadero_compacto import LavaderoCompacto
+
+
+class TestLavaderoCompacto(unittest.TestCase):
+    """
+    Suite de pruebas de la variante compacta.
+    Se compara siempre contra Lavadero, que es la implementación de referencia.
+    """
+
+    def setUp(self):
+        self.lavadero = LavaderoCompacto()
+
+    def test01_sin_dict_por_instancia(self):
+        """
+        TEST 1: La variante compacta no tiene __dict__ ni admite atributos nuevos.
+        """
+        self.assertFalse(hasattr(self.lavadero, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.lavadero.otro_atributo = 1
+
+    def test02_mismas_rutas_e_ingresos(self):
+        """
+        TEST 2: Para cada combinación válida recorre las mismas fases, con el mismo
+        tiempo restante, y cobra lo mismo.
+        """
+        referencia = Lavadero()
+        for opciones in Lavadero.RUTAS:
+            self.lavadero.hacer_lavado(*opciones)
+            referencia.hacer_lavado(*opciones)
+            self.assertEqual(
+                (self.lavadero.prelavado_a_mano, self.lavadero.secado_a_mano, self.lavadero.encerado),
+                opciones)
+            while referencia.ocupado:
+                referencia.avanzarFase()
+                self.lavadero.avanzarFase()
+                self.assertEqual(self.lavadero.fase, referencia.fase)
+                self.assertEqual(self.lavadero.ocupado, referencia.ocupado)
+                self.assertEqual(self.lavadero.pasos_restantes(), referencia.pasos_restantes())
+                self.assertEqual(self.lavadero.tiempo_restante({Lavadero.FASE_SECADO_AUTOMATICO: 7}),
+                                 referencia.tiempo_restante({Lavadero.FASE_SECADO_AUTOMATICO: 7}))
+
+        self.assertEqual(self.lavadero.ingresos_centimos, referencia.ingresos_centimos)
+        self.assertEqual(self.lavadero.ingresos, referencia.ingresos)
+
+    def test03_mismas_validaciones(self):
+        """
+        TEST 3: Lanza las mismas excepciones que Lavadero.
+        """
+        with self.assertRaises(ValueError) as context:
+            self.lavadero.hacer_lavado(True, False, True)
+        self.assertEqual(str(context.exception), "Encerado sin secado a mano no permitido")
+
+        self.lavadero.hacer_lavado(True, False, False)
+        with self.assertRaises(ValueError) as context:
+            self.lavadero.hacer_lavado(True, False, False)
+        self.assertEqual(str(context.exception), "Lavado en curso")
+        self.assertEqual(self.lavadero.ingresos, 6.50)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,155 @@
+# test_lavadero_concurrente_unittest.py
+# Test de estrés de LavaderoConcurrente con 32 hilos a la vez
+
+import gc
+import sys
+import threading
+import time
+import unittest
+
+from src.lavadero import Lavadero
+from src.lavadero_concurrente import LavaderoConcurrente
+
+HILOS = 32
+INTENTOS_POR_HILO = 2_000
+
+
+def con_ventana_de_carrera(clase):
+    """
+    Subclase que cede el turno entre comprobar "Lavado en curso" y marcar el
+    túnel como ocupado (hacer_lavado lee ocupado antes de llamar a
+    validar_lavado). Sin esto, con el GIL la carrera casi nunca se produce.
+    """
+    class ConVentana(clase):
+        @staticmethod
+        def validar_lavado(ocupado, secado_a_mano, encerado):
+            clase.validar_lavado(ocupado, secado_a_mano, encerado)
+            time.sleep(0)
+
+    return ConVentana
+
+
+class TestLavaderoConcurrente(unittest.TestCase):
+    """
+    Suite de pruebas de la variante segura entre hilos.
+    """
+
+    def setUp(self):
+        # Cambios de hilo muy frecuentes para provocar las carreras
+        self.intervalo = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.intervalo)
+
+    def test01_mismo_comportamiento_que_lavadero(self):
+        """
+        TEST 1: En un solo hilo se comporta exactamente como Lavadero.
+        """
+        lavadero = LavaderoConcurrente()
+        for opciones, ruta in Lavadero.RUTAS.items():
+            self.assertEqual(lavadero.ejecutar_y_obtener_fases(*opciones), list(ruta))
+        self.assertEqual(lavadero.ingresos_centimos, 650 + 500 + 600 + 750 + 720 + 870)
+        with self.assertRaises(ValueError):
+            lavadero.hacer_lavado(False, False, True)
+
+    def _estres(self, lavadero):
+        """
+        32 hilos intentan lavar a la vez en el mismo túnel.
+
+        Returns:
+            (solapes, aceptados): ocupaciones simultáneas vistas (debe estar vacía)
+                                  y lavados aceptados por cada hilo
+        """
+        activos = [0]
+        solapes = []
+        aceptados = []
+        cerrojo_test = threading.Lock()
+        salida = threading.Barrier(HILOS)
+
+        def trabajador():
+            propios = 0
+            salida.wait()
+            for _ in range(INTENTOS_POR_HILO):
+                try:
+                    lavadero.hacer_lavado(True, True, True)
+                except ValueError:
+                    continue
+                # El túnel es de este hilo desde que hacer_lavado acepta hasta
+                # terminar(): si otro hilo también lo ha conseguido, se verá aquí
+                with cerrojo_test:
+                    activos[0] += 1
+                    if activos[0] != 1:
+                        solapes.append(activos[0])
+                propios += 1
+                time.sleep(0)                 # Cede el turno con el túnel aún ocupado
+                with cerrojo_test:
+                    activos[0] -= 1
+                lavadero.terminar()
+            with cerrojo_test:
+                aceptados.append(propios)
+
+        hilos = [threading.Thread(target=trabajador) for _ in range(HILOS)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        return solapes, aceptados
+
+    def test02_estres_32_hilos_sin_ingresos_perdidos(self):
+        """
+        TEST 2: 32 hilos intentan lavar a la vez en el mismo túnel.
+
+        Verificaciones:
+        - Nunca hay dos lavados aceptados a la vez (reserva atómica)
+        - Los ingresos son exactamente lavados aceptados x precio
+        """
+        lavadero = con_ventana_de_carrera(LavaderoConcurrente)()
+        solapes, aceptados = self._estres(lavadero)
+        self.assertEqual(solapes, [])
+        self.assertGreater(sum(aceptados), 0)
+        self.assertEqual(lavadero.ingresos_centimos, sum(aceptados) * 870)
+
+    def test03_el_estres_detecta_el_lavadero_sin_cerrojo(self):
+        """
+        TEST 3: La misma prueba con el Lavadero normal (sin cerrojo) detecta
+        lavados aceptados a la vez: la prueba del TEST 2 puede fallar.
+        """
+        lavadero = con_ventana_de_carrera(Lavadero)()
+        solapes, aceptados = self._estres(lavadero)
+        self.assertNotEqual(solapes, [])
+
+    def test04_oyentes_ven_los_ingresos_ya_cobrados(self):
+        """
+        TEST 4: Al recibir el evento de cobro, ingresos_centimos ya incluye ese
+        lavado, igual que con Lavadero.
+        """
+        for clase in (Lavadero, LavaderoConcurrente):
+            lavadero = clase()
+            vistos = []
+            lavadero.suscribir(lambda evento: vistos.append(evento[1].ingresos_centimos)
+                               if evento[0] == "cobro" else None)
+            lavadero.hacer_lavado(False, False, False)
+            self.assertEqual(vistos, [500])
+
+    def test05_franjas_de_hilos_terminados(self):
+        """
+        TEST 5: Las franjas de los hilos que terminan se suman al total y se
+        olvidan: muchos hilos de corta vida no hacen crecer el registro.
+        """
+        lavadero = LavaderoConcurrente()
+
+        def un_lavado():
+            lavadero.ejecutar_y_obtener_fases(False, False, False)
+
+        for _ in range(200):
+            hilo = threading.Thread(target=un_lavado)
+            hilo.start()
+            hilo.join()
+        gc.collect()
+        self.assertLessEqual(len(lavadero._franjas), 1)
+        self.assertEqual(lavadero.ingresos_centimos, 200 * 500)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
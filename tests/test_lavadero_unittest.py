@@ -2,7 +2,12 @@
 # Tests unitarios para validar el funcionamiento completo de la clase Lavadero
 # Cubre todos los requisitos especificados en la tarea RA1
 
+import struct
 import unittest
+from array import array
+from decimal import Decimal
+
+from src.configuracion import compilar_configuracion
 from src.lavadero import Lavadero
 
 
@@ -368,6 +373,232 @@ class TestLavadero(unittest.TestCase):
         self.assertEqual(fases_obtenidas, fases_esperadas,
                         f"Secuencia incorrecta.\nEsperado: {fases_esperadas}\nObtenido: {fases_obtenidas}")
 
+    # ==================== TABLA DE TRANSICIONES ====================
+    def test15_tabla_transiciones_completa(self):
+        """
+        TEST 15: Verificar que la tabla de transiciones cubre todos los estados.
+
+        Debe haber una entrada por cada fase (0-8) y cada combinación de
+        opciones (8), y avanzarFase debe seguir exactamente esa tabla.
+        """
+        self.assertEqual(len(Lavadero.TRANSICIONES), 9 * 8)
+
+        # Cada paso de un ciclo real coincide con lo que indica la tabla
+        self.lavadero.hacer_lavado(True, True, True)
+        while self.lavadero.ocupado:
+            esperada = Lavadero.siguiente_fase(self.lavadero.fase, True, True, True)
+            self.lavadero.avanzarFase()
+            self.assertEqual(self.lavadero.fase, esperada)
+
+    def test16_siguiente_fase_invalida(self):
+        """
+        TEST 16: Verificar que consultar una fase inexistente lanza RuntimeError.
+        """
+        self.assertEqual(Lavadero.siguiente_fase(Lavadero.FASE_RODILLOS, False, True, False),
+                         Lavadero.FASE_SECADO_MANO)
+        with self.assertRaises(RuntimeError):
+            Lavadero.siguiente_fase(9, False, False, False)
+
+    # ==================== CATÁLOGO DE RUTAS ====================
+    def test17_ruta_para_coincide_con_simulacion(self):
+        """
+        TEST 17: Verificar que el catálogo de rutas coincide con avanzar fase a fase.
+
+        Para cada combinación válida, la ruta precalculada debe ser idéntica al
+        recorrido real de avanzarFase, y ejecutar_y_obtener_fases debe seguir
+        cobrando el lavado y dejar el lavadero libre.
+        """
+        self.assertEqual(len(Lavadero.RUTAS), 6)
+
+        for opciones, ruta in Lavadero.RUTAS.items():
+            self.assertIsInstance(ruta, tuple)
+            self.assertIs(Lavadero.ruta_para(opciones), ruta)
+
+            lavadero = Lavadero()
+            lavadero.hacer_lavado(*opciones)
+            recorrido = [lavadero.fase]
+            while lavadero.ocupado:
+                lavadero.avanzarFase()
+                recorrido.append(lavadero.fase)
+            self.assertEqual(list(ruta), recorrido)
+
+        self.lavadero.ejecutar_y_obtener_fases(True, True, True)
+        self.lavadero.ejecutar_y_obtener_fases(False, False, False)
+        self.assertAlmostEqual(self.lavadero.ingresos, 13.70)
+        self.assertFalse(self.lavadero.ocupado)
+        self.assertFalse(self.lavadero.encerado)
+
+    def test18_ruta_para_encerado_sin_secado(self):
+        """
+        TEST 18: Verificar que ruta_para aplica la regla de encerado sin secado.
+        """
+        with self.assertRaises(ValueError):
+            Lavadero.ruta_para((False, False, True))
+
+    # ==================== COBRO POR LOTES ====================
+    def test19_cobrar_lote_igual_que_hacer_lavado(self):
+        """
+        TEST 19: Verificar que cobrar_lote cobra lo mismo que hacer_lavado fila a fila.
+
+        Se prueban las seis combinaciones válidas, con listas y con arrays
+        de tipo buffer (array.array), que es lo que también ofrece NumPy.
+        """
+        opciones = list(Lavadero.RUTAS)
+        prelavado = [p for p, _, _ in opciones]
+        secado = [s for _, s, _ in opciones]
+        encerado = [e for _, _, e in opciones]
+
+        esperados = []
+        for fila in opciones:
+            lavadero = Lavadero()
+            lavadero.hacer_lavado(*fila)
+            esperados.append(lavadero.ingresos)
+
+        precios = self.lavadero.cobrar_lote(prelavado, secado, encerado)
+        self.assertEqual(list(precios), esperados)
+        self.assertAlmostEqual(self.lavadero.ingresos, sum(esperados))
+
+        precios_buffer = Lavadero().cobrar_lote(
+            array("b", prelavado), bytes(secado), array("B", encerado))
+        self.assertEqual(list(precios_buffer), esperados)
+
+    def test20_cobrar_lote_rechaza_lote_entero(self):
+        """
+        TEST 20: Verificar que una fila con encerado sin secado rechaza todo el lote.
+
+        Comportamiento esperado: ValueError indicando la fila y ingresos sin tocar.
+        """
+        with self.assertRaises(ValueError) as context:
+            self.lavadero.cobrar_lote([True, False, False], [True, True, False], [False, True, True])
+        self.assertIn("fila 2", str(context.exception))
+        self.assertEqual(self.lavadero.ingresos, 0.0)
+
+        with self.assertRaises(ValueError):
+            self.lavadero.cobrar_lote([True], [True, False], [False])
+
+    # ==================== INGRESOS EN CÉNTIMOS ====================
+    def test21_ingresos_exactos_en_centimos(self):
+        """
+        TEST 21: Verificar que los ingresos no acumulan error de redondeo.
+
+        Tras 10.000 lavados completos (8,70€) los ingresos deben ser
+        exactamente 87.000,00€, tanto en céntimos como en Decimal y en float.
+        """
+        for _ in range(10_000):
+            self.lavadero.hacer_lavado(True, True, True)
+            self.lavadero.terminar()
+
+        self.assertEqual(self.lavadero.ingresos_centimos, 8_700_000)
+        self.assertEqual(self.lavadero.ingresos_decimal, Decimal("87000.00"))
+        self.assertEqual(self.lavadero.ingresos, 87000.0)
+
+    def test22_cobrar_lote_en_centimos(self):
+        """
+        TEST 22: Verificar que el cobro por lotes suma los mismos céntimos que hacer_lavado.
+        """
+        self.lavadero.cobrar_lote([True, False], [True, True], [True, True])
+        self.lavadero.hacer_lavado(False, False, False)
+        self.assertEqual(self.lavadero.ingresos_centimos, 870 + 720 + 500)
+        self.assertEqual(str(self.lavadero.ingresos_decimal), "20.90")
+
+    # ==================== INSTANTÁNEAS ====================
+    def test23_restaurar_a_mitad_de_ciclo(self):
+        """
+        TEST 23: Un lavadero restaurado a mitad de ciclo continúa la misma ruta.
+
+        Se guarda una instantánea tras dos avances y se comprueba que el
+        lavadero restaurado recorre las mismas fases y conserva los ingresos.
+        """
+        self.lavadero.ejecutar_y_obtener_fases(False, False, False)
+        self.lavadero.hacer_lavado(True, True, True)
+        self.lavadero.avanzarFase()
+        self.lavadero.avanzarFase()
+
+        restaurado = Lavadero.restaurar(self.lavadero.instantanea())
+        self.assertEqual(restaurado.ingresos_centimos, 500 + 870)
+        self.assertTrue(restaurado.ocupado)
+        self.assertTrue(restaurado.encerado)
+        while self.lavadero.ocupado:
+            self.lavadero.avanzarFase()
+            restaurado.avanzarFase()
+            self.assertEqual(restaurado.fase, self.lavadero.fase)
+        self.assertFalse(restaurado.ocupado)
+
+    def test24_restaurar_instantanea_no_valida(self):
+        """
+        TEST 24: Instantáneas corruptas o de otra versión se rechazan con ValueError.
+        """
+        datos = bytearray(self.lavadero.instantanea())
+        with self.assertRaises(ValueError):
+            Lavadero.restaurar(bytes(datos[:-1]))
+        datos[4] = 99                                   # Versión desconocida
+        with self.assertRaises(ValueError):
+            Lavadero.restaurar(bytes(datos))
+
+
+    # ==================== TIEMPO RESTANTE ====================
+    def test25_tiempo_restante_igual_que_simular(self):
+        """
+        TEST 25: pasos_restantes y tiempo_restante coinciden, en cada fase de
+        cada ruta, con clonar el lavadero y avanzar hasta que queda libre.
+        """
+        duraciones = {fase: 10 * fase + 1 for fase in range(Lavadero.FASE_ENCERADO + 1)}
+        self.assertEqual(self.lavadero.pasos_restantes(), 0)
+        self.assertEqual(self.lavadero.tiempo_restante(duraciones), 0)
+        for opciones in Lavadero.RUTAS:
+            self.lavadero.hacer_lavado(*opciones)
+            while self.lavadero.ocupado:
+                clon = Lavadero.restaurar(self.lavadero.instantanea())
+                pasos = tiempo = 0
+                while clon.ocupado:
+                    tiempo += duraciones[clon.fase]
+                    clon.avanzarFase()
+                    pasos += 1
+                self.assertEqual(self.lavadero.pasos_restantes(), pasos)
+                self.assertEqual(self.lavadero.tiempo_restante(duraciones), tiempo)
+                self.lavadero.avanzarFase()
+
+        # Nada se guarda entre llamadas: cambiar el dict de duraciones cambia el resultado
+        self.lavadero.hacer_lavado(False, False, False)
+        antes = self.lavadero.tiempo_restante(duraciones)
+        duraciones[Lavadero.FASE_COBRANDO] += 100
+        self.assertEqual(self.lavadero.tiempo_restante(duraciones), antes + 100)
+
+    def test26_restaurar_estados_inalcanzables_y_configuracion(self):
+        """
+        TEST 26: Se rechazan estados que el ciclo no puede alcanzar (ocupado con
+        opciones 4 o 5, o libre fuera de la fase inactiva). La configuración no
+        viaja en la instantánea: hay que pasarla a restaurar para seguir con ella.
+        """
+        estructura = struct.Struct("<4sBBBq")
+        for fase, estado in ((Lavadero.FASE_COBRANDO, 0x08 | 4), (Lavadero.FASE_COBRANDO, 0x08 | 5),
+                             (Lavadero.FASE_ENJABONANDO, 0x00), (Lavadero.FASE_INACTIVO, 0x03),
+                             (Lavadero.FASE_ENCERADO, 0x08 | 3)):
+            with self.assertRaises(ValueError):
+                Lavadero.restaurar(estructura.pack(b"LAVS", 1, fase, estado, 0))
+
+        configuracion = compilar_configuracion({"precios_centimos": {"base": 650}, "secado_automatico": False})
+        self.lavadero.aplicar_configuracion(configuracion)
+        self.lavadero.hacer_lavado(False, False, False)
+        self.lavadero.avanzarFase()
+        datos = self.lavadero.instantanea()
+
+        estandar = Lavadero.restaurar(datos)
+        self.assertIsNone(estandar.configuracion)
+        configurado = Lavadero.restaurar(datos, configuracion=configuracion)
+        self.assertIs(configurado.configuracion, configuracion)
+        while self.lavadero.ocupado:
+            self.lavadero.avanzarFase()
+            configurado.avanzarFase()
+            self.assertEqual(configurado.fase, self.lavadero.fase)
+        configurado.hacer_lavado(False, False, False)
+        self.assertEqual(configurado.ingresos_centimos, 2 * 650)
+
+        # ruta_para es siempre la estándar; ruta_configurada, la de la configuración del túnel
+        self.assertEqual(configurado.ruta_para((False, False, False)), Lavadero.ruta_para((False, False, False)))
+        self.assertNotIn(Lavadero.FASE_SECADO_AUTOMATICO, configurado.ruta_configurada((False, False, False)))
+        self.assertEqual(estandar.ruta_configurada((False, True, True)), Lavadero.ruta_para((False, True, True)))
+
 
 # ===================== EJECUCIÓN DE TESTS =====================
 if __name__ == '__main__':
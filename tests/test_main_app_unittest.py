@@ -0,0 +1,77 @@
+# test_main_app_unittest.py
+# Tests unitarios de la simulación silenciosa y de alto volumen de main_app
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from src.lavadero import Lavadero
+from src.main_app import (codigos_aleatorios, codigos_de_fichero, ejecutarSimulacion, main,
+                          simular_vehiculos)
+
+
+class TestMainApp(unittest.TestCase):
+    """
+    Suite de pruebas de ejecutarSimulacion silenciosa y de la línea de comandos.
+    """
+
+    def test01_silencioso_equivale_al_detallado(self):
+        """
+        TEST 1: En modo silencioso no se imprime nada y el resultado es el mismo.
+        """
+        detallado, silencioso = Lavadero(), Lavadero()
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            fases = ejecutarSimulacion(detallado, True, True, False)
+            rechazo = ejecutarSimulacion(detallado, False, False, True)
+        self.assertIn("AVANZANDO FASE POR FASE", salida.getvalue())
+
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            self.assertEqual(ejecutarSimulacion(silencioso, True, True, False, silencioso=True), fases)
+            self.assertIsNone(ejecutarSimulacion(silencioso, False, False, True, silencioso=True))
+        self.assertEqual(salida.getvalue(), "")
+        self.assertIsNone(rechazo)
+        self.assertEqual(silencioso.ingresos_centimos, detallado.ingresos_centimos)
+
+    def test02_resumen_agregado(self):
+        """
+        TEST 2: Los modos silencioso y resumen agregan lo mismo; las visitas salen de las rutas.
+        """
+        codigos = list(codigos_aleatorios(5000, 0.3, 0.5, 0.3, semilla=7))
+        self.assertEqual(codigos, list(codigos_aleatorios(5000, 0.3, 0.5, 0.3, semilla=7)))
+
+        resumen = simular_vehiculos(Lavadero(), codigos, "resumen")
+        lineas = io.StringIO()
+        silencioso = simular_vehiculos(Lavadero(), codigos, "silencioso", salida=lineas)
+        self.assertEqual(len(lineas.getvalue().splitlines()), 5000)
+        for clave in ("aceptados_por_codigo", "rechazados_por_codigo", "ingresos_centimos", "visitas_por_fase"):
+            self.assertEqual(resumen[clave], silencioso[clave])
+
+        self.assertEqual(resumen["rechazados"], codigos.count(4) + codigos.count(5))
+        self.assertEqual(resumen["ingresos_centimos"],
+                         sum(Lavadero._PRECIOS_CENTIMOS[c] for c in codigos if c not in (4, 5)))
+        self.assertEqual(resumen["visitas_por_fase"][Lavadero.FASE_COBRANDO], resumen["aceptados"])
+
+    def test03_fichero_de_entrada_y_cli(self):
+        """
+        TEST 3: Se leen vehículos de un fichero y la línea de comandos imprime el informe.
+        """
+        descriptor, ruta = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(descriptor, "w", encoding="utf-8") as fichero:
+            fichero.write("# prelavado,secado,encerado\n1,1,1\n0,0,1\n\ntrue, false, no\n")
+        try:
+            self.assertEqual(list(codigos_de_fichero(ruta)), [7, 4, 1])
+            salida = io.StringIO()
+            with redirect_stdout(salida):
+                main(["--entrada", ruta, "--resumen"])
+        finally:
+            os.remove(ruta)
+        self.assertIn("Rechazados:  1", salida.getvalue())
+        self.assertIn("Ingresos:    15.20 €", salida.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,39 @@
+# test_montecarlo_unittest.py
+# Tests unitarios del ejecutor Monte Carlo de escenarios
+
+import unittest
+
+from src.montecarlo import ejecutar_escenarios, generar_escenarios, resumir
+
+
+class TestMontecarlo(unittest.TestCase):
+    """
+    Suite de pruebas del reparto de escenarios entre procesos.
+    """
+
+    def setUp(self):
+        self.escenarios = generar_escenarios(6, semilla=42, tuneles=(1, 3), horas=4)
+
+    def test01_resultados_independientes_de_los_procesos(self):
+        """
+        TEST 1: Los resultados son idénticos en un proceso o repartidos en varios.
+        """
+        secuencial = ejecutar_escenarios(self.escenarios, procesos=1, semilla=9)
+        paralelo = ejecutar_escenarios(self.escenarios, procesos=2, semilla=9, bloque=1)
+        self.assertEqual(secuencial, paralelo)
+        self.assertEqual([r["indice"] for r in paralelo], list(range(6)))
+
+    def test02_resumen_agregado(self):
+        """
+        TEST 2: El resumen suma ingresos, atendidos e histogramas de todos los escenarios.
+        """
+        resultados = ejecutar_escenarios(self.escenarios, procesos=1)
+        resumen = resumir(resultados)
+        self.assertEqual(resumen["escenarios"], 6)
+        self.assertEqual(resumen["ingresos_centimos"], sum(r["ingresos_centimos"] for r in resultados))
+        self.assertEqual(resumen["visitas_por_fase"][1], resumen["atendidos"])
+        self.assertIn(resumen["mejor_ingresos"], range(6))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
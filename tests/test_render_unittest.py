@@ -0,0 +1,100 @@
+# test_render_unittest.py
+# Tests unitarios de la representación en texto del estado de lavaderos y flotas
+
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from src.flota import FlotaLavaderos
+from src.lavadero import Lavadero
+from src.render import (RenderFlota, RenderIncremental, estado_de, etiqueta_fase, render_cambios,
+                        render_estado)
+
+
+class TestRender(unittest.TestCase):
+    """
+    Suite de pruebas del módulo render.
+    """
+
+    def test01_mismo_texto_que_imprimir_estado(self):
+        """
+        TEST 1: render_estado devuelve exactamente el resumen que imprimían los siete print de antes.
+        """
+        lavadero = Lavadero()
+        lavadero.ejecutar_y_obtener_fases(False, False, False)
+        lavadero.hacer_lavado(True, True, True)
+        lavadero.avanzarFase()
+        lavadero.avanzarFase()
+        esperado = (
+            "----------------------------------------\n"
+            "Ingresos Acumulados: 13.70 €\n"
+            "Ocupado: True\n"
+            "Prelavado a mano: True\n"
+            "Secado a mano: True\n"
+            "Encerado: True\n"
+            "Fase: 2 - Haciendo prelavado a mano\n"
+            "----------------------------------------\n"
+        )
+        self.assertEqual(render_estado(lavadero), esperado)
+        self.assertEqual(render_estado(estado_de(lavadero)), esperado)
+
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            lavadero.imprimir_estado()
+            lavadero.imprimir_fase()
+        self.assertEqual(salida.getvalue(), esperado + "2 - Haciendo prelavado a mano")
+        self.assertEqual(etiqueta_fase(42), "42 - En estado no válido")
+
+    def test02_solo_cambios(self):
+        """
+        TEST 2: En modo incremental solo se emiten los campos que han cambiado.
+        """
+        lavadero = Lavadero()
+        vista = RenderIncremental(lavadero)
+        self.assertEqual(vista.render(), render_estado(lavadero))
+        self.assertEqual(vista.render(), "")
+
+        lavadero.hacer_lavado(False, True, False)
+        self.assertEqual(vista.render(), "Ingresos Acumulados: 6.00 €\nOcupado: True\nSecado a mano: True\n")
+        lavadero.avanzarFase()
+        self.assertEqual(vista.render(), "Fase: 1 - Cobrando\n")
+        self.assertEqual(render_cambios(None, estado_de(lavadero)), render_estado(lavadero))
+
+    def test03_flota_en_una_escritura(self):
+        """
+        TEST 3: La tabla de la flota tiene una línea por túnel, se escribe de una vez
+        y en modo incremental solo repite los túneles que han cambiado.
+        """
+        flota = FlotaLavaderos(5)
+        flota.hacer_lavado(1, True, False, False)
+        flota.hacer_lavado(3, False, True, True)
+        render = RenderFlota(flota)
+        self.assertEqual(len(flota.claves_estado()), len(flota))
+        self.assertEqual(list(flota.ingresos_centimos_por_tunel), [0, 650, 0, 720, 0])
+
+        salida = io.StringIO()
+        render.escribir(salida)
+        lineas = salida.getvalue().splitlines()
+        self.assertEqual(len(lineas), 1 + len(flota))
+        self.assertIn("libre", lineas[1])
+        self.assertIn("6.50 €", lineas[2])
+        self.assertIn("0 - Inactivo", lineas[2])
+        self.assertIn("secado encerado", lineas[4])
+
+        self.assertEqual(render.render(solo_cambios=True), "")
+        flota.avanzar_fase(3)
+        flota.hacer_lavado(0, False, False, False)
+        cambios = render.render(solo_cambios=True).splitlines()
+        self.assertEqual([int(linea.split("|")[0]) for linea in cambios], [0, 3])
+        self.assertIn(etiqueta_fase(flota[3].fase), cambios[1])
+
+        # Una lista de Lavadero con el mismo estado produce la misma tabla
+        lavaderos = [Lavadero() for _ in range(len(flota))]
+        for idx, opciones in ((0, (False, False, False)), (1, (True, False, False)), (3, (False, True, True))):
+            lavaderos[idx].hacer_lavado(*opciones)
+        lavaderos[3].avanzarFase()
+        self.assertEqual(RenderFlota(lavaderos).render(), render.render())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
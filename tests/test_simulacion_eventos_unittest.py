@@ -0,0 +1,99 @@
+# test_simulacion_eventos_unittest.py
+# Tests unitarios del simulador de eventos discretos
+
+import unittest
+
+from src.lavadero import Lavadero
+from src.simulacion_eventos import SimuladorEventos, duracion_ruta, DURACIONES_POR_DEFECTO
+
+
+class TestSimuladorEventos(unittest.TestCase):
+    """
+    Suite de pruebas del simulador de eventos discretos.
+    Todas las simulaciones usan semilla fija para ser reproducibles.
+    """
+
+    def test01_reproducible_con_semilla(self):
+        """
+        TEST 1: Dos simulaciones con la misma semilla dan el mismo informe.
+        """
+        a = SimuladorEventos(3, semilla=7).simular(24, 20)
+        b = SimuladorEventos(3, semilla=7).simular(24, 20)
+        self.assertEqual(a, b)
+        self.assertGreater(a["atendidos"], 0)
+
+    def test02_por_fases_igual_que_por_ciclo(self):
+        """
+        TEST 2: Avanzar fase a fase con avanzarFase da el mismo resultado que
+        programar un único evento con la duración total de la ruta.
+        """
+        por_ciclo = SimuladorEventos(2, semilla=3).simular(48, 15)
+        por_fases = SimuladorEventos(2, por_fases=True, semilla=3).simular(48, 15)
+        self.assertEqual(por_ciclo, por_fases)
+
+    def test03_ingresos_y_visitas_coherentes(self):
+        """
+        TEST 3: Los ingresos y las visitas por fase cuadran con los servicios realizados.
+        """
+        informe = SimuladorEventos(4, semilla=11).simular(24, 30)
+        servicios = informe["servicios_por_codigo"]
+        self.assertEqual(sum(servicios), informe["atendidos"])
+        self.assertEqual(informe["ingresos_centimos"],
+                         sum(n * Lavadero._PRECIOS_CENTIMOS[c] for c, n in enumerate(servicios)))
+        self.assertEqual(informe["visitas_por_fase"][Lavadero.FASE_COBRANDO], informe["atendidos"])
+        self.assertEqual(informe["visitas_por_fase"][Lavadero.FASE_ENCERADO], servicios[6] + servicios[7])
+
+    def test04_cola_con_un_tunel_saturado(self):
+        """
+        TEST 4: Con un solo túnel y más llegadas de las que puede atender se forma cola.
+
+        Un lavado sin extras dura 300 s, así que un túnel atiende 12 coches/hora.
+        """
+        self.assertEqual(duracion_ruta(Lavadero.ruta_para((False, False, False)), DURACIONES_POR_DEFECTO), 300)
+        informe = SimuladorEventos(1, semilla=5).simular(10, 30, mezcla={(False, False, False): 1})
+        self.assertLessEqual(informe["atendidos"], 10 * 12 + 1)
+        self.assertLessEqual(informe["completados"], 10 * 12)
+        self.assertGreater(informe["cola_maxima"], 10)
+        self.assertGreater(informe["espera_p90"], informe["espera_p50"])
+        self.assertGreater(informe["ocupacion_media"], 0.95)
+
+    def test05_mezcla_no_permitida(self):
+        """
+        TEST 5: Una mezcla con encerado sin secado se rechaza antes de simular.
+        """
+        with self.assertRaises(ValueError):
+            SimuladorEventos(1).simular(1, 10, mezcla={(False, False, True): 1})
+
+    def test06_tasa_de_llegadas_no_positiva(self):
+        """
+        TEST 6: Una tasa de llegadas 0 o negativa se rechaza con ValueError, no con ZeroDivisionError.
+        """
+        for tasa in (0, -5, float("nan")):
+            with self.assertRaises(ValueError):
+                SimuladorEventos(1).simular(1, tasa)
+
+    def test07_mezcla_vacia_o_con_pesos_no_positivos(self):
+        """
+        TEST 7: Una mezcla vacía o con pesos 0 o negativos se rechaza con ValueError, no con IndexError.
+        """
+        for mezcla in ({}, {(False, False, False): 0}, {(False, False, False): 1, (True, False, False): -1}):
+            with self.assertRaises(ValueError):
+                SimuladorEventos(1).simular(1, 10, mezcla=mezcla)
+
+    def test08_rendimiento_cuenta_solo_ciclos_completados(self):
+        """
+        TEST 8: El rendimiento por hora sale de los lavados terminados dentro del
+        horizonte, no de los empezados: el último ciclo cortado no cuenta.
+
+        Un lavado sin extras dura 300 s: en 1000 s un túnel saturado empieza 4 y termina 3.
+        """
+        informe = SimuladorEventos(1, semilla=5).simular(1000 / 3600, 3600, mezcla={(False, False, False): 1})
+        self.assertEqual((informe["atendidos"], informe["completados"]), (4, 3))
+        self.assertAlmostEqual(informe["rendimiento_por_hora"], 3 / (1000 / 3600))
+        por_fases = SimuladorEventos(1, por_fases=True, semilla=5).simular(1000 / 3600, 3600,
+                                                                          mezcla={(False, False, False): 1})
+        self.assertEqual(por_fases["completados"], 3)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,113 @@
+# test_simulacion_lote_unittest.py
+# Tests unitarios de la simulación por lotes: debe dar lo mismo que un Lavadero coche a coche
+
+import random
+import unittest
+from array import array
+
+from src.configuracion import compilar_configuracion
+from src.lavadero import Lavadero
+from src.main_app import OPCIONES_POR_CODIGO, simular_vehiculos
+from src.simulacion_eventos import SimuladorEventos
+from src.simulacion_lote import simular_lote
+
+
+def simular_coche_a_coche(prelavado, secado, encerado, configuracion=None):
+    """Referencia: un Lavadero y ejecutar_y_obtener_fases para cada vehículo."""
+    lavadero = Lavadero()
+    if configuracion is not None:
+        lavadero.aplicar_configuracion(configuracion)
+    longitudes, rechazadas, visitas = [], [], [0] * (Lavadero.FASE_ENCERADO + 1)
+    for fila, opciones in enumerate(zip(prelavado, secado, encerado)):
+        try:
+            fases = lavadero.ejecutar_y_obtener_fases(*opciones)
+        except ValueError:
+            rechazadas.append(fila)
+            longitudes.append(0)
+            continue
+        longitudes.append(len(fases))
+        for fase in fases[:-1]:
+            visitas[fase] += 1
+    return longitudes, rechazadas, visitas, lavadero.ingresos_centimos
+
+
+class TestSimulacionLote(unittest.TestCase):
+    """
+    Suite de pruebas de simular_lote.
+    Se compara siempre contra Lavadero, que es la implementación de referencia.
+    """
+
+    def setUp(self):
+        azar = random.Random(7)
+        n = 3_000
+        self.prelavado = [azar.random() < 0.3 for _ in range(n)]
+        self.secado = [azar.random() < 0.5 for _ in range(n)]
+        self.encerado = [azar.random() < 0.4 for _ in range(n)]
+
+    def test01_igual_que_lavadero(self):
+        """
+        TEST 1: Longitudes, visitas por fase, ingresos y filas rechazadas coinciden con Lavadero.
+        """
+        longitudes, rechazadas, visitas, ingresos = simular_coche_a_coche(
+            self.prelavado, self.secado, self.encerado)
+        resultado = simular_lote(self.prelavado, self.secado, self.encerado)
+
+        self.assertEqual(list(resultado["longitudes"]), longitudes)
+        self.assertEqual(list(resultado["filas_rechazadas"]), rechazadas)
+        self.assertEqual(resultado["visitas_por_fase"], visitas)
+        self.assertEqual(resultado["ingresos_centimos"], ingresos)
+        self.assertEqual(resultado["rechazados"], len(rechazadas))
+        self.assertEqual(resultado["lavados"] + resultado["rechazados"], resultado["vehiculos"])
+        self.assertEqual(sum(resultado["conteos"]), len(self.prelavado))
+
+    def test02_configuracion_y_buffers(self):
+        """
+        TEST 2: Con otra configuración y con arrays de bytes (valores distintos de 0 y 1
+        cuentan como True) se obtiene lo mismo que con Lavadero.
+        """
+        configuracion = compilar_configuracion({"precios_centimos": {"base": 650}, "secado_automatico": False})
+        prelavado = bytes(2 * v for v in self.prelavado)
+        secado = array("b", self.secado)
+        encerado = bytes(self.encerado)
+        longitudes, rechazadas, visitas, ingresos = simular_coche_a_coche(
+            self.prelavado, self.secado, self.encerado, configuracion)
+        resultado = simular_lote(prelavado, secado, encerado, configuracion)
+
+        self.assertEqual(list(resultado["longitudes"]), longitudes)
+        self.assertEqual(list(resultado["filas_rechazadas"]), rechazadas)
+        self.assertEqual(resultado["visitas_por_fase"], visitas)
+        self.assertEqual(resultado["ingresos_centimos"], ingresos)
+
+        solo_totales = simular_lote(prelavado, secado, encerado, configuracion, por_vehiculo=False)
+        self.assertIsNone(solo_totales["longitudes"])
+        self.assertEqual(solo_totales["visitas_por_fase"], visitas)
+
+    def test03_lotes_vacios_y_no_validos(self):
+        """
+        TEST 3: Un lote vacío no cobra nada; arrays de distinta longitud lanzan ValueError.
+        """
+        resultado = simular_lote([], [], [])
+        self.assertEqual((resultado["vehiculos"], resultado["ingresos_centimos"]), (0, 0))
+        self.assertEqual(resultado["longitudes"], b"")
+        with self.assertRaises(ValueError):
+            simular_lote([True], [True, False], [False])
+
+    def test04_mismas_visitas_que_main_app_y_eventos(self):
+        """
+        TEST 4: simular_lote, main_app.simular_vehiculos y SimuladorEventos usan el
+        mismo convenio de visitas por fase (INACTIVO una vez por ciclo).
+        """
+        informe = SimuladorEventos(3, semilla=1).simular(8, 30)
+        codigos = [codigo for codigo, servicios in enumerate(informe["servicios_por_codigo"])
+                   for _ in range(servicios)]
+        prelavado, secado, encerado = zip(*(OPCIONES_POR_CODIGO[codigo] for codigo in codigos))
+
+        lote = simular_lote(prelavado, secado, encerado)
+        resumen = simular_vehiculos(Lavadero(), codigos, "resumen")
+        self.assertEqual(lote["visitas_por_fase"], informe["visitas_por_fase"])
+        self.assertEqual(resumen["visitas_por_fase"], informe["visitas_por_fase"])
+        self.assertEqual(lote["visitas_por_fase"][Lavadero.FASE_INACTIVO], len(codigos))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,95 @@
+# test_suite_benchmarks_unittest.py
+# Tests unitarios de la comparación de resultados de benchmarks/suite.py con documentos JSON sintéticos
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from benchmarks.suite import VERSION_RESULTADOS, comparar, main
+
+
+def documento(**resultados):
+    """Documento de resultados mínimo: {nombre: valor} en ns/op, o (valor, unidad)."""
+    return {
+        "version": VERSION_RESULTADOS,
+        "entorno": {},
+        "resultados": {
+            nombre: {"unidad": valor[1], "valor": valor[0]} if isinstance(valor, tuple)
+            else {"unidad": "ns/op", "valor": valor}
+            for nombre, valor in resultados.items()
+        },
+    }
+
+
+class TestComparar(unittest.TestCase):
+    """
+    Suite de pruebas de comparar() y de la orden "comparar" de la línea de comandos.
+    """
+
+    def test01_mejora_y_regresion(self):
+        """
+        TEST 1: Una mejora tiene cambio negativo y no es regresión; empeorar más que
+        el umbral es regresión y empeorar menos no.
+        """
+        base = documento(avanzar_fase=100.0, cobrar=200.0, ciclo=50.0)
+        actual = documento(avanzar_fase=80.0, cobrar=230.0, ciclo=54.0)
+        filas = {fila[0]: fila[1:] for fila in comparar(base, actual, umbral=0.10)}
+
+        anterior, nuevo, cambio, es_regresion = filas["avanzar_fase"]
+        self.assertEqual((anterior, nuevo), (100.0, 80.0))
+        self.assertAlmostEqual(cambio, -0.20)
+        self.assertFalse(es_regresion)
+
+        self.assertAlmostEqual(filas["cobrar"][2], 0.15)
+        self.assertTrue(filas["cobrar"][3])
+        self.assertFalse(filas["ciclo"][3])                       # +8 %, por debajo del umbral
+        self.assertTrue(comparar(base, actual, umbral=0.05)[2][4])
+
+    def test02_benchmarks_ausentes_o_no_comparables(self):
+        """
+        TEST 2: Solo se comparan las métricas presentes en ambos documentos y con la
+        misma unidad; la línea de comandos avisa de las que faltan en los nuevos.
+        """
+        base = documento(avanzar_fase=100.0, cobrar=200.0, memoria_por_instancia=(169, "bytes"))
+        actual = documento(avanzar_fase=100.0, nuevo_benchmark=10.0, memoria_por_instancia=(169, "kB"))
+        self.assertEqual([fila[0] for fila in comparar(base, actual)], ["avanzar_fase"])
+        self.assertEqual(comparar(documento(cero=0.0), documento(cero=5.0)), [("cero", 0.0, 5.0, 0.0, False)])
+
+        with tempfile.TemporaryDirectory() as directorio:
+            rutas = []
+            for nombre, contenido in (("base.json", base), ("actual.json", actual)):
+                rutas.append(os.path.join(directorio, nombre))
+                with open(rutas[-1], "w", encoding="utf-8") as fichero:
+                    json.dump(contenido, fichero)
+            salida = io.StringIO()
+            with redirect_stdout(salida):
+                self.assertEqual(main(["comparar", *rutas]), 0)
+        self.assertIn("Sin medir en los resultados nuevos: cobrar", salida.getvalue())
+
+    def test03_codigo_de_salida_y_version(self):
+        """
+        TEST 3: "comparar" devuelve 1 si hay alguna regresión y rechaza documentos de otra versión.
+        """
+        with tempfile.TemporaryDirectory() as directorio:
+            base, actual = os.path.join(directorio, "base.json"), os.path.join(directorio, "actual.json")
+            with open(base, "w", encoding="utf-8") as fichero:
+                json.dump(documento(cobrar=200.0), fichero)
+            with open(actual, "w", encoding="utf-8") as fichero:
+                json.dump(documento(cobrar=300.0), fichero)
+            salida = io.StringIO()
+            with redirect_stdout(salida):
+                self.assertEqual(main(["comparar", base, actual]), 1)
+                self.assertEqual(main(["comparar", base, actual, "--umbral", "0.6"]), 0)
+            self.assertIn("REGRESIÓN", salida.getvalue())
+
+            with open(actual, "w", encoding="utf-8") as fichero:
+                json.dump(dict(documento(cobrar=200.0), version=VERSION_RESULTADOS + 1), fichero)
+            with self.assertRaises(SystemExit):
+                main(["comparar", base, actual])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,72 @@
+# test_tunel_segmentado_unittest.py
+# Tests unitarios del túnel segmentado (varios coches a la vez, una estación por fase)
+
+import unittest
+
+from src.lavadero import Lavadero
+from src.tunel_segmentado import TunelSegmentado, comparar_con_ocupacion_unica, ticks_ocupacion_unica
+
+
+class TestTunelSegmentado(unittest.TestCase):
+    """
+    Suite de pruebas de rutas, solapamiento de coches y comparación con Lavadero.
+    """
+
+    def test01_un_coche_sigue_la_ruta_de_lavadero(self):
+        """
+        TEST 1: Un coche solo recorre las estaciones de su ruta, una por tick, y paga lo mismo que en Lavadero.
+        """
+        for opciones, ruta in Lavadero.RUTAS.items():
+            tunel = TunelSegmentado()
+            tunel.entrar(*opciones)
+            recorrido = []
+            while tunel.en_curso:
+                recorrido.append(tunel.ocupacion().index(1))
+                tunel.tick()
+            self.assertEqual([0] + recorrido + [0], list(ruta))
+
+            lavadero = Lavadero()
+            lavadero.hacer_lavado(*opciones)
+            self.assertEqual(tunel.ingresos_centimos, lavadero.ingresos_centimos)
+            self.assertEqual(tunel.ticks, ticks_ocupacion_unica([Lavadero.codigo_opciones(*opciones)]))
+
+        with self.assertRaises(ValueError):
+            TunelSegmentado().entrar(False, False, True)
+
+    def test02_coches_solapados(self):
+        """
+        TEST 2: El siguiente coche entra en la caja en cuanto el anterior pasa al agua.
+        """
+        tunel = TunelSegmentado()
+        tunel.entrar(False, False, False)
+        tunel.entrar(False, False, False)
+        self.assertEqual(tunel.en_cola, 1)
+        self.assertFalse(tunel.libre)
+        tunel.tick()
+        self.assertEqual(tunel.ocupacion()[Lavadero.FASE_COBRANDO], 1)
+        self.assertEqual(tunel.ocupacion()[Lavadero.FASE_ECHANDO_AGUA], 1)
+        while tunel.en_curso:
+            tunel.tick()
+        self.assertEqual((tunel.ticks, tunel.terminados), (6, 2))
+
+    def test03_comparacion_con_ocupacion_unica(self):
+        """
+        TEST 3: Con duraciones reales el túnel segmentado es más rápido y ampliar el cuello de botella ayuda.
+        """
+        codigos = [0, 1, 2, 3, 6, 7] * 20
+        duraciones = {Lavadero.FASE_COBRANDO: 1, Lavadero.FASE_PRELAVADO_MANO: 4, Lavadero.FASE_ECHANDO_AGUA: 2,
+                      Lavadero.FASE_ENJABONANDO: 2, Lavadero.FASE_RODILLOS: 3, Lavadero.FASE_SECADO_AUTOMATICO: 2,
+                      Lavadero.FASE_SECADO_MANO: 6, Lavadero.FASE_ENCERADO: 5}
+        base = comparar_con_ocupacion_unica(codigos, duraciones=duraciones)
+        self.assertEqual(base["coches"], 120)
+        self.assertGreater(base["aceleracion"], 2)
+        self.assertGreater(base["bloqueos"], 0)
+
+        ampliado = comparar_con_ocupacion_unica(
+            codigos, capacidades={Lavadero.FASE_SECADO_MANO: 2, Lavadero.FASE_PRELAVADO_MANO: 2}, duraciones=duraciones)
+        self.assertLess(ampliado["ticks_segmentado"], base["ticks_segmentado"])
+        self.assertEqual(ampliado["ticks_ocupacion_unica"], base["ticks_ocupacion_unica"])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)